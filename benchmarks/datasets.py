@@ -0,0 +1,94 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Rows generated and written per step, so 10M-row files never sit in memory whole.
+WRITE_CHUNK_ROWS = 500_000
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+
+def _text(rng, rows, length, first=ord('a'), last=ord('z')):
+    # Fixed-length random strings, built as a code point matrix viewed as one unicode string per row.
+    codes = rng.integers(first, last + 1, size=(rows, length), dtype=np.uint32)
+    return np.ascontiguousarray(codes).view(f'<U{length}').ravel()
+
+def _variable_text(rng, rows, min_length, max_length, first=ord('a'), last=ord('z')):
+    text = pd.Series(_text(rng, rows, max_length, first, last))
+    lengths = rng.integers(min_length, max_length + 1, size=rows)
+    return pd.Series([value[:length] for value, length in zip(text, lengths)])
+
+def _dates(rng, rows):
+    days = rng.integers(0, 3650, size=rows)
+    return (pd.Timestamp('2015-01-01') + pd.to_timedelta(days, unit='D')).strftime('%Y-%m-%d')
+
+def _with_nulls(rng, values, ratio):
+    values = pd.Series(values, dtype=object)
+    values[rng.random(len(values)) < ratio] = None
+    return values
+
+def _narrow_numeric(rng, rows):
+    return pd.DataFrame({
+        'record_no': np.arange(rows),
+        'quantity': rng.integers(0, 1000, size=rows),
+        'price': np.round(rng.random(rows) * 10000, 2),
+        'ratio': rng.random(rows),
+        'order_date': _dates(rng, rows),
+    })
+
+def _wide_numeric(rng, rows):
+    columns = {f'int_{i}': rng.integers(-50_000, 50_000, size=rows) for i in range(25)}
+    columns.update({f'float_{i}': rng.standard_normal(rows) for i in range(25)})
+    return pd.DataFrame(columns)
+
+def _text_heavy(rng, rows):
+    columns = {'record_no': np.arange(rows)}
+    for i in range(8):
+        columns[f'text_{i}'] = _variable_text(rng, rows, 5, 60)
+    columns['category'] = rng.choice(['alpha', 'beta', 'gamma', 'delta'], size=rows)
+    return pd.DataFrame(columns)
+
+def _high_na(rng, rows):
+    columns = {}
+    for i in range(6):
+        columns[f'int_{i}'] = _with_nulls(rng, rng.integers(0, 100_000, size=rows), 0.4)
+        columns[f'float_{i}'] = _with_nulls(rng, np.round(rng.random(rows) * 100, 3), 0.4)
+        columns[f'text_{i}'] = _with_nulls(rng, _text(rng, rows, 12), 0.4)
+    columns['date'] = _with_nulls(rng, _dates(rng, rows), 0.4)
+    return pd.DataFrame(columns)
+
+def _korean_text(rng, rows):
+    return pd.DataFrame({
+        'record_no': np.arange(rows),
+        '이름': _text(rng, rows, 3, HANGUL_FIRST, HANGUL_LAST),
+        '주소': _variable_text(rng, rows, 10, 40, HANGUL_FIRST, HANGUL_LAST),
+        '메모': _with_nulls(rng, _variable_text(rng, rows, 0, 80, HANGUL_FIRST, HANGUL_LAST), 0.2),
+        '지역': rng.choice(['서울', '부산', '대구', '인천', '광주', '대전', '울산'], size=rows),
+        '금액': rng.integers(1000, 10_000_000, size=rows),
+        '가입일': _dates(rng, rows),
+    })
+
+PROFILES = {
+    'narrow_numeric': _narrow_numeric,
+    'wide_numeric': _wide_numeric,
+    'text_heavy': _text_heavy,
+    'high_na': _high_na,
+    'korean_text': _korean_text,
+}
+
+def generate(profile, rows, seed=0):
+    # Deterministic for a given (profile, rows, seed).
+    return PROFILES[profile](np.random.default_rng(seed), rows)
+
+def ensure_dataset(profile, rows, directory, seed=0):
+    # Writes benchmarks/data/<profile>_<rows>.csv once and reuses it on later runs.
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{profile}_{rows}_s{seed}.csv")
+    if os.path.exists(path):
+        return path
+    temp_path = path + '.tmp'
+    for step, start in enumerate(range(0, rows, WRITE_CHUNK_ROWS)):
+        chunk = generate(profile, min(WRITE_CHUNK_ROWS, rows - start), seed + step)
+        if 'record_no' in chunk.columns:
+            chunk['record_no'] += start
+        chunk.to_csv(temp_path, mode='w' if step == 0 else 'a', header=step == 0, index=False, encoding='utf-8')
+    os.replace(temp_path, path)
+    return path
@@ -0,0 +1,222 @@
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from contextlib import ExitStack
+import numpy as np
+import pandas as pd
+from core.config import DB_CONFIG
+from core.data_importer import DataImporter
+from core.database_manager import DatabaseManager
+from core.metrics import MetricsRecorder
+from .datasets import ensure_dataset
+
+STAGES = ('load', 'schema', 'insert', 'dedup', 'dedup_legacy', 'overwrite', 'append')
+BACKENDS = ('sqlite', 'duckdb', 'mysql')
+TABLE_NAME = 'bench_table'
+
+def _quiet(message):
+    pass
+
+class BenchmarkRunner:
+    # Times DataImporter.load_data and DatabaseManager's schema/insert/dedup stages on generated datasets.
+    # DB stages run on the chosen storage backend; the embedded ones (sqlite, duckdb) use a scratch file
+    # under `data_dir`, mysql uses the server in DB_CONFIG.
+    def __init__(self, data_dir, repeat=3, measure_memory=True, backend='sqlite', status_callback=None):
+        self.data_dir = data_dir
+        self.repeat = repeat
+        self.measure_memory = measure_memory
+        self.backend = backend
+        self.status_callback = status_callback if status_callback else print
+
+    def _db_config(self):
+        if self.backend == 'mysql':
+            return dict(DB_CONFIG, backend='mysql')
+        return {'backend': self.backend, 'database': 'benchmark', 'path': os.path.join(self.data_dir, f"benchmark.{self.backend}")}
+
+    def _manager(self, metrics):
+        return DatabaseManager(db_config=self._db_config(), status_callback=_quiet, metrics=metrics)
+
+    def _open(self):
+        # (manager, connection, cursor, exit stack) kept open from setup to the end of the timed run.
+        manager = self._manager(None)
+        stack = ExitStack()
+        conn = manager.backend.acquire(create_db=True)
+        stack.callback(manager.backend.release, conn)
+        cursor = stack.enter_context(manager.backend.cursor(conn))
+        return manager, conn, cursor, stack
+
+    def _load(self, path, metrics):
+        # Benchmarks time parsing, not the parse cache.
+        df = DataImporter(status_callback=_quiet, metrics=metrics, use_cache=False).load_data(path)
+        if df is None:
+            raise RuntimeError(f"벤치마크 데이터 로드 실패: {path}")
+        return df
+
+    def _stage_runner(self, stage, path, df, schema):
+        # Returns (setup, run): setup() builds untimed state and returns what run(state, metrics) needs.
+        def fresh_table(filled):
+            def setup():
+                state = self._open()
+                manager, conn, cursor, _ = state
+                manager._create_table_from_dataframe(cursor, df, TABLE_NAME, schema)
+                if filled:
+                    manager._insert_rows(cursor, df, TABLE_NAME)
+                manager._commit(conn)
+                return state
+            return setup
+
+        def commit_after(run):
+            def timed(state, metrics):
+                run(state, metrics)
+                self._manager(metrics)._commit(state[1])
+            return timed
+
+        if stage == 'load':
+            return (lambda: None), (lambda state, metrics: self._load(path, metrics))
+        if stage == 'schema':
+            return self._open, commit_after(lambda state, metrics: self._manager(metrics)._create_table_from_dataframe(state[2], df, TABLE_NAME, schema))
+        if stage == 'insert':
+            return fresh_table(False), commit_after(lambda state, metrics: self._manager(metrics)._insert_rows(state[2], df, TABLE_NAME))
+        if stage == 'dedup':
+            # Re-inserting an already loaded frame: every row is rejected as a stored fingerprint.
+            return fresh_table(True), commit_after(lambda state, metrics: self._manager(metrics)._insert_rows(state[2], df, TABLE_NAME))
+        if stage == 'dedup_legacy':
+            # Tables without a fingerprint column: full SELECT plus string-tuple comparison in Python.
+            return fresh_table(True), commit_after(lambda state, metrics: self._manager(metrics)._insert_rows(
+                state[2], df, TABLE_NAME, check_duplicates=True, fingerprinted=False))
+        if stage == 'overwrite':
+            return (lambda: None), (lambda state, metrics: self._call(metrics, 'overwrite_table', df, schema))
+        if stage == 'append':
+            return (lambda: self._call(None, 'overwrite_table', df, schema)), \
+                   (lambda state, metrics: self._call(metrics, 'append_new_data', df))
+        raise ValueError(f"알 수 없는 벤치마크 단계: {stage}")
+
+    def _call(self, metrics, operation, df, schema=None):
+        # End-to-end DatabaseManager operation, including connecting, the staging swap and commits.
+        args = (df, TABLE_NAME, schema) if operation == 'overwrite_table' else (df, TABLE_NAME)
+        success, message = getattr(self._manager(metrics), operation)(*args)
+        if not success:
+            raise RuntimeError(message)
+
+    def _measure(self, stage, setup, run, rows):
+        timings, cpu_times, span_totals = [], [], None
+        for _ in range(self.repeat):
+            state = setup()
+            metrics = MetricsRecorder(trace_memory=False)
+            run_id = metrics.start_run(stage)
+            with metrics.span('benchmark') as span:
+                run(state, metrics)
+            self._close(state)
+            timings.append(span.wall_seconds)
+            cpu_times.append(span.cpu_seconds)
+            records = [record for record in metrics.run_records(run_id) if record['span'] != 'benchmark']
+            span_totals = pd.DataFrame(records).groupby('span')['wall_seconds'].sum().round(6).to_dict() if records else {}
+
+        peak_memory_mb = None
+        if self.measure_memory:
+            # Separate pass: tracemalloc overhead would distort the timings above.
+            state = setup()
+            metrics = MetricsRecorder(trace_memory=True)
+            metrics.start_run(stage)
+            try:
+                with metrics.span('benchmark') as span:
+                    run(state, metrics)
+            finally:
+                # Left running, tracing would slow down every timing pass that follows.
+                tracemalloc.stop()
+            self._close(state)
+            peak_memory_mb = round(span.peak_memory_bytes / (1024 * 1024), 2)
+
+        median = statistics.median(timings)
+        return {
+            'median_seconds': round(median, 6),
+            'min_seconds': round(min(timings), 6),
+            'cpu_seconds': round(statistics.median(cpu_times), 6),
+            'rows_per_second': round(rows / median) if median else None,
+            'peak_memory_mb': peak_memory_mb,
+            'spans': span_totals,
+        }
+
+    def _close(self, state):
+        if isinstance(state, tuple):
+            state[3].close()
+
+    def run(self, profiles, sizes, stages):
+        results = []
+        for profile in profiles:
+            for rows in sizes:
+                path = ensure_dataset(profile, rows, self.data_dir)
+                importer = DataImporter(status_callback=_quiet, use_cache=False)
+                df = importer.load_data(path)
+                schema = importer.last_schema
+                for stage in stages:
+                    self.status_callback(f"[{profile} / {rows:,}행] {stage} 측정 중...")
+                    setup, run = self._stage_runner(stage, path, df, schema)
+                    result = {'profile': profile, 'rows': rows, 'stage': stage, 'backend': self.backend, 'repeat': self.repeat}
+                    try:
+                        result.update(self._measure(stage, setup, run, rows))
+                    except Exception as e:
+                        result['error'] = str(e)
+                        self.status_callback(f"  실패: {e}")
+                    else:
+                        self.status_callback(f"  중앙값 {result['median_seconds']:.3f}초, {result['rows_per_second'] or 0:,}행/초"
+                                             + (f", 최대 메모리 {result['peak_memory_mb']}MB" if result['peak_memory_mb'] is not None else ""))
+                    results.append(result)
+        return {'meta': environment_info(), 'results': results}
+
+def environment_info():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def save_results(report, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _result_key(result):
+    # Results written before the backend option existed came from the SQLite stand-in.
+    return result['profile'], result['rows'], result['stage'], result.get('backend', 'sqlite')
+
+def compare(report, baseline, threshold=0.10, min_seconds=0.01):
+    # Returns (comparison table, regressed keys). A stage regresses when its median is more than `threshold` slower
+    # than the baseline and the difference is above `min_seconds`, so sub-10ms noise is ignored.
+    baseline_index = {_result_key(r): r for r in baseline['results'] if 'median_seconds' in r}
+    rows, regressions = [], []
+    for result in report['results']:
+        key = _result_key(result)
+        before = baseline_index.get(key)
+        if before is None or 'median_seconds' not in result:
+            continue
+        ratio = result['median_seconds'] / before['median_seconds'] if before['median_seconds'] else float('inf')
+        regressed = ratio > 1 + threshold and result['median_seconds'] - before['median_seconds'] > min_seconds
+        if regressed:
+            regressions.append(key)
+        rows.append({
+            '프로필': key[0], '행 수': key[1], '단계': key[2], '백엔드': key[3],
+            '기준(초)': before['median_seconds'], '현재(초)': result['median_seconds'],
+            '배율': round(ratio, 3), '메모리 기준(MB)': before.get('peak_memory_mb'), '메모리 현재(MB)': result.get('peak_memory_mb'),
+            '판정': '회귀' if regressed else ('개선' if ratio < 1 - threshold else '유지'),
+        })
+    return pd.DataFrame(rows), regressions
@@ -0,0 +1,46 @@
+import argparse
+import sys
+import os
+
+# src 디렉토리를 Python 경로에 추가하여 core 모듈을 찾을 수 있도록 합니다.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(current_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from benchmarks.datasets import PROFILES
+from benchmarks.runner import STAGES, BACKENDS, BenchmarkRunner, compare, load_results, save_results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="파일 로드, 타입 추론, DB 적재 단계의 성능을 측정합니다.")
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=sorted(PROFILES), help="데이터셋 프로필")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000], help="행 수 (예: 10000 1000000 10000000)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="측정할 단계")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 최대 메모리 측정을 건너뜀")
+    parser.add_argument("--backend", choices=BACKENDS, default="sqlite", help="DB 단계를 실행할 백엔드 (mysql은 DB_CONFIG의 서버 사용)")
+    parser.add_argument("--data-dir", default=os.path.join(current_dir, "benchmarks", "data"), help="생성된 데이터셋 보관 위치")
+    parser.add_argument("--output", default=os.path.join(current_dir, "benchmarks", "results", "latest.json"), help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 판정할 속도 저하 비율 (기본 10%%)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    runner = BenchmarkRunner(args.data_dir, repeat=args.repeat, measure_memory=not args.no_memory, backend=args.backend)
+    report = runner.run(args.profiles, args.sizes, args.stages)
+    save_results(report, args.output)
+    print(f"\n결과 저장: {args.output}")
+
+    failed = [r for r in report['results'] if 'error' in r]
+    if args.baseline:
+        table, regressions = compare(report, load_results(args.baseline), threshold=args.threshold)
+        print("\n--- 기준 결과와 비교 ---")
+        print(table.to_string(index=False) if not table.empty else "비교할 공통 항목이 없습니다.")
+        if regressions:
+            print(f"\n성능 회귀 {len(regressions)}건: " + ", ".join(f"{p}/{n}/{s}/{b}" for p, n, s, b in regressions))
+            return 1
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import argparse
+import sys
+import os
+
+# src 디렉토리를 Python 경로에 추가하여 core 모듈을 찾을 수 있도록 합니다.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(current_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from core.batch_ingest import BatchIngestor
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CSV/Excel 파일들을 일괄로 데이터베이스에 적재합니다.")
+    parser.add_argument("inputs", nargs="+", help="파일, 디렉토리 또는 glob 패턴 (예: data/*.csv)")
+    parser.add_argument("--mode", choices=("overwrite", "append", "tail", "sheets"), default="overwrite",
+                        help="기본 적재 모드 (tail: 계속 커지는 CSV에서 지난 실행 이후 추가된 행만 적재, "
+                             "sheets: Excel의 모든 시트를 '<파일명>_<시트>' 테이블로 각각 적재)")
+    parser.add_argument("--file-mode", action="append", default=[], metavar="NAME=MODE",
+                        help="파일별 적재 모드 (예: sales.csv=append, daily.csv=tail, book.xlsx=sheets). 여러 번 지정할 수 있습니다.")
+    parser.add_argument("--delimiter", default=",", help="CSV 구분자")
+    parser.add_argument("--encoding", default="utf-8", help="CSV 인코딩")
+    parser.add_argument("--sheet", default=None, help="Excel 시트 이름 (기본: 첫 번째 시트)")
+    parser.add_argument("--parse-workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--db-workers", type=int, default=None, help="동시 DB 적재 수 (연결 풀 크기 이하)")
+    parser.add_argument("--engine", choices=("executemany", "load_data"), default=None, help="삽입 엔진")
+    parser.add_argument("--quiet", action="store_true", help="진행 로그를 출력하지 않고 요약만 출력")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    file_modes = {}
+    for item in args.file_mode:
+        name, _, mode = item.partition("=")
+        if mode not in ("overwrite", "append", "tail", "sheets"):
+            print(f"오류: 잘못된 --file-mode 값입니다: {item}")
+            return 2
+        file_modes[name] = mode
+
+    ingestor = BatchIngestor(
+        status_callback=(lambda msg: None) if args.quiet else print,
+        parse_workers=args.parse_workers,
+        db_workers=args.db_workers,
+        insert_engine=args.engine,
+        load_options={'csv_delimiter': args.delimiter, 'csv_encoding': args.encoding, 'excel_sheet_name': args.sheet},
+    )
+    files = ingestor.collect_files(args.inputs)
+    if not files:
+        print("적재할 파일을 찾지 못했습니다.")
+        return 1
+
+    print(f"{len(files)}개 파일 적재 시작 (파싱 프로세스 {ingestor.parse_workers}개, DB 작업자 {ingestor.db_workers}개)")
+    results = ingestor.run(files, default_mode=args.mode, file_modes=file_modes)
+    print("\n--- 적재 요약 ---")
+    print(ingestor.format_summary(results))
+    return 0 if all(result['success'] for result in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import queue
+import threading
+import traceback
+
+class Job:
+    # Handle passed to a job function running on the worker thread. Everything that touches widgets
+    # goes through the message queue; `cancelled` is polled by the DB layer at batch/chunk boundaries.
+    def __init__(self, name, func, messages):
+        self.name = name
+        self.func = func
+        self.cancel_event = threading.Event()
+        self._messages = messages
+
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def report(self, message):
+        self._messages.put(('status', message))
+
+    def progress(self, done, total=None):
+        # `total=None` switches the progress bar to indeterminate mode.
+        self._messages.put(('progress', done, total))
+
+    def call_in_ui(self, func, *args):
+        self._messages.put(('call', func, args))
+
+class BackgroundJobs:
+    # Runs queued jobs one at a time on a daemon worker thread. A root.after loop drains the message queue
+    # on the Tk main thread and forwards status, progress and UI calls to the given callbacks.
+    def __init__(self, root, on_status, on_progress, on_idle=None, poll_ms=100):
+        self.root = root
+        self.on_status = on_status
+        self.on_progress = on_progress
+        self.on_idle = on_idle
+        self.poll_ms = poll_ms
+        self._jobs = queue.Queue()
+        self._messages = queue.Queue()
+        self._pending = []
+        self._current = None
+        self._lock = threading.Lock()
+        threading.Thread(target=self._worker, daemon=True).start()
+        self.root.after(self.poll_ms, self._drain)
+
+    @property
+    def pending_count(self):
+        # Running job plus jobs still waiting in the queue.
+        with self._lock:
+            return len(self._pending) + (1 if self._current else 0)
+
+    def submit(self, name, func):
+        # `func(job)` runs on the worker thread.
+        job = Job(name, func, self._messages)
+        with self._lock:
+            self._pending.append(job)
+        self._jobs.put(job)
+        self._messages.put(('status', f"작업 대기열에 추가: {name} (대기 {self.pending_count}건)"))
+        return job
+
+    def cancel_current(self):
+        with self._lock:
+            job = self._current
+        if job:
+            job.cancel_event.set()
+            self.on_status(f"작업 취소 요청: {job.name} (현재 배치가 끝나면 중단됩니다)")
+
+    def cancel_all(self):
+        with self._lock:
+            jobs = list(self._pending) + ([self._current] if self._current else [])
+        for job in jobs:
+            job.cancel_event.set()
+        if jobs:
+            self.on_status(f"대기 중인 작업을 포함해 {len(jobs)}건의 작업 취소를 요청했습니다.")
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            with self._lock:
+                self._pending.remove(job)
+                self._current = job
+            try:
+                if job.cancelled():
+                    job.report(f"작업 건너뜀 (취소됨): {job.name}")
+                else:
+                    job.report(f"작업 시작: {job.name}")
+                    job.func(job)
+            except Exception as e:
+                job.report(f"CRITICAL: '{job.name}' 작업 중 예상치 못한 예외 발생: {e}\n{traceback.format_exc()}")
+            finally:
+                with self._lock:
+                    self._current = None
+                self._messages.put(('done', job))
+
+    def post_status(self, message):
+        # Thread-safe status update for code that is not running inside a job.
+        self._messages.put(('status', message))
+
+    def _drain(self):
+        try:
+            while True:
+                message = self._messages.get_nowait()
+                kind = message[0]
+                if kind == 'status':
+                    self.on_status(message[1])
+                elif kind == 'progress':
+                    self.on_progress(message[1], message[2])
+                elif kind == 'call':
+                    message[1](*message[2])
+                elif kind == 'done' and self.on_idle and not self.pending_count:
+                    self.on_idle()
+        except queue.Empty:
+            pass
+        finally:
+            # Keep polling even if a UI callback raised.
+            self.root.after(self.poll_ms, self._drain)
@@ -6,6 +6,7 @@ import sys
 import matplotlib.pyplot as plt
 import seaborn as sns
 import platform
+from functools import partial
 
 # --- 한글 폰트 설정 ---
 if platform.system() == 'Windows':
@@ -22,9 +23,289 @@ src_dir = os.path.abspath(os.path.join(current_dir, '..'))
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
-from core.config import DB_CONFIG, APP_CONFIG, STREAMLIT_CONFIG, VISUALIZATION_CONFIG
-from core.database_manager import DatabaseManager
+from core.config import DB_CONFIG, APP_CONFIG, BROWSE_CONFIG, CHART_CONFIG, STREAMLIT_CONFIG, VISUALIZATION_CONFIG
+from core.backends import BACKENDS
+from core.database_manager import DatabaseManager, FILTER_OPERATORS
 from core.data_importer import DataImporter
+from core.profile_cache import ProfileCache, dataframe_fingerprint
+from core.table_analyzer import TableAnalyzer
+from core.stream_profiler import StreamProfiler
+from core.chart_data import numeric_chart_data
+from core.edit_tracker import EditLog
+from core.metrics import MetricsRecorder
+
+@st.cache_resource
+def get_profile_cache():
+    # One size-bounded cache shared by all sessions; entries are keyed by data fingerprint, so edits never hit stale results.
+    return ProfileCache()
+
+def set_current_df(df):
+    # Every change of the session frame goes through here so the fingerprint is recomputed exactly once per change.
+    st.session_state.current_df = df
+    st.session_state.current_df_fp = dataframe_fingerprint(df) if df is not None else None
+
+def reset_edit_tracking():
+    # A freshly loaded frame has no pending edits; the new editor key also drops any stale widget delta.
+    st.session_state.edit_log = EditLog()
+    st.session_state.editor_version = st.session_state.get('editor_version', 0) + 1
+
+def select_excel_sheet(data_importer, source, key):
+    # Sidebar selector over the workbook's sheet names, which are read once per file without parsing any sheet.
+    # Returns the chosen sheet name, or None for non-Excel sources.
+    if source is None:
+        return None
+    source_name = source if isinstance(source, str) else source.name
+    if os.path.splitext(source_name)[1].lower() not in ('.xlsx', '.xls'):
+        return None
+    cache_key = (source_name, getattr(source, 'size', None))
+    if st.session_state.get(f"{key}_source") != cache_key:
+        st.session_state[f"{key}_source"] = cache_key
+        st.session_state.pop(key, None) # the previous file's sheet may not exist in this one
+        st.session_state[f"{key}_names"] = data_importer.excel_sheet_names(source) or []
+    sheet_names = st.session_state[f"{key}_names"]
+    if not sheet_names:
+        return None
+    return st.sidebar.selectbox("Excel 시트", sheet_names, key=key)
+
+def run_with_live_status(db_manager, operation, *args):
+    # Shows the latest DB status (batch progress, rows/sec) in one placeholder instead of stacking messages.
+    status_area = st.empty()
+    previous_callback = db_manager.status_callback
+    db_manager.status_callback = lambda msg: status_area.info(msg)
+    db_manager.metrics.start_run(operation.__name__)
+    try:
+        return operation(*args)
+    finally:
+        db_manager.status_callback = previous_callback
+        db_manager.metrics.export()
+
+def show_metrics_sidebar(metrics):
+    # Per-stage breakdown of the most recent runs (file load, DB operations) recorded in this session.
+    with st.sidebar.expander("⏱️ 단계별 성능 측정"):
+        if not metrics.runs:
+            st.write("아직 측정된 작업이 없습니다.")
+            return
+        runs = list(reversed(metrics.runs))
+        run_id, label, _ = st.selectbox("작업", runs, format_func=lambda run: f"{run[1]} ({run[0][:6]})")
+        st.dataframe(metrics.breakdown(run_id), width='stretch', hide_index=True)
+        st.download_button("JSONL 내보내기", metrics.to_jsonl(run_id), file_name=f"metrics_{run_id}.jsonl", mime="application/jsonl")
+
+def show_table_browser(db_manager, table_name):
+    # Pages through a DB table with keyset pagination: every page is an index seek, so paging deep into a
+    # multi-million-row table costs the same as the first page. Filters and sort orders are limited to indexed columns.
+    options = db_manager.browse_options(table_name)
+    if not options:
+        return
+    col1, col2, col3 = st.columns(3)
+    sort_column = col1.selectbox("정렬 컬럼 (인덱스)", options['sortable'], key="browse_sort")
+    descending = col2.toggle("내림차순", key="browse_descending")
+    page_size = int(col3.number_input("페이지 크기", min_value=10, max_value=5000, value=BROWSE_CONFIG['page_size'], step=50, key="browse_page_size"))
+    filters = []
+    with st.expander("필터 (인덱스 컬럼)"):
+        col1, col2, col3 = st.columns(3)
+        filter_column = col1.selectbox("컬럼", ["(없음)"] + options['filterable'], key="browse_filter_column")
+        operator = col2.selectbox("연산자", FILTER_OPERATORS, key="browse_filter_operator")
+        value = col3.text_input("값", key="browse_filter_value", disabled=operator in ('IS NULL', 'IS NOT NULL'))
+        if filter_column != "(없음)" and (value or operator in ('IS NULL', 'IS NOT NULL')):
+            filters.append((filter_column, operator, value))
+
+    # Position (key, direction, page number) restarts whenever the table, order, filter or page size changes.
+    request = (table_name, sort_column, descending, page_size, tuple(filters))
+    state = st.session_state.get('browse_state')
+    if not state or state['request'] != request:
+        state = st.session_state.browse_state = {'request': request, 'key': None, 'backward': False, 'page_no': 1}
+    page = db_manager.fetch_page(table_name, key=state['key'], backward=state['backward'], page_size=page_size,
+                                 filters=filters, sort_column=sort_column, descending=descending)
+    if page is None:
+        return
+
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
+    if col1.button("⏮ 처음", disabled=state['page_no'] == 1 and not page.has_previous):
+        state.update(key=None, backward=False, page_no=1)
+        st.rerun()
+    if col2.button("◀ 이전", disabled=not page.has_previous):
+        state.update(key=page.first_key, backward=True, page_no=max(1, state['page_no'] - 1))
+        st.rerun()
+    if col3.button("다음 ▶", disabled=not page.has_next):
+        state.update(key=page.last_key, backward=False, page_no=state['page_no'] + 1)
+        st.rerun()
+    col4.write(f"페이지 {state['page_no']:,} · {len(page.rows):,}행")
+    st.dataframe(page.rows.astype(str), width='stretch', hide_index=True)
+
+    with st.container(border=True):
+        st.subheader("💾 CSV로 내보내기")
+        st.caption("현재 필터와 정렬이 적용된 전체 행을 서버 측 커서로 나눠 읽어 파일에 기록합니다.")
+        export_path = st.text_input("저장 경로", value=os.path.join(BROWSE_CONFIG['export_directory'], f"{table_name}.csv"), key="browse_export_path")
+        if st.button("내보내기 실행", key="browse_export"):
+            # Progress lines replace each other in one placeholder instead of stacking up per chunk.
+            progress_area = st.empty()
+            exporter = DatabaseManager(db_config=db_manager.DB_CONFIG, status_callback=progress_area.info, metrics=db_manager.metrics)
+            success, message = exporter.export_table(table_name, export_path, filters=filters,
+                                                     sort_column=sort_column, descending=descending)
+            progress_area.empty()
+            if success:
+                st.success(message)
+            else:
+                st.error(message)
+
+def show_table_analysis(analyzer):
+    # Analysis of a table already in the DB: every statistic is an SQL aggregate, so table size does not matter.
+    st.header("DB 테이블 분석")
+    try:
+        tables = analyzer.list_tables()
+    except Exception as e:
+        st.error(f"테이블 목록을 가져오지 못했습니다: {e}")
+        return
+    if not tables:
+        st.info("데이터베이스에 테이블이 없습니다. 먼저 파일을 적재해 주세요.")
+        return
+    table_name = st.selectbox("분석할 테이블", tables)
+
+    try:
+        overview = analyzer.overview(table_name)
+    except Exception as e:
+        st.error(f"테이블 '{table_name}' 분석 중 오류 발생: {e}")
+        return
+    info_df = overview['info']
+    tab1, tab2, tab3 = st.tabs(["📊 테이블 요약", "📈 컬럼 상세 분석", "🗂️ 테이블 탐색"])
+
+    with tab3:
+        show_table_browser(analyzer.db_manager, table_name)
+
+    with tab1:
+        col1, col2, col3 = st.columns(3)
+        col1.metric("총 행 수", f"{overview['rows']:,} 개")
+        col2.metric("총 컬럼 수", f"{len(info_df):,} 개")
+        col3.metric("총 결측치 수", f"{int(info_df['Null Count'].sum()):,} 개")
+        with st.container(border=True):
+            st.subheader("ℹ️ 컬럼 타입 및 결측치 정보")
+            st.dataframe(info_df.astype(str), width='stretch')
+
+    with tab2:
+        selected_column = st.selectbox("분석할 컬럼을 선택하세요", info_df['Column'].tolist(), key="db_analysis_column")
+        if not selected_column:
+            return
+        na_count = int(info_df.loc[info_df['Column'] == selected_column, 'Null Count'].iloc[0])
+        show_column_details(selected_column, na_count, analyzer.is_numeric(table_name, selected_column),
+                            partial(analyzer.histogram, table_name, selected_column),
+                            partial(analyzer.box_stats, table_name, selected_column),
+                            partial(analyzer.top_values, table_name, selected_column),
+                            partial(analyzer.column_summary, table_name, selected_column))
+
+def render_png(fig):
+    # PNG bytes of a figure (None stays None), so a rerun can show the cached image without redrawing.
+    if fig is None:
+        return None
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=CHART_CONFIG['image_dpi'], bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
+def show_column_details(selected_column, na_count, numeric, histogram, box_stats, top_values, column_summary):
+    # Column charts and tables from precomputed aggregates (DB table analysis and streaming file profiles).
+    # histogram() -> (edges, counts), box_stats() -> Axes.bxp dict, top_values(limit, dropna=True) -> Series.
+    st.metric(f"'{selected_column}' 컬럼의 결측치(NA) 개수", f"{na_count:,} 개")
+
+    with st.container(border=True):
+        st.subheader("🎨 데이터 분포 시각화")
+        if numeric:
+            edges, counts = histogram()
+            box = box_stats()
+            if box is None:
+                st.write("값이 없는 컬럼입니다.")
+            else:
+                fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+                fig.suptitle(f"'{selected_column}' 컬럼 분포", fontsize=16)
+                axes[0].stairs(counts, edges, fill=True)
+                axes[0].set_title("히스토그램 (Histogram)")
+                axes[1].bxp([box], orientation='horizontal', showfliers=False)
+                axes[1].set_title("상자 그림 (Box Plot, 근사 사분위수)")
+                st.pyplot(fig)
+                plt.close(fig)
+        else:
+            top_n = VISUALIZATION_CONFIG['top_n_categories']
+            value_counts = top_values(top_n)
+            fig, ax = plt.subplots(figsize=(10, 6))
+            sns.barplot(x=value_counts.index.astype(str), y=value_counts.values, ax=ax)
+            ax.set_title(f"'{selected_column}' 값 빈도수 (상위 {top_n}개)")
+            ax.set_ylabel("빈도수")
+            plt.xticks(rotation=45, ha='right')
+            plt.tight_layout()
+            st.pyplot(fig)
+            plt.close(fig)
+
+    with st.container(border=True):
+        st.subheader("📋 데이터 요약")
+        col1, col2 = st.columns(2)
+        with col1:
+            limit = VISUALIZATION_CONFIG['unique_values_display_limit']
+            st.write(f"**값 빈도수 (상위 {limit}개)**")
+            st.dataframe(top_values(limit, dropna=False).to_frame().astype(str))
+        with col2:
+            st.write("**기술 통계 (Descriptive Statistics)**")
+            st.dataframe(column_summary().to_frame(selected_column).astype(str))
+
+def show_stream_profile(data_importer, metrics, csv_delimiter, csv_encoding):
+    # Files too large for memory: one pass over DataImporter.iter_chunks feeds a StreamProfiler, whose sketches
+    # stay the same size however long the file is. Counts of nulls and rows are exact; the rest is approximate.
+    st.header("대용량 파일 프로파일 (스트리밍)")
+    st.caption("파일 전체를 메모리에 올리지 않고 청크 단위로 한 번만 읽어 요약합니다. 결측치/행 수/평균/표준편차는 정확한 값이고, "
+               "고유 값 개수(HyperLogLog), 사분위수(분위수 스케치), 값 빈도수(Misra-Gries), 미리보기(무작위 표본)는 근사값입니다.")
+    uploaded_file = st.file_uploader("CSV 또는 Excel 파일을 선택하세요", type=["csv", "xlsx", "xls"], key="stream_profile_upload")
+    file_path = st.text_input("또는 서버의 파일 경로", value="", key="stream_profile_path")
+    source = file_path.strip() or uploaded_file
+    excel_sheet_name = select_excel_sheet(data_importer, source, "stream_profile_sheet")
+    if source is not None and st.button("프로파일 실행", type="primary"):
+        source_name = source if isinstance(source, str) else source.name
+        with st.spinner(f"'{source_name}' 파일을 청크 단위로 읽으며 요약하는 중입니다..."):
+            try:
+                metrics.start_run(f"stream_profile: {source_name}")
+                profiler = StreamProfiler(metrics=metrics)
+                profiler.consume(data_importer.iter_chunks(source, csv_delimiter=csv_delimiter, csv_encoding=csv_encoding,
+                                                           excel_sheet_name=excel_sheet_name))
+                metrics.export()
+                st.session_state.stream_profile = (source_name, profiler)
+            except Exception as e:
+                st.error(f"파일 프로파일 중 오류 발생: {e}")
+                st.session_state.stream_profile = None
+
+    if not st.session_state.get('stream_profile'):
+        return
+    source_name, profiler = st.session_state.stream_profile
+    if not profiler.rows:
+        st.info(f"'{source_name}' 파일에 데이터가 없습니다.")
+        return
+    overview = profiler.overview()
+    info_df = overview['info']
+    tab1, tab2 = st.tabs(["📊 파일 요약", "📈 컬럼 상세 분석"])
+
+    with tab1:
+        col1, col2, col3 = st.columns(3)
+        col1.metric("총 행 수", f"{overview['rows']:,} 개")
+        col2.metric("총 컬럼 수", f"{len(info_df):,} 개")
+        col3.metric("총 결측치 수", f"{int(info_df['Null Count'].sum()):,} 개")
+        with st.container(border=True):
+            st.subheader(f"🎲 무작위 표본 미리보기 ({len(profiler.sample):,}행)")
+            st.dataframe(profiler.sample, width='stretch')
+        with st.container(border=True):
+            st.subheader("📈 데이터 기술 통계 (근사)")
+            st.dataframe(profiler.describe().astype(str))
+        with st.container(border=True):
+            st.subheader("ℹ️ 데이터 타입 및 결측치 정보")
+            st.dataframe(info_df.astype(str), width='stretch')
+
+    with tab2:
+        selected_column = st.selectbox("분석할 컬럼을 선택하세요", profiler.columns, key="stream_profile_column")
+        if not selected_column:
+            return
+        if profiler.frequency_error(selected_column):
+            st.caption(f"값 빈도수는 하한값입니다 (최대 {profiler.frequency_error(selected_column):,}만큼 적게 집계될 수 있음).")
+        show_column_details(selected_column, int(info_df.loc[info_df['Column'] == selected_column, 'Null Count'].iloc[0]),
+                            profiler.is_numeric(selected_column),
+                            partial(profiler.histogram, selected_column),
+                            partial(profiler.box_stats, selected_column),
+                            partial(profiler.top_values, selected_column),
+                            partial(profiler.column_summary, selected_column))
 
 def run_streamlit_app():
     st.set_page_config(page_title=STREAMLIT_CONFIG['page_title'], layout=STREAMLIT_CONFIG['layout'])
@@ -34,26 +315,26 @@ def run_streamlit_app():
     st.sidebar.header("⚙️ 설정 및 정보")
 
     st.sidebar.subheader("데이터베이스 설정")
-    db_host = st.sidebar.text_input("DB 호스트", value=DB_CONFIG['host'])
-    db_user = st.sidebar.text_input("DB 사용자", value=DB_CONFIG['user'])
-    db_password = st.sidebar.text_input("DB 비밀번호", type="password", value=DB_CONFIG['password'])
-    db_name = st.sidebar.text_input("DB 이름", value=DB_CONFIG['database'])
-
-    updated_db_config = {
-        'host': db_host,
-        'user': db_user,
-        'password': db_password,
-        'database': db_name,
-        'charset': DB_CONFIG['charset']
-    }
-    db_manager = DatabaseManager(db_config=updated_db_config, status_callback=lambda msg: st.info(msg))
+    backend_names = list(BACKENDS)
+    db_backend = st.sidebar.selectbox("DB 종류", backend_names, index=backend_names.index(DB_CONFIG.get('backend', 'mysql')))
+    updated_db_config = dict(DB_CONFIG, backend=db_backend)
+    if db_backend == 'mysql':
+        updated_db_config['host'] = st.sidebar.text_input("DB 호스트", value=DB_CONFIG['host'])
+        updated_db_config['user'] = st.sidebar.text_input("DB 사용자", value=DB_CONFIG['user'])
+        updated_db_config['password'] = st.sidebar.text_input("DB 비밀번호", type="password", value=DB_CONFIG['password'])
+    updated_db_config['database'] = st.sidebar.text_input("DB 이름", value=DB_CONFIG['database'])
+    analysis_source = st.sidebar.radio("분석 대상", ("업로드한 파일", "대용량 파일", "DB 테이블"), horizontal=True)
+    if 'metrics' not in st.session_state:
+        st.session_state.metrics = MetricsRecorder()
+    metrics = st.session_state.metrics
+    db_manager = DatabaseManager(db_config=updated_db_config, status_callback=lambda msg: st.info(msg), metrics=metrics)
 
     st.sidebar.subheader("파일 로드 옵션")
     csv_delimiter = st.sidebar.selectbox("CSV 구분자", (",", ";", "\t"), index=0)
     csv_encoding = st.sidebar.selectbox("CSV 인코딩", ("utf-8", "euc-kr", "cp949"), index=0)
-    excel_sheet_name = st.sidebar.text_input("Excel 시트 이름 (비워두면 첫 번째 시트)", value="")
 
-    data_importer = DataImporter(status_callback=lambda msg: st.info(msg))
+    data_importer = DataImporter(status_callback=lambda msg: st.info(msg), metrics=metrics)
+    show_metrics_sidebar(metrics)
 
     st.sidebar.subheader("앱 정보")
     with st.sidebar.expander("자세히 보기"):
@@ -62,8 +343,16 @@ def run_streamlit_app():
         st.markdown(f"*{APP_CONFIG['description']}*")
     # --- Sidebar End ---
 
+    if analysis_source == "DB 테이블":
+        show_table_analysis(TableAnalyzer(db_manager, cache=get_profile_cache()))
+        return
+    if analysis_source == "대용량 파일":
+        show_stream_profile(data_importer, metrics, csv_delimiter, csv_encoding)
+        return
+
     st.header("1. 파일 업로드")
     uploaded_file = st.file_uploader("CSV 또는 Excel 파일을 선택하세요", type=["csv", "xlsx", "xls"])
+    excel_sheet_name = select_excel_sheet(data_importer, uploaded_file, "excel_sheet")
 
     # --- 데이터 로딩 및 상태 관리 로직 ---
     if 'current_df' not in st.session_state:
@@ -73,29 +362,38 @@ def run_streamlit_app():
     # Initialize session state for overwrite confirmation
     if 'confirm_overwrite_db' not in st.session_state:
         st.session_state.confirm_overwrite_db = False
+    if 'edit_log' not in st.session_state:
+        reset_edit_tracking()
 
     if uploaded_file is None and st.session_state.last_uploaded_filename is not None:
-        st.session_state.current_df = None
+        set_current_df(None)
         st.session_state.last_uploaded_filename = None
         st.session_state.confirm_overwrite_db = False # Reset confirmation
         st.rerun()
 
-    elif uploaded_file is not None and uploaded_file.name != st.session_state.last_uploaded_filename:
-        st.session_state.current_df = None
+    elif uploaded_file is not None and (uploaded_file.name != st.session_state.last_uploaded_filename
+                                        or excel_sheet_name != st.session_state.get('last_loaded_sheet')):
+        set_current_df(None)
         st.session_state.last_uploaded_filename = uploaded_file.name
+        st.session_state.last_loaded_sheet = excel_sheet_name
         st.session_state.confirm_overwrite_db = False # Reset confirmation
 
         with st.spinner(f"'{uploaded_file.name}' 파일을 로딩하고 분석하는 중입니다... 잠시만 기다려 주세요."):
             try:
                 sheet = excel_sheet_name if excel_sheet_name else 0
+                metrics.start_run(f"load_data: {uploaded_file.name}")
                 df = data_importer.load_data(
                     uploaded_file,
                     csv_delimiter=csv_delimiter,
                     csv_encoding=csv_encoding,
                     excel_sheet_name=sheet
                 )
+                metrics.export()
                 if df is not None:
-                    st.session_state.current_df = df
+                    set_current_df(df)
+                    reset_edit_tracking()
+                    st.session_state.current_schema = data_importer.last_schema
+                    st.session_state.compaction_report = data_importer.last_compaction
                     st.session_state.file_name_without_ext = os.path.splitext(uploaded_file.name)[0]
                     st.success(f"파일 로드 성공: {uploaded_file.name} (총 {len(df)} 행)")
                 else:
@@ -103,7 +401,7 @@ def run_streamlit_app():
                     st.session_state.last_uploaded_filename = None
             except Exception as e:
                 st.error(f"파일 처리 중 오류 발생: {e}")
-                st.session_state.current_df = None
+                set_current_df(None)
                 st.session_state.last_uploaded_filename = None
         st.rerun()
 
@@ -111,6 +409,13 @@ def run_streamlit_app():
     if st.session_state.current_df is not None:
         df = st.session_state.current_df
         file_name_without_ext = st.session_state.get('file_name_without_ext', '')
+        if st.session_state.get('current_df_fp') is None:
+            st.session_state.current_df_fp = dataframe_fingerprint(df)
+        profile_cache = get_profile_cache()
+        df_fp = st.session_state.current_df_fp
+
+        def profile(name, compute, column=None):
+            return profile_cache.get_or_compute(df_fp, name, compute, column)
 
         tab1, tab2, tab3 = st.tabs(["📊 데이터 탐색 및 편집", "📈 컬럼 상세 분석", "💾 데이터베이스 연동"])
 
@@ -119,30 +424,39 @@ def run_streamlit_app():
             col1, col2, col3 = st.columns(3)
             col1.metric("총 행 수", f"{df.shape[0]:,} 개")
             col2.metric("총 컬럼 수", f"{df.shape[1]:,} 개")
-            total_missing = df.isnull().sum().sum()
+            total_missing = profile("missing_total", lambda: int(df.isnull().sum().sum()))
             col3.metric("총 결측치 수", f"{total_missing:,} 개")
 
+            compaction = st.session_state.get('compaction_report')
+            if compaction:
+                # Memory of the loaded frame before and after DataImporter's compaction (category, narrowed numbers, Arrow strings).
+                with st.expander(f"💾 {compaction.summary()}"):
+                    st.dataframe(compaction.table(), width='stretch', hide_index=True)
+
             with st.container(border=True):
                 st.subheader("📝 데이터 편집 및 미리보기")
                 st.info("💡 여기에서 데이터를 직접 수정할 수 있습니다. 수정된 내용은 즉시 앱 전체에 반영됩니다.")
-                edited_df = st.data_editor(df, width='stretch', num_rows="dynamic")
-                
-                # 사용자에 의해 데이터가 수정되었는지 확인하고, 수정되었다면 상태를 업데이트한 후 즉시 새로고침합니다.
-                if not df.equals(edited_df):
-                    st.session_state.current_df = edited_df
+                editor_key = f"data_editor_{st.session_state.editor_version}"
+                st.data_editor(df, width='stretch', num_rows="dynamic", key=editor_key)
+
+                # 편집기가 넘겨주는 변경분(수정/추가/삭제된 행)만 반영하고, 새 편집기 키로 즉시 새로고침합니다.
+                editor_delta = st.session_state.get(editor_key, {})
+                if editor_delta.get('edited_rows') or editor_delta.get('added_rows') or editor_delta.get('deleted_rows'):
+                    set_current_df(st.session_state.edit_log.apply_editor_delta(df, editor_delta))
+                    st.session_state.editor_version += 1
                     st.rerun()
 
             with st.container(border=True):
                 st.subheader("📈 데이터 기술 통계")
-                st.dataframe(df.describe(include='all').astype(str))
+                st.dataframe(profile("describe", lambda: df.describe(include='all').astype(str)))
 
             with st.container(border=True):
                 st.subheader("ℹ️ 데이터 타입 및 결측치 정보")
-                info_df = pd.DataFrame({
+                info_df = profile("info", lambda: pd.DataFrame({
                     "Non-Null Count": df.notna().sum(),
                     "Dtype": df.dtypes
-                }).reset_index().rename(columns={"index": "Column"})
-                st.dataframe(info_df.astype(str), width='stretch')
+                }).reset_index().rename(columns={"index": "Column"}).astype(str))
+                st.dataframe(info_df, width='stretch')
 
         with tab2:
             st.subheader("분석할 컬럼 선택")
@@ -150,41 +464,53 @@ def run_streamlit_app():
 
             if selected_column:
                 df_column = df[selected_column]
-                na_count = df_column.isnull().sum()
+                na_count = profile("na_count", lambda: int(df_column.isnull().sum()), selected_column)
                 st.metric(f"'{selected_column}' 컬럼의 결측치(NA) 개수", f"{na_count:,} 개")
 
                 with st.container(border=True):
                     st.subheader("🎨 데이터 분포 시각화")
-                    if pd.api.types.is_numeric_dtype(df_column):
-                        fig, axes = plt.subplots(1, 2, figsize=(15, 5))
-                        fig.suptitle(f"'{selected_column}' 컬럼 분포", fontsize=16)
-                        sns.histplot(df_column.dropna(), kde=True, ax=axes[0])
-                        axes[0].set_title("히스토그램 (Histogram)")
-                        sns.boxplot(x=df_column, ax=axes[1])
-                        axes[1].set_title("상자 그림 (Box Plot)")
-                        st.pyplot(fig)
-                        plt.clf()
+                    # Figures are drawn from precomputed bins and quartiles and cached as PNG per (data, column, chart type).
+                    if pd.api.types.is_numeric_dtype(df_column) and not pd.api.types.is_bool_dtype(df_column):
+                        def draw_distribution():
+                            chart = profile("chart_data", lambda: numeric_chart_data(df_column, selected_column), selected_column)
+                            if chart['box'] is None:
+                                return None
+                            fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+                            fig.suptitle(f"'{selected_column}' 컬럼 분포", fontsize=16)
+                            axes[0].stairs(chart['counts'], chart['edges'], fill=True, alpha=0.6)
+                            if chart['kde'] is not None:
+                                axes[0].plot(*chart['kde'])
+                            axes[0].set_title("히스토그램 (Histogram)")
+                            axes[1].bxp([chart['box']], orientation='horizontal')
+                            axes[1].set_title("상자 그림 (Box Plot)")
+                            return fig
+                        image = profile("chart:distribution", lambda: render_png(draw_distribution()), selected_column)
                     else:
                         top_n = VISUALIZATION_CONFIG['top_n_categories']
-                        value_counts = df_column.value_counts().nlargest(top_n)
-                        fig, ax = plt.subplots(figsize=(10, 6))
-                        sns.barplot(x=value_counts.index.astype(str), y=value_counts.values, ax=ax)
-                        ax.set_title(f"'{selected_column}' 값 빈도수 (상위 {top_n}개)")
-                        ax.set_ylabel("빈도수")
-                        plt.xticks(rotation=45, ha='right')
-                        plt.tight_layout()
-                        st.pyplot(fig)
-                        plt.clf()
+                        def draw_top_values():
+                            value_counts = profile("top_values", lambda: df_column.value_counts().nlargest(top_n), selected_column)
+                            fig, ax = plt.subplots(figsize=(10, 6))
+                            sns.barplot(x=value_counts.index.astype(str), y=value_counts.values, ax=ax)
+                            ax.set_title(f"'{selected_column}' 값 빈도수 (상위 {top_n}개)")
+                            ax.set_ylabel("빈도수")
+                            plt.xticks(rotation=45, ha='right')
+                            plt.tight_layout()
+                            return fig
+                        image = profile("chart:top_values", lambda: render_png(draw_top_values()), selected_column)
+                    if image:
+                        st.image(image)
+                    else:
+                        st.write("값이 없는 컬럼입니다.")
 
                 with st.container(border=True):
                     st.subheader("📋 데이터 요약")
                     col1, col2 = st.columns(2)
                     with col1:
                         st.write("**값 빈도수 (Value Counts)**")
-                        st.dataframe(df_column.value_counts(dropna=False).to_frame().astype(str))
+                        st.dataframe(profile("value_counts", lambda: df_column.value_counts(dropna=False).to_frame().astype(str), selected_column))
                     with col2:
                         st.write("**기술 통계 (Descriptive Statistics)**")
-                        st.dataframe(df_column.describe(include='all').to_frame().astype(str))
+                        st.dataframe(profile("describe", lambda: df_column.describe(include='all').to_frame().astype(str), selected_column))
 
         with tab3:
             st.subheader("데이터베이스 작업 옵션")
@@ -200,10 +526,11 @@ def run_streamlit_app():
                     st.warning(f"**경고:** 테이블 '{file_name_without_ext}'의 모든 데이터가 삭제되고 현재 파일의 데이터로 대체됩니다. 계속하시겠습니까?")
                     if st.button("삭제 및 덮어쓰기 진행", type="primary", key="confirm_overwrite"):
                         st.info(f"DB: overwrite_table 호출 시도. DataFrame shape: {df.shape}, Table name: {file_name_without_ext}")
-                        success, message = db_manager.overwrite_table(df, file_name_without_ext)
+                        success, message = run_with_live_status(db_manager, db_manager.overwrite_table, df, file_name_without_ext, st.session_state.get('current_schema'))
                         st.info(f"DB: overwrite_table 응답: Success={success}, Message={message}")
                         if success:
                             st.success(f"✅ {message}")
+                            st.session_state.edit_log.clear() # the table now matches the edited frame
                         else:
                             st.error(f"❌ {message}")
                         st.session_state.confirm_overwrite_db = False # Reset confirmation after action
@@ -212,7 +539,7 @@ def run_streamlit_app():
             with col2:
                 if st.button("➕ 변경된 내용만 추가", width='stretch', key="append_data"):
                     st.info(f"DB: append_new_data 호출 시도. DataFrame shape: {df.shape}, Table name: {file_name_without_ext}")
-                    success, message = db_manager.append_new_data(df, file_name_without_ext)
+                    success, message = run_with_live_status(db_manager, db_manager.append_new_data, df, file_name_without_ext)
                     st.info(f"DB: append_new_data 응답: Success={success}, Message={message}")
                     if success:
                         st.success(f"✅ {message}")
@@ -220,5 +547,27 @@ def run_streamlit_app():
                         st.error(f"❌ {message}")
                     st.rerun()
 
+            sheet_names = st.session_state.get("excel_sheet_names") or []
+            if uploaded_file is not None and len(sheet_names) > 1:
+                st.caption(f"통합 문서의 시트 {len(sheet_names)}개를 한 번에 읽어 시트마다 '{file_name_without_ext}_<시트 이름>' 테이블로 덮어씁니다.")
+                if st.button("📚 모든 시트를 각각 테이블로 적재", width='stretch', key="load_all_sheets"):
+                    success, message = run_with_live_status(db_manager, db_manager.load_excel_sheets, data_importer, uploaded_file, file_name_without_ext)
+                    if success:
+                        st.success(f"✅ {message}")
+                    else:
+                        st.error(f"❌ {message}")
+
+            edit_log = st.session_state.edit_log
+            if edit_log.pending_count:
+                st.caption("편집기에서 수정/추가/삭제한 행만 테이블에 반영합니다. (테이블이 현재 파일로 '덮어쓰기'된 상태여야 합니다)")
+                if st.button(f"✏️ 편집 내용만 DB에 동기화 ({edit_log.pending_count}건)", width='stretch', key="sync_edits"):
+                    success, message = run_with_live_status(db_manager, db_manager.sync_changes, file_name_without_ext, *edit_log.sync_payload(df))
+                    if success:
+                        edit_log.clear()
+                        st.success(f"✅ {message}")
+                    else:
+                        st.error(f"❌ {message}")
+                    st.rerun()
+
 if __name__ == "__main__":
     run_streamlit_app()
@@ -1,13 +1,20 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, messagebox, simpledialog, ttk
 import os
 import datetime
 import io
+import threading
 import pandas as pd
 
 from core.config import DB_CONFIG, TKINTER_CONFIG, APP_CONFIG, VISUALIZATION_CONFIG
-from core.database_manager import DatabaseManager
+from core.database_manager import DatabaseManager, OperationCancelled
 from core.data_importer import DataImporter
+from core.frame_compaction import make_room
+from core.metrics import MetricsRecorder
+from core.table_analyzer import TableAnalyzer
+from core.stream_profiler import StreamProfiler
+from UI.virtual_treeview import VirtualTreeview
+from UI.background_jobs import BackgroundJobs
 
 class TkinterApp:
     def __init__(self, root):
@@ -31,8 +38,12 @@ class TkinterApp:
                   foreground=[('selected', default_fg)])
 
         self.db_manager = DatabaseManager(db_config=DB_CONFIG, status_callback=self.update_status)
-        self.data_importer = DataImporter(status_callback=self.update_status)
+        self.metrics = MetricsRecorder()
+        self.data_importer = DataImporter(status_callback=self.update_status, metrics=self.metrics)
+        self.table_analyzer = TableAnalyzer(self.db_manager)
         self.current_df = None
+        self.analysis_table = None # set while the column selector lists a DB table's columns instead of the file's
+        self.stream_profile = None # StreamProfiler of a file profiled chunk by chunk, likewise
         self.na_columns = []
 
         # --- UI Frames ---
@@ -50,6 +61,16 @@ class TkinterApp:
         self.db_frame.pack(pady=10, padx=10, fill="x")
         self.setup_db_button = tk.Button(self.db_frame, text="DB 테이블 셋팅 시작", command=self.start_db_setup)
         self.setup_db_button.pack(side=tk.LEFT, pady=10, padx=10)
+        self.stream_db_button = tk.Button(self.db_frame, text="대용량 스트리밍 적재", command=self.start_streaming_load)
+        self.stream_db_button.pack(side=tk.LEFT, pady=10, padx=10)
+        self.tail_db_button = tk.Button(self.db_frame, text="증분 추가 적재", command=self.start_tail_append)
+        self.tail_db_button.pack(side=tk.LEFT, pady=10, padx=10)
+        self.cancel_all_button = tk.Button(self.db_frame, text="모두 취소", command=self.cancel_all_jobs)
+        self.cancel_all_button.pack(side=tk.RIGHT, pady=10, padx=(0, 10))
+        self.cancel_button = tk.Button(self.db_frame, text="작업 취소", command=self.cancel_current_job)
+        self.cancel_button.pack(side=tk.RIGHT, pady=10, padx=5)
+        self.progress_bar = ttk.Progressbar(self.db_frame, mode="determinate", length=200)
+        self.progress_bar.pack(side=tk.RIGHT, pady=10, padx=5)
 
         self.analysis_frame = tk.LabelFrame(root, text="데이터 분석 및 시각화")
         self.analysis_frame.pack(pady=10, padx=10, fill="x")
@@ -62,16 +83,19 @@ class TkinterApp:
 
         self.generate_chart_button = tk.Button(self.analysis_frame, text="컬럼 분석", command=self._generate_charts)
         self.generate_chart_button.pack(side=tk.LEFT, padx=5, pady=5)
+        self.table_analysis_button = tk.Button(self.analysis_frame, text="DB 테이블 분석", command=self.start_table_analysis)
+        self.table_analysis_button.pack(side=tk.LEFT, padx=5, pady=5)
+        self.stream_profile_button = tk.Button(self.analysis_frame, text="대용량 파일 프로파일", command=self.start_stream_profile)
+        self.stream_profile_button.pack(side=tk.LEFT, padx=5, pady=5)
+        self.metrics_button = tk.Button(self.analysis_frame, text="단계별 성능", command=self.show_metrics_window)
+        self.metrics_button.pack(side=tk.LEFT, padx=5, pady=5)
 
         self.edit_preview_frame = tk.LabelFrame(root, text="데이터 편집 및 미리보기")
         self.edit_preview_frame.pack(pady=10, padx=10, fill="both", expand=True)
-        self.data_tree = ttk.Treeview(self.edit_preview_frame, show="headings")
-        treescrolly = tk.Scrollbar(self.edit_preview_frame, orient="vertical", command=self.data_tree.yview)
-        treescrollx = tk.Scrollbar(self.edit_preview_frame, orient="horizontal", command=self.data_tree.xview)
-        self.data_tree.configure(xscrollcommand=treescrollx.set, yscrollcommand=treescrolly.set)
-        treescrollx.pack(side="bottom", fill="x")
-        treescrolly.pack(side="right", fill="y")
-        self.data_tree.pack(side="left", fill="both", expand=True)
+        # Only the rows on screen exist as Treeview items, so large files open and scroll without freezing.
+        self.data_view = VirtualTreeview(self.edit_preview_frame)
+        self.data_view.pack(fill="both", expand=True)
+        self.data_tree = self.data_view.tree
         self.data_tree.bind("<Double-1>", self._on_treeview_double_click)
         self.data_tree.bind("<<TreeviewSelect>>", self._clear_tree_selection)
 
@@ -97,6 +121,9 @@ class TkinterApp:
         self.log_scrollbar.pack(side="right", fill="y")
         self.log_text.config(yscrollcommand=self.log_scrollbar.set)
 
+        # File loading and DB work run on a worker thread; widgets are only touched from the Tk main thread.
+        self.jobs = BackgroundJobs(root, on_status=self.update_status, on_progress=self._update_progress, on_idle=self._reset_progress)
+
         self.update_status("애플리케이션 시작됨.")
 
     def _clear_tree_selection(self, event):
@@ -104,22 +131,14 @@ class TkinterApp:
             self.data_tree.selection_remove(self.data_tree.selection())
 
     def _populate_data_preview(self, df):
-        for i in self.data_tree.get_children():
-            self.data_tree.delete(i)
-        self.data_tree["columns"] = []
-        if df is None: return
-
-        self.data_tree["columns"] = df.columns.tolist()
-        for col in df.columns:
-            self.data_tree.heading(col, text=col)
-            self.data_tree.column(col, width=100, anchor='w')
-
-        for index, row in df.iterrows():
-            self.data_tree.insert("", "end", iid=index, values=[str(v) for v in row])
+        self.data_view.set_dataframe(df)
 
     def _on_treeview_double_click(self, event):
         region = self.data_tree.identify_region(event.x, event.y)
         if region != "cell": return
+        if self.jobs.pending_count:
+            self.update_status("DB 작업이 진행 중이라 지금은 데이터를 편집할 수 없습니다.")
+            return
 
         column_id = self.data_tree.identify_column(event.x)
         column_name = self.data_tree.heading(column_id)['text']
@@ -129,7 +148,7 @@ class TkinterApp:
             return
 
         item_id = self.data_tree.identify_row(event.y)
-        row_index = self.data_tree.index(item_id)
+        row_position = self.data_view.position_of(item_id)
         column_index = int(column_id.replace('#', '')) - 1
 
         x, y, width, height = self.data_tree.bbox(item_id, column_id)
@@ -139,13 +158,13 @@ class TkinterApp:
         entry.focus_set()
 
         def save_edit(e):
-            self._save_cell_value(e.widget, row_index, column_name, item_id)
+            self._save_cell_value(e.widget, row_position, column_name)
 
         entry.bind("<Return>", save_edit)
         entry.bind("<FocusOut>", save_edit)
         entry.bind("<Escape>", lambda e: e.widget.destroy())
 
-    def _save_cell_value(self, entry_widget, row_index, column_name, item_id):
+    def _save_cell_value(self, entry_widget, row_position, column_name):
         new_value_str = entry_widget.get()
         entry_widget.destroy()
 
@@ -158,14 +177,17 @@ class TkinterApp:
             else:
                 new_value = new_value_str
 
+            row_index = self.current_df.index[row_position]
+            # Compacted columns (category, narrowed numbers) are widened first when the value does not fit.
+            self.current_df[column_name] = make_room(self.current_df[column_name], [new_value])
             self.current_df.loc[row_index, column_name] = new_value
             self.update_status(f"데이터 업데이트: 행 {row_index}, 열 '{column_name}' -> '{new_value}'")
-            self._populate_data_preview(self.current_df)
+            self.data_view.refresh_row(row_position)
             self._update_na_columns_display(self.current_df)
 
         except (ValueError, TypeError) as e:
             self.update_status(f"값 오류: '{new_value_str}'는 '{column_name}' 컬럼의 올바른 타입이 아닙니다. ({e})")
-            self._populate_data_preview(self.current_df)
+            self.data_view.refresh_row(row_position)
 
     def browse_file(self):
         file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
@@ -175,6 +197,8 @@ class TkinterApp:
             self.file_path_entry.insert(0, file_path)
             self.update_status(f"파일 선택됨: {file_path}")
             self.current_df = None
+            self.analysis_table = None
+            self.stream_profile = None
             self.column_selector['values'] = []
             self.column_selector.set('')
             self._update_na_columns_display(None)
@@ -213,9 +237,21 @@ class TkinterApp:
         buffer = io.StringIO()
         df.info(buf=buffer)
         self.update_status(f"\n--- 데이터프레임 정보 (df.info()) ---\n{buffer.getvalue()}")
+        if self.data_importer.last_compaction:
+            self.update_status(f"\n{self.data_importer.last_compaction.memory_report()}")
         self.update_status(f"\n--- 데이터프레임 기술 통계 (df.describe()) ---\n{df.describe().to_string()}")
 
     def _generate_charts(self):
+        if self.stream_profile:
+            selected_column = self.column_selector.get()
+            if not selected_column: return messagebox.showwarning("경고", "분석할 컬럼을 선택해주세요.")
+            return self._report_stream_profile_column(selected_column)
+        if self.analysis_table:
+            selected_column = self.column_selector.get()
+            if not selected_column: return messagebox.showwarning("경고", "분석할 컬럼을 선택해주세요.")
+            table_name = self.analysis_table
+            return self.jobs.submit(f"컬럼 분석: {table_name}.{selected_column}",
+                                    lambda job: self._run_table_column_analysis(job, table_name, selected_column))
         if self.current_df is None: return messagebox.showwarning("경고", "먼저 파일을 로드해주세요.")
         selected_column = self.column_selector.get()
         if not selected_column: return messagebox.showwarning("경고", "분석할 컬럼을 선택해주세요.")
@@ -234,47 +270,247 @@ class TkinterApp:
         self.update_status(f"고유 값: {unique_values[:display_limit].tolist()}")
         self.update_status(f"--- 컬럼 '{selected_column}' 분석 완료 ---\n")
 
-    def start_db_setup(self, event=None):
+    def start_table_analysis(self):
+        # Analyses a table already in the DB with SQL aggregates instead of loading it into pandas.
+        default_name = os.path.splitext(os.path.basename(self.file_path_entry.get()))[0]
+        table_name = simpledialog.askstring("DB 테이블 분석", "분석할 테이블 이름:", initialvalue=default_name, parent=self.root)
+        if not table_name: return
+        self.jobs.submit(f"DB 테이블 분석: {table_name}", lambda job: self._run_table_overview(job, table_name))
+
+    def _run_table_overview(self, job, table_name):
+        # Runs on the worker thread.
+        try:
+            tables = self.table_analyzer.list_tables()
+            if table_name not in tables:
+                job.report(f"테이블 '{table_name}'이(가) 없습니다. 사용 가능한 테이블: {', '.join(tables) if tables else '(없음)'}")
+                return
+            overview = self.table_analyzer.overview(table_name)
+        except Exception as e:
+            job.report(f"테이블 분석 중 오류 발생: {e}")
+            return
+        job.report(f"\n--- 테이블 '{table_name}' 요약 (총 {overview['rows']:,}행) ---\n{overview['info'].to_string(index=False)}")
+        job.call_in_ui(self._show_table_columns, table_name, overview['info']['Column'].tolist())
+
+    def _show_table_columns(self, table_name, columns):
+        self.analysis_table = table_name
+        self.stream_profile = None
+        self.column_selector['values'] = columns
+        if columns: self.column_selector.set(columns[0])
+        self.update_status(f"DB 테이블 '{table_name}' 분석 모드: 컬럼을 선택하고 '컬럼 분석'을 누르세요.")
+
+    def _run_table_column_analysis(self, job, table_name, column):
+        # Runs on the worker thread; the same report as _generate_charts, computed inside the database.
+        display_limit = VISUALIZATION_CONFIG['unique_values_display_limit']
+        try:
+            summary = self.table_analyzer.column_summary(table_name, column)
+            value_counts = self.table_analyzer.top_values(table_name, column, display_limit, dropna=False)
+        except Exception as e:
+            job.report(f"컬럼 분석 중 오류 발생: {e}")
+            return
+        job.report(f"\n--- 테이블 '{table_name}' 컬럼 '{column}' 분석 시작 ---")
+        job.report(f"결측치(NA) 개수: {summary['null']}개")
+        job.report(f"\n--- 값 빈도수 (상위 {display_limit}개) ---\n{value_counts.to_string()}")
+        job.report(f"\n--- 기술 통계 ---\n{summary.to_string()}")
+        if 'unique' in summary:
+            job.report(f"고유 값 개수: {summary['unique']}")
+        job.report(f"--- 컬럼 '{column}' 분석 완료 ---\n")
+
+    def start_stream_profile(self, event=None):
+        # Profiles the file in one chunked pass with bounded memory instead of loading it whole.
         file_path = self.file_path_entry.get()
         if not file_path:
             messagebox.showwarning("경고", "먼저 파일을 선택해주세요.")
             return
+        self.jobs.submit(f"대용량 파일 프로파일: {os.path.basename(file_path)}", lambda job: self._run_stream_profile(job, file_path))
+
+    def _run_stream_profile(self, job, file_path):
+        # Runs on the worker thread; cancellation is checked between chunks.
+        def check_cancel():
+            if job.cancelled(): raise OperationCancelled("사용자에 의해 작업이 취소되었습니다.")
 
-        self.update_status(f"DB 셋팅 시작: {file_path}")
+        job.progress(0, None)
+        run_id = self.metrics.start_run(job.name)
         try:
-            self.update_status("데이터 로딩을 시작합니다...")
-            df = self.data_importer.load_data(file_path)
+            profiler = StreamProfiler(metrics=self.metrics).consume(self.data_importer.iter_chunks(file_path), check_cancel)
+        except Exception as e:
+            job.report(f"파일 프로파일 중 오류 발생: {e}")
+            return
+        finally:
+            self._finish_metrics_run(job, run_id)
+        overview = profiler.overview()
+        head_rows = VISUALIZATION_CONFIG['dataframe_head_rows']
+        job.report(f"\n--- 파일 요약 (총 {overview['rows']:,}행, 고유 값 개수는 근사값) ---\n{overview['info'].to_string(index=False)}")
+        job.report(f"\n--- 무작위 표본 미리보기 ({head_rows}행) ---\n{profiler.sample.head(head_rows).to_string()}")
+        job.report(f"\n--- 기술 통계 (근사) ---\n{profiler.describe().to_string()}")
+        job.call_in_ui(self._show_stream_profile_columns, profiler)
+
+    def _show_stream_profile_columns(self, profiler):
+        self.stream_profile = profiler
+        self.analysis_table = None
+        self.column_selector['values'] = profiler.columns
+        if profiler.columns: self.column_selector.set(profiler.columns[0])
+        self.update_status("대용량 파일 프로파일 모드: 컬럼을 선택하고 '컬럼 분석'을 누르세요.")
+
+    def _report_stream_profile_column(self, column):
+        # Same report as _generate_charts, from the sketches; no data is re-read.
+        display_limit = VISUALIZATION_CONFIG['unique_values_display_limit']
+        summary = self.stream_profile.column_summary(column)
+        error = self.stream_profile.frequency_error(column)
+        self.update_status(f"\n--- 컬럼 '{column}' 분석 시작 (근사) ---")
+        self.update_status(f"결측치(NA) 개수: {summary['null']}개")
+        note = f" (하한값, 최대 {error:,} 오차)" if error else ""
+        self.update_status(f"\n--- 값 빈도수 (상위 {display_limit}개){note} ---\n{self.stream_profile.top_values(column, display_limit, dropna=False).to_string()}")
+        self.update_status(f"\n--- 기술 통계 ---\n{summary.to_string()}")
+        self.update_status(f"고유 값 개수 (근사): {self.stream_profile.distinct_count(column):,}")
+        self.update_status(f"--- 컬럼 '{column}' 분석 완료 ---\n")
+
+    def _update_progress(self, done, total):
+        if total:
+            if str(self.progress_bar['mode']) != "determinate":
+                self.progress_bar.stop()
+                self.progress_bar.config(mode="determinate")
+            self.progress_bar.config(maximum=total, value=min(done, total))
+        elif str(self.progress_bar['mode']) != "indeterminate":
+            self.progress_bar.config(mode="indeterminate")
+            self.progress_bar.start(15)
+
+    def _reset_progress(self):
+        self.progress_bar.stop()
+        self.progress_bar.config(mode="determinate", value=0)
+
+    def cancel_current_job(self):
+        self.jobs.cancel_current()
+
+    def cancel_all_jobs(self):
+        self.jobs.cancel_all()
+
+    def _job_db_manager(self, job):
+        # One manager per job so status, progress and cancellation are routed to that job; connections still come from the shared pool.
+        return DatabaseManager(db_config=DB_CONFIG, status_callback=job.report, progress_callback=job.progress, cancel_check=job.cancelled,
+                               metrics=self.metrics)
+
+    def _finish_metrics_run(self, job, run_id):
+        job.report(self.metrics.format_breakdown(run_id))
+        path = self.metrics.export(run_id)
+        if path: job.report(f"단계별 측정 결과를 '{path}'에 추가했습니다.")
+
+    def show_metrics_window(self):
+        if not self.metrics.runs:
+            return messagebox.showinfo("단계별 성능", "아직 측정된 작업이 없습니다.")
+        run_id, label, _ = self.metrics.runs[-1]
+        report = self.metrics.breakdown(run_id)
+        window = tk.Toplevel(self.root)
+        window.title(f"단계별 성능 - {label}")
+        tree = ttk.Treeview(window, show="headings", columns=report.columns.tolist(), height=min(len(report), 20))
+        for col in report.columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=90, anchor='e')
+        for row in report.itertuples(index=False, name=None):
+            tree.insert("", "end", values=[str(v) for v in row])
+        tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def _report_db_result(self, success, message):
+        self.update_status(f"DB Manager 응답: Success={success}, Message={message}")
+        if success:
+            messagebox.showinfo("작업 완료", message)
+        else:
+            messagebox.showerror("오류", message)
 
-            if df is None:
-                messagebox.showerror("오류", "파일을 읽는 데 실패했습니다. 작업 상세 로그를 확인해주세요.")
-                return
+    def _show_loaded_dataframe(self, df):
+        self.current_df = df
+        self.analysis_table = None
+        self.stream_profile = None
+        self._update_column_selector(df)
+        self._update_na_columns_display(df)
+        self._populate_data_preview(df)
 
-            self.update_status("데이터 로딩 성공. 데이터프레임이 생성되었습니다.")
-            self.current_df = df
-            self._update_column_selector(df)
-            self._update_na_columns_display(df)
-            self._populate_data_preview(df)
-            self._display_dataframe_head(df)
-            self._display_dataframe_description(df)
+    def start_db_setup(self, event=None):
+        file_path = self.file_path_entry.get()
+        if not file_path:
+            messagebox.showwarning("경고", "먼저 파일을 선택해주세요.")
+            return
+        self.jobs.submit(f"DB 셋팅: {os.path.basename(file_path)}", lambda job: self._run_db_setup(job, file_path))
 
-            file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+    def _run_db_setup(self, job, file_path):
+        # Runs on the worker thread.
+        run_id = self.metrics.start_run(job.name)
+        try:
+            self._db_setup_steps(job, file_path)
+        finally:
+            self._finish_metrics_run(job, run_id)
+
+    def _db_setup_steps(self, job, file_path):
+        job.report(f"DB 셋팅 시작: {file_path}")
+        job.report("데이터 로딩을 시작합니다...")
+        job.progress(0, None)
+        df = self.data_importer.load_data(file_path)
+        schema = self.data_importer.last_schema
+
+        if df is None:
+            job.call_in_ui(messagebox.showerror, "오류", "파일을 읽는 데 실패했습니다. 작업 상세 로그를 확인해주세요.")
+            return
+        if job.cancelled():
+            job.report("작업이 취소되어 DB 작업을 시작하지 않습니다.")
+            return
 
-            self.update_status("데이터베이스 연결 및 테이블 덮어쓰기 시도 중...")
-            success, message = self.db_manager.overwrite_table(df, file_name_without_ext)
-            self.update_status(f"DB Manager 응답: Success={success}, Message={message}")
+        job.report("데이터 로딩 성공. 데이터프레임이 생성되었습니다.")
+        job.call_in_ui(self._show_loaded_dataframe, df)
+        self._display_dataframe_head(df)
+        self._display_dataframe_description(df)
 
-            if success:
-                self.update_status(f"DB 작업 완료: {message}")
-                messagebox.showinfo("작업 완료", message)
-            else:
-                self.update_status(f"DB 작업 실패: {message}")
-                messagebox.showerror("오류", message)
+        file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+        job.report("데이터베이스 연결 및 테이블 덮어쓰기 시도 중...")
+        success, message = self._job_db_manager(job).overwrite_table(df, file_name_without_ext, schema=schema)
+        job.call_in_ui(self._report_db_result, success, message)
 
-        except Exception as e:
-            self.update_status(f"CRITICAL: start_db_setup에서 예상치 못한 예외 발생: {e}")
-            messagebox.showerror("심각한 오류", f"처리 중 예상치 못한 오류가 발생했습니다:\n{e}")
+    def start_streaming_load(self, event=None):
+        # Loads the file chunk by chunk straight into the DB without keeping the whole frame in memory.
+        file_path = self.file_path_entry.get()
+        if not file_path:
+            messagebox.showwarning("경고", "먼저 파일을 선택해주세요.")
+            return
+        self.jobs.submit(f"스트리밍 적재: {os.path.basename(file_path)}", lambda job: self._run_streaming_load(job, file_path))
+
+    def _run_streaming_load(self, job, file_path):
+        # Runs on the worker thread; cancellation is checked by load_chunks between chunks and batches.
+        job.report(f"스트리밍 적재 시작: {file_path}")
+        job.progress(0, None)
+        run_id = self.metrics.start_run(job.name)
+        try:
+            file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+            # Resumes an interrupted load of the same file from its last committed chunk (load manifest).
+            success, message = self._job_db_manager(job).load_file_resumable(self.data_importer, file_path, file_name_without_ext, overwrite=True)
+        finally:
+            self._finish_metrics_run(job, run_id)
+        job.call_in_ui(self._report_db_result, success, message)
+
+    def start_tail_append(self, event=None):
+        # For a CSV that keeps growing: loads only the lines added since the last run into the same table.
+        file_path = self.file_path_entry.get()
+        if not file_path:
+            messagebox.showwarning("경고", "먼저 파일을 선택해주세요.")
+            return
+        if not file_path.lower().endswith('.csv'):
+            messagebox.showwarning("경고", "증분 추가 적재는 CSV 파일만 지원합니다.")
+            return
+        self.jobs.submit(f"증분 추가 적재: {os.path.basename(file_path)}", lambda job: self._run_tail_append(job, file_path))
+
+    def _run_tail_append(self, job, file_path):
+        job.report(f"증분 추가 적재 시작: {file_path}")
+        job.progress(0, None)
+        run_id = self.metrics.start_run(job.name)
+        try:
+            file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+            success, message = self._job_db_manager(job).append_file_tail(self.data_importer, file_path, file_name_without_ext)
+        finally:
+            self._finish_metrics_run(job, run_id)
+        job.call_in_ui(self._report_db_result, success, message)
 
     def update_status(self, message):
+        if threading.current_thread() is not threading.main_thread():
+            # Called from the worker thread (e.g. through DataImporter's callback); hand it to the UI loop.
+            self.jobs.post_status(message)
+            return
         log_entry = f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}\n"
         self.status_label.config(text=f"상태: {message.splitlines()[0]}")
         self.log_text.config(state="normal")
@@ -0,0 +1,108 @@
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+
+class VirtualTreeview(tk.Frame):
+    # Treeview over a DataFrame that only materialises the rows currently on screen.
+    # The tree holds one item per visible line; scrolling re-fills those items from df.iloc[offset:offset + n],
+    # so the cost of a redraw depends on the window height, not on the number of rows.
+    def __init__(self, master, column_width=100, **kwargs):
+        super().__init__(master, **kwargs)
+        self.tree = ttk.Treeview(self, show="headings")
+        self.scroll_y = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scroll_x = tk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.scroll_x.set)
+        self.scroll_x.pack(side="bottom", fill="x")
+        self.scroll_y.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.column_width = column_width
+        self.df = None
+        self.offset = 0
+        self.visible_rows = 0
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_rows(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self.scroll_rows(self.visible_rows))
+
+    def _row_height(self):
+        row_height = ttk.Style().lookup("Treeview", "rowheight")
+        if row_height: return int(row_height)
+        return tkfont.nametofont("TkDefaultFont").metrics("linespace") + 4
+
+    def set_dataframe(self, df):
+        self.df = df
+        self.offset = 0
+        self.tree.delete(*self.tree.get_children())
+        self.tree["columns"] = df.columns.tolist() if df is not None else []
+        if df is not None:
+            for col in df.columns:
+                self.tree.heading(col, text=col)
+                self.tree.column(col, width=self.column_width, anchor='w')
+        self._render()
+
+    def _total_rows(self):
+        return len(self.df) if self.df is not None else 0
+
+    def _format_rows(self, start, stop):
+        window = self.df.iloc[start:stop]
+        return [[str(v) for v in row] for row in window.itertuples(index=False, name=None)]
+
+    def _render(self):
+        # Re-fills the visible items in place; items are only created or deleted when the window height changes.
+        total_rows = self._total_rows()
+        self.offset = max(0, min(self.offset, total_rows - self.visible_rows))
+        rows = self._format_rows(self.offset, self.offset + self.visible_rows) if total_rows else []
+        items = self.tree.get_children()
+        for position, values in enumerate(rows):
+            item_id = str(position)
+            if position < len(items):
+                self.tree.item(item_id, values=values)
+            else:
+                self.tree.insert("", "end", iid=item_id, values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+
+        if total_rows:
+            self.scroll_y.set(self.offset / total_rows, min(1.0, (self.offset + len(rows)) / total_rows))
+        else:
+            self.scroll_y.set(0.0, 1.0)
+
+    def _on_resize(self, event):
+        # One line is taken by the heading row.
+        visible_rows = max(1, event.height // self._row_height() - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        total_rows = self._total_rows()
+        if action == "moveto":
+            self.offset = int(float(amount) * total_rows)
+            self._render()
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_rows(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas.
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_rows(-3 * delta)
+
+    def scroll_rows(self, rows):
+        if self.df is None or not rows: return
+        self.offset += rows
+        self._render()
+
+    def position_of(self, item_id):
+        # DataFrame position (for df.iloc / df.index[...]) of a visible tree item.
+        return self.offset + self.tree.index(item_id)
+
+    def refresh_row(self, position):
+        # Redraws one DataFrame row if it is on screen, e.g. after a single-cell edit.
+        index_in_window = position - self.offset
+        if 0 <= index_in_window < len(self.tree.get_children()):
+            self.tree.item(str(index_in_window), values=self._format_rows(position, position + 1)[0])
@@ -0,0 +1,19 @@
+from .base import StorageBackend
+from .duckdb_backend import DuckDBBackend, duckdb
+from .mysql_backend import MySQLBackend
+from .sqlite_backend import SQLiteBackend
+
+# DB_CONFIG['backend'] -> implementation.
+BACKENDS = {
+    'mysql': MySQLBackend,
+    'sqlite': SQLiteBackend,
+    'duckdb': DuckDBBackend,
+}
+
+def get_backend(db_config, status_callback=None, metrics=None, insert_engine=None):
+    name = db_config.get('backend', 'mysql')
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 DB 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+    if name == 'duckdb' and duckdb is None:
+        raise ImportError("DuckDB 백엔드를 사용하려면 duckdb 패키지가 필요합니다. (pip install duckdb)")
+    return BACKENDS[name](db_config, status_callback=status_callback, metrics=metrics, insert_engine=insert_engine)
@@ -0,0 +1,180 @@
+from contextlib import contextmanager
+from ..config import INSERT_CONFIG
+from ..fingerprint import FINGERPRINT_COLUMN
+from ..metrics import NULL_METRICS
+from ..type_inference import ColumnType
+
+class StorageBackend:
+    # What DatabaseManager needs from a database: connections, SQL dialect, type mapping, table DDL and the
+    # bulk insert path. Subclasses override the parts their engine does differently or faster.
+    name = None
+    placeholder = '?'
+    errors = (Exception,) # exception types the driver raises, caught by DatabaseManager
+
+    def __init__(self, db_config, status_callback=None, metrics=None, insert_engine=None):
+        self.db_config = db_config
+        self.status_callback = status_callback if status_callback else print
+        self.metrics = metrics if metrics else NULL_METRICS
+        self.insert_engine = insert_engine if insert_engine else INSERT_CONFIG['engine']
+
+    def _update_status(self, message):
+        self.status_callback(message)
+
+    # --- Connections ---
+    @property
+    def database_ready(self):
+        return True
+
+    def describe(self):
+        # Name of the target database for status messages.
+        return self.db_config.get('database')
+
+    def acquire(self, create_db=False):
+        raise NotImplementedError
+
+    def release(self, conn):
+        conn.close()
+
+    def commit(self, conn):
+        conn.commit()
+
+    def rollback(self, conn):
+        conn.rollback()
+
+    @contextmanager
+    def cursor(self, conn):
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+    def connection_of(self, cursor):
+        return cursor.connection
+
+    def affected_rows(self, cursor):
+        # Rows changed by the last DML statement.
+        return cursor.rowcount
+
+    def is_missing_table_error(self, error):
+        return False
+
+    # --- Dialect and catalog ---
+    def quote(self, identifier):
+        return '"' + identifier.replace('"', '""') + '"'
+
+    def placeholders(self, count):
+        return ", ".join([self.placeholder] * count)
+
+    def table_exists(self, cursor, table_name):
+        raise NotImplementedError
+
+    def has_column(self, cursor, table_name, column_name):
+        raise NotImplementedError
+
+    def list_tables(self, cursor):
+        raise NotImplementedError
+
+    def column_types(self, cursor, table_name):
+        # [(column, declared SQL type)] in table order.
+        raise NotImplementedError
+
+    def indexed_columns(self, cursor, table_name):
+        # {column: NOT NULL?} for columns that lead an index (the primary key included).
+        raise NotImplementedError
+
+    def streaming_cursor(self, conn):
+        # Cursor whose fetchmany() pulls rows from the server as it goes instead of buffering the whole result.
+        return self.cursor(conn)
+
+    def table_version(self, cursor, table_name):
+        # Cheap stamp that changes whenever the table's contents may have changed; never scans the table.
+        raise NotImplementedError
+
+    def drop_table(self, cursor, table_name):
+        cursor.execute(f"DROP TABLE IF EXISTS {self.quote(table_name)}")
+
+    def rename_tables(self, cursor, renames):
+        # (old, new) pairs, applied in order inside the caller's transaction.
+        for old_name, new_name in renames:
+            cursor.execute(f"ALTER TABLE {self.quote(old_name)} RENAME TO {self.quote(new_name)}")
+
+    # --- Aggregates used by TableAnalyzer ---
+    def floor_sql(self, expression):
+        return f"FLOOR({expression})"
+
+    def stddev_sql(self, expression):
+        # Sample standard deviation aggregate, or None when the engine has none.
+        return f"STDDEV_SAMP({expression})"
+
+    # --- Type mapping and DDL ---
+    def column_type_sql(self, column_type):
+        raise NotImplementedError
+
+    def column_definitions(self, df, column_mapping, schema=None, exact=True):
+        # "<quoted column> <type>" for each (original, sanitized) pair.
+        definitions = []
+        for col_name, safe_col_name in column_mapping:
+            column_type = schema.get(col_name) if schema else None
+            if column_type is None:
+                column_type = ColumnType.from_dtype(col_name, df[col_name].dtype)
+            definitions.append(f"{self.quote(safe_col_name)} {self.column_type_sql(column_type)}")
+        return definitions
+
+    def widen_columns(self, cursor, table_name, df, column_mapping):
+        # Widens existing column types that the rows of `df` would overflow; types here are never sized to the data.
+        return []
+
+    def id_column_sql(self):
+        return f"{self.quote('id')} INTEGER PRIMARY KEY"
+
+    def fingerprint_column_sql(self):
+        return f"{self.quote(FINGERPRINT_COLUMN)} TEXT NOT NULL"
+
+    def fingerprint_index_sql(self, table_name):
+        # Inline table constraint for the fingerprint unique key, or None when the backend has none.
+        return f"UNIQUE ({self.quote(FINGERPRINT_COLUMN)})"
+
+    def create_table_sql(self, table_name, column_definitions, defer_indexes=False):
+        columns_sql = [self.id_column_sql()] + column_definitions + [self.fingerprint_column_sql()]
+        index_sql = None if defer_indexes else self.fingerprint_index_sql(table_name)
+        if index_sql:
+            columns_sql.append(index_sql)
+        return f"CREATE TABLE {self.quote(table_name)} ({', '.join(columns_sql)})"
+
+    def add_fingerprint_index(self, cursor, table_name):
+        raise NotImplementedError
+
+    # --- Inserts ---
+    def insert_sql(self, table_name, safe_columns, fingerprinted):
+        columns_str = ", ".join(self.quote(col) for col in safe_columns)
+        return f"INSERT INTO {self.quote(table_name)} ({columns_str}) VALUES ({self.placeholders(len(safe_columns))})"
+
+    def rows_for_insert(self, df):
+        # Python tuples with NA replaced by None, built one batch at a time to keep memory bounded.
+        with self.metrics.span('stringify', rows=len(df)):
+            return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+    def batch_rows(self, cursor, df):
+        return INSERT_CONFIG['batch_rows']
+
+    def insert_frame(self, cursor, table_name, data, safe_columns, fingerprints=None, progress=None, check_cancel=None):
+        # Inserts `data` (plus the fingerprint column when `fingerprints` is given, in which case rows whose
+        # fingerprint is already stored are skipped). Returns the number of inserted rows.
+        insert_query = self.insert_sql(table_name, safe_columns, fingerprints is not None)
+        batch_rows = self.batch_rows(cursor, data)
+        inserted_rows = 0
+        for start in range(0, len(data), batch_rows):
+            if check_cancel: check_cancel()
+            batch = data.iloc[start:start + batch_rows]
+            rows = self.rows_for_insert(batch)
+            if fingerprints is not None:
+                rows = [row + (fp,) for row, fp in zip(rows, fingerprints.iloc[start:start + batch_rows].tolist())]
+            with self.metrics.span('executemany', rows=len(rows)):
+                cursor.executemany(insert_query, rows)
+            inserted_rows += self.affected_rows(cursor) if fingerprints is not None else len(rows)
+            if INSERT_CONFIG['commit_every_batch']:
+                with self.metrics.span('commit'):
+                    self.commit(self.connection_of(cursor))
+            if progress: progress.advance(len(batch))
+        return inserted_rows
@@ -0,0 +1,159 @@
+import os
+import threading
+import uuid
+from contextlib import nullcontext
+import pandas as pd
+from ..config import EMBEDDED_DB_CONFIG
+from ..fingerprint import FINGERPRINT_COLUMN
+from .base import StorageBackend
+from .sqlite_backend import embedded_path, file_stamp
+
+try:
+    import duckdb
+except ImportError: # optional dependency; get_backend reports it when DB_CONFIG asks for DuckDB
+    duckdb = None
+
+class DuckDBBackend(StorageBackend):
+    # Bulk path: the DataFrame is registered as a view and copied with one INSERT ... SELECT, so rows never
+    # become Python tuples. Duplicates are filtered with an anti-join on the fingerprint instead of a unique
+    # index: DuckDB cannot rename tables that carry indexes, which the staging swap relies on.
+    name = 'duckdb'
+    TYPE_NAMES = {'int': 'BIGINT', 'float': 'DOUBLE', 'bool': 'BOOLEAN', 'datetime': 'TIMESTAMP', 'string': 'VARCHAR'}
+    # One database instance per file, shared by every connection in the process (DuckDB allows a single writer process).
+    _databases = {}
+    _databases_lock = threading.Lock()
+
+    def __init__(self, db_config, status_callback=None, metrics=None, insert_engine=None):
+        super().__init__(db_config, status_callback, metrics, insert_engine)
+        self.path = embedded_path(db_config, 'duckdb')
+        self.errors = (duckdb.Error,)
+
+    # --- Connections ---
+    def describe(self):
+        return self.path
+
+    def _database(self, create_db):
+        with self._databases_lock:
+            database = self._databases.get(self.path)
+            if database is None:
+                if not create_db and not os.path.exists(self.path):
+                    raise duckdb.IOException(f"데이터베이스 파일이 없습니다: {self.path}")
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                config = {'threads': EMBEDDED_DB_CONFIG['duckdb_threads']} if EMBEDDED_DB_CONFIG['duckdb_threads'] else {}
+                database = duckdb.connect(self.path, config=config)
+                self._databases[self.path] = database
+            return database
+
+    def acquire(self, create_db=False):
+        conn = self._database(create_db).cursor()
+        conn.begin()
+        return conn
+
+    def release(self, conn):
+        try:
+            conn.rollback()
+        except duckdb.Error:
+            pass
+        conn.close()
+
+    def commit(self, conn):
+        conn.commit()
+        conn.begin()
+
+    def rollback(self, conn):
+        conn.rollback()
+        conn.begin()
+
+    def cursor(self, conn):
+        # Statements run on the connection itself; nullcontext keeps the `with` blocks in DatabaseManager uniform.
+        return nullcontext(conn)
+
+    def connection_of(self, cursor):
+        return cursor
+
+    def affected_rows(self, cursor):
+        # DuckDB returns the changed row count as the result of INSERT/UPDATE/DELETE.
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+    def is_missing_table_error(self, error):
+        return isinstance(error, duckdb.CatalogException) and 'does not exist' in str(error)
+
+    # --- Catalog ---
+    def table_exists(self, cursor, table_name):
+        cursor.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = current_schema() AND table_name = ?", (table_name,))
+        return cursor.fetchone()[0] > 0
+
+    def has_column(self, cursor, table_name, column_name):
+        cursor.execute("SELECT COUNT(*) FROM information_schema.columns WHERE table_schema = current_schema() AND table_name = ? AND column_name = ?",
+                       (table_name, column_name))
+        return cursor.fetchone()[0] > 0
+
+    def list_tables(self, cursor):
+        cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema() AND table_type = 'BASE TABLE' ORDER BY table_name")
+        return [row[0] for row in cursor.fetchall()]
+
+    def column_types(self, cursor, table_name):
+        cursor.execute("SELECT column_name, data_type FROM information_schema.columns WHERE table_schema = current_schema() AND table_name = ? ORDER BY ordinal_position",
+                       (table_name,))
+        return cursor.fetchall()
+
+    def indexed_columns(self, cursor, table_name):
+        # No explicit indexes are created (see the class comment); `id` is always filled by insert_frame
+        # and its row-group min/max statistics make range scans on it cheap.
+        return {'id': True}
+
+    def table_version(self, cursor, table_name):
+        return file_stamp(self.path, '.wal')
+
+    # --- Type mapping and DDL ---
+    def column_type_sql(self, column_type):
+        if column_type.kind == 'decimal':
+            scale = min(column_type.scale or 0, 18)
+            return f"DECIMAL({min(38, 20 + scale)}, {scale})"
+        return self.TYPE_NAMES.get(column_type.kind, 'VARCHAR')
+
+    def id_column_sql(self):
+        # Filled in by insert_frame from max(id); a sequence default would also block renaming the table.
+        return f"{self.quote('id')} BIGINT"
+
+    def fingerprint_column_sql(self):
+        return f"{self.quote(FINGERPRINT_COLUMN)} VARCHAR NOT NULL"
+
+    def fingerprint_index_sql(self, table_name):
+        return None
+
+    def add_fingerprint_index(self, cursor, table_name):
+        pass
+
+    # --- Inserts ---
+    def insert_frame(self, cursor, table_name, data, safe_columns, fingerprints=None, progress=None, check_cancel=None):
+        if check_cancel: check_cancel()
+        frame = pd.DataFrame({safe_col: data.iloc[:, i] for i, safe_col in enumerate(safe_columns[:data.shape[1]])})
+        if fingerprints is not None:
+            frame[FINGERPRINT_COLUMN] = fingerprints.to_numpy()
+            # The anti-join below only sees stored rows, so repeats inside the frame are dropped here.
+            frame = frame[~frame[FINGERPRINT_COLUMN].duplicated()]
+
+        table = self.quote(table_name)
+        view_name = f"incoming_{uuid.uuid4().hex[:8]}"
+        columns_str = ", ".join(self.quote(col) for col in safe_columns)
+        source_str = ", ".join(f"s.{self.quote(col)}" for col in safe_columns)
+        insert_query = (f"INSERT INTO {table} ({self.quote('id')}, {columns_str}) "
+                        f"SELECT (SELECT COALESCE(MAX({self.quote('id')}), 0) FROM {table}) + row_number() OVER (), {source_str} "
+                        f"FROM {self.quote(view_name)} s")
+        if fingerprints is not None:
+            fp = self.quote(FINGERPRINT_COLUMN)
+            insert_query += f" WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE t.{fp} = s.{fp})"
+
+        cursor.register(view_name, frame)
+        try:
+            with self.metrics.span('dataframe_append', rows=len(frame)):
+                cursor.execute(insert_query)
+                inserted_rows = self.affected_rows(cursor)
+        finally:
+            cursor.unregister(view_name)
+        if progress: progress.advance(len(data))
+        return inserted_rows
@@ -0,0 +1,257 @@
+import os
+import tempfile
+import pandas as pd
+import pymysql
+import pymysql.cursors
+from ..config import INSERT_CONFIG, SCHEMA_CONFIG
+from ..connection_pool import ConnectionPool
+from ..fingerprint import FINGERPRINT_COLUMN, FINGERPRINT_LENGTH
+from ..schema_planner import SchemaPlanner
+from .base import StorageBackend
+
+# DB_CONFIG keys that select or configure a backend and must not reach pymysql.connect.
+NON_DRIVER_KEYS = ('backend', 'path')
+
+class MySQLBackend(StorageBackend):
+    name = 'mysql'
+    placeholder = '%s'
+    errors = (pymysql.Error,)
+    # MySQL errors meaning LOAD DATA LOCAL INFILE is disabled on the server or the client.
+    LOCAL_INFILE_DISABLED_ERRORS = (1148, 2068, 3948)
+    MISSING_TABLE_ERROR = 1146
+
+    def __init__(self, db_config, status_callback=None, metrics=None, insert_engine=None):
+        super().__init__(db_config, status_callback, metrics, insert_engine)
+        self._bulk_load_available = self.insert_engine == 'load_data'
+        self._packet_limit = None
+        pool_config = {k: v for k, v in db_config.items() if k not in NON_DRIVER_KEYS}
+        if self.insert_engine == 'load_data':
+            pool_config.setdefault('local_infile', True)
+        self._pool = ConnectionPool.for_config(pool_config)
+
+    # --- Connections ---
+    @property
+    def database_ready(self):
+        return self._pool.database_ready
+
+    def acquire(self, create_db=False):
+        return self._pool.acquire(create_db=create_db)
+
+    def release(self, conn):
+        # Returns the connection to the shared pool instead of closing it.
+        self._pool.release(conn)
+
+    def cursor(self, conn):
+        return conn.cursor()
+
+    def is_missing_table_error(self, error):
+        return bool(error.args) and error.args[0] == self.MISSING_TABLE_ERROR
+
+    # --- Dialect and catalog ---
+    def quote(self, identifier):
+        return f"`{identifier}`"
+
+    def table_exists(self, cursor, table_name):
+        cursor.execute("SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table_name,))
+        return cursor.fetchone()[0] > 0
+
+    def has_column(self, cursor, table_name, column_name):
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+            (table_name, column_name))
+        return cursor.fetchone()[0] > 0
+
+    def list_tables(self, cursor):
+        cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE' ORDER BY TABLE_NAME")
+        return [row[0] for row in cursor.fetchall()]
+
+    def column_types(self, cursor, table_name):
+        cursor.execute("SELECT COLUMN_NAME, COLUMN_TYPE FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+                       (table_name,))
+        return list(cursor.fetchall())
+
+    def indexed_columns(self, cursor, table_name):
+        cursor.execute("SELECT s.COLUMN_NAME, c.IS_NULLABLE FROM information_schema.STATISTICS s "
+                       "JOIN information_schema.COLUMNS c ON c.TABLE_SCHEMA = s.TABLE_SCHEMA AND c.TABLE_NAME = s.TABLE_NAME AND c.COLUMN_NAME = s.COLUMN_NAME "
+                       "WHERE s.TABLE_SCHEMA = DATABASE() AND s.TABLE_NAME = %s AND s.SEQ_IN_INDEX = 1", (table_name,))
+        return {column: nullable == 'NO' for column, nullable in cursor.fetchall()}
+
+    def streaming_cursor(self, conn):
+        # SSCursor (unbuffered): rows are read off the socket as they are fetched.
+        return conn.cursor(pymysql.cursors.SSCursor)
+
+    def table_version(self, cursor, table_name):
+        # MySQL 8 caches information_schema table statistics for a day by default; ask for fresh values where supported.
+        try:
+            cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+        except pymysql.Error:
+            pass
+        cursor.execute("SELECT CREATE_TIME, UPDATE_TIME, AUTO_INCREMENT, TABLE_ROWS FROM information_schema.TABLES "
+                       "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table_name,))
+        stats = cursor.fetchone()
+        # MAX over the primary key is an index lookup and catches inserts even when the statistics lag.
+        cursor.execute(f"SELECT MAX(`id`) FROM `{table_name}`")
+        return tuple(str(value) for value in stats or ()) + (cursor.fetchone()[0],)
+
+    def rename_tables(self, cursor, renames):
+        # A single RENAME TABLE swaps both names atomically, so readers never see a missing or partial table.
+        cursor.execute("RENAME TABLE " + ", ".join(f"`{old_name}` TO `{new_name}`" for old_name, new_name in renames))
+
+    # --- Type mapping and DDL ---
+    def column_type_sql(self, column_type):
+        if column_type.kind == 'int': return 'BIGINT'
+        if column_type.kind == 'float': return 'DOUBLE'
+        if column_type.kind == 'decimal':
+            scale = min(column_type.scale or 0, 30)
+            return f"DECIMAL({min(65, 20 + scale)}, {scale})"
+        if column_type.kind == 'datetime': return 'DATETIME'
+        if column_type.kind == 'bool': return 'BOOLEAN'
+        return 'VARCHAR(255)'
+
+    def column_definitions(self, df, column_mapping, schema=None, exact=True):
+        if not SCHEMA_CONFIG['right_size']:
+            return super().column_definitions(df, column_mapping, schema, exact)
+        with self.metrics.span('schema_plan', rows=len(df)):
+            plan = SchemaPlanner(exact=exact).plan(df, column_mapping, schema)
+        self._update_status(plan.width_report())
+        return [f"`{column.safe_name}` {column.sql_type}" for column in plan.columns]
+
+    def widen_columns(self, cursor, table_name, df, column_mapping):
+        # Planned types are sized to the first load, so strict mode would reject longer or larger appended values.
+        # Must run before the transaction writes any row: ALTER TABLE commits implicitly.
+        cursor.execute("SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                       (table_name,))
+        current = {}
+        for column, column_type, nullable in cursor.fetchall():
+            if isinstance(column_type, bytes):
+                column_type = column_type.decode('utf-8')
+            current[column] = (column_type, nullable)
+        planner = SchemaPlanner()
+        changes = []
+        for col_name, safe_col_name in column_mapping:
+            if safe_col_name not in current:
+                continue
+            column_type, nullable = current[safe_col_name]
+            new_type = planner.widen(column_type, df[col_name])
+            if new_type:
+                changes.append((safe_col_name, column_type, new_type, nullable))
+        if changes:
+            cursor.execute(f"ALTER TABLE `{table_name}` " + ", ".join(
+                f"MODIFY `{column}` {new_type} {'NULL' if nullable == 'YES' else 'NOT NULL'}" for column, _, new_type, nullable in changes))
+            self._update_status(f"'{table_name}' 컬럼 타입 확장: " + ", ".join(f"{column} {old_type} -> {new_type}" for column, old_type, new_type, _ in changes))
+        return changes
+
+    def id_column_sql(self):
+        return "`id` INT AUTO_INCREMENT PRIMARY KEY"
+
+    def fingerprint_column_sql(self):
+        return f"`{FINGERPRINT_COLUMN}` CHAR({FINGERPRINT_LENGTH}) NOT NULL"
+
+    def fingerprint_index_sql(self, table_name):
+        return f"UNIQUE KEY `uq{FINGERPRINT_COLUMN}` (`{FINGERPRINT_COLUMN}`)"
+
+    def add_fingerprint_index(self, cursor, table_name):
+        cursor.execute(f"ALTER TABLE `{table_name}` ADD UNIQUE KEY `uq{FINGERPRINT_COLUMN}` (`{FINGERPRINT_COLUMN}`)")
+
+    # --- Inserts ---
+    def insert_sql(self, table_name, safe_columns, fingerprinted):
+        insert_query = super().insert_sql(table_name, safe_columns, fingerprinted)
+        if fingerprinted:
+            # No-op update instead of INSERT IGNORE so that data errors are still raised, not downgraded to warnings.
+            insert_query += " ON DUPLICATE KEY UPDATE `id` = `id`"
+        return insert_query
+
+    def _max_allowed_packet(self, cursor):
+        if self._packet_limit is None:
+            cursor.execute("SELECT @@max_allowed_packet")
+            self._packet_limit = int(cursor.fetchone()[0])
+        return self._packet_limit
+
+    def _batch_limits(self, cursor, df):
+        # Rows per batch from INSERT_CONFIG, tightened so a batch stays under the byte budget.
+        # The byte budget defaults to a share of the server's max_allowed_packet.
+        batch_bytes = INSERT_CONFIG['batch_bytes']
+        if not batch_bytes:
+            batch_bytes = min(int(self._max_allowed_packet(cursor) * INSERT_CONFIG['packet_fill_ratio']), INSERT_CONFIG['max_batch_bytes'])
+        sample = df.head(INSERT_CONFIG['row_size_sample'])
+        if sample.empty:
+            return INSERT_CONFIG['batch_rows'], batch_bytes, None
+        # Encoded value length plus quoting/separator overhead per value, plus the fingerprint.
+        value_bytes = sum(sample[col].astype(str).str.encode('utf-8').str.len().sum() for col in sample.columns)
+        row_bytes = value_bytes / len(sample) + 4 * len(sample.columns) + FINGERPRINT_LENGTH + 8
+        batch_rows = max(1, min(INSERT_CONFIG['batch_rows'], int(batch_bytes // row_bytes)))
+        return batch_rows, batch_bytes, row_bytes
+
+    def insert_frame(self, cursor, table_name, data, safe_columns, fingerprints=None, progress=None, check_cancel=None):
+        fingerprinted = fingerprints is not None
+        insert_query = self.insert_sql(table_name, safe_columns, fingerprinted)
+        batch_rows, batch_bytes, row_bytes = self._batch_limits(cursor, data)
+        # pymysql splits executemany into multi-row INSERTs no longer than this.
+        cursor.max_stmt_length = batch_bytes
+        inserted_rows = 0
+        for start in range(0, len(data), batch_rows):
+            if check_cancel: check_cancel()
+            batch = data.iloc[start:start + batch_rows]
+            batch_inserted = None
+            if fingerprinted and self._bulk_load_available:
+                batch_inserted = self._bulk_load(cursor, batch, table_name, safe_columns, fingerprints.iloc[start:start + batch_rows].tolist())
+            if batch_inserted is None:
+                rows = self.rows_for_insert(batch)
+                if fingerprinted:
+                    rows = [row + (fp,) for row, fp in zip(rows, fingerprints.iloc[start:start + batch_rows].tolist())]
+                with self.metrics.span('executemany', rows=len(rows), nbytes=int(row_bytes * len(rows)) if row_bytes else None):
+                    cursor.executemany(insert_query, rows)
+                batch_inserted = cursor.rowcount if fingerprinted else len(rows)
+            inserted_rows += batch_inserted
+            if INSERT_CONFIG['commit_every_batch']:
+                with self.metrics.span('commit'):
+                    cursor.connection.commit()
+            if progress: progress.advance(len(batch))
+        return inserted_rows
+
+    def _to_load_data_text(self, series):
+        # Renders one column in LOAD DATA's default format: backslash escapes and \N for NULL.
+        if pd.api.types.is_bool_dtype(series.dtype):
+            text = series.astype('Int8').astype(str)
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            text = series.dt.strftime('%Y-%m-%d %H:%M:%S')
+        elif pd.api.types.is_float_dtype(series.dtype):
+            text = series.astype('float64').astype(str) # float32 of a compacted frame prints its exact float64 value
+        else:
+            text = series.astype(str)
+            if not pd.api.types.is_numeric_dtype(series.dtype):
+                text = (text.str.replace('\\', '\\\\', regex=False)
+                            .str.replace('\t', '\\t', regex=False)
+                            .str.replace('\n', '\\n', regex=False)
+                            .str.replace('\r', '\\r', regex=False))
+        return text.astype(object).where(series.notna(), '\\N')
+
+    def _bulk_load(self, cursor, df, table_name, safe_columns, fingerprints):
+        # Writes the rows to a temporary tab-separated file and loads it with LOAD DATA LOCAL INFILE.
+        # Returns the number of inserted rows, or None when the server refuses local infile.
+        with self.metrics.span('stringify', rows=len(df)):
+            columns = [self._to_load_data_text(df[col]) for col in df.columns]
+            columns.append(pd.Series(fingerprints, index=df.index, dtype=object))
+            lines = columns[0].str.cat(others=columns[1:], sep='\t') if len(columns) > 1 else columns[0]
+
+        charset = self.db_config.get('charset', 'utf8mb4')
+        fd, path = tempfile.mkstemp(suffix='.tsv', prefix='prechart2db_')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+                f.write('\n'.join(lines.tolist()))
+                f.write('\n')
+            columns_str = ", ".join([f"`{col}`" for col in safe_columns])
+            load_query = (f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table_name}` CHARACTER SET {charset} "
+                          f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({columns_str})")
+            self._update_status(f"LOAD DATA LOCAL INFILE로 {len(df)}행을 테이블 '{table_name}'에 적재합니다.")
+            with self.metrics.span('load_data_infile', rows=len(df), nbytes=os.path.getsize(path)):
+                cursor.execute(load_query, (path,))
+            return cursor.rowcount
+        except pymysql.Error as e:
+            if e.args and e.args[0] in self.LOCAL_INFILE_DISABLED_ERRORS:
+                self._bulk_load_available = False
+                self._update_status(f"서버에서 LOAD DATA LOCAL INFILE이 비활성화되어 있어 executemany 방식으로 전환합니다. ({e})")
+                return None
+            raise
+        finally:
+            os.remove(path)
@@ -0,0 +1,145 @@
+import datetime
+import decimal
+import os
+import sqlite3
+import uuid
+import numpy as np
+import pandas as pd
+from ..config import EMBEDDED_DB_CONFIG
+from ..fingerprint import FINGERPRINT_COLUMN
+from .base import StorageBackend
+
+# Bind the NumPy/pandas values rows_for_insert can produce; sqlite3 only knows the Python builtins.
+for _type in (np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64):
+    sqlite3.register_adapter(_type, int)
+for _type in (np.float16, np.float32, np.float64):
+    sqlite3.register_adapter(_type, float)
+sqlite3.register_adapter(np.bool_, bool)
+sqlite3.register_adapter(decimal.Decimal, str)
+sqlite3.register_adapter(pd.Timestamp, lambda value: value.isoformat(sep=' '))
+sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(sep=' '))
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+
+def embedded_path(db_config, extension):
+    # DB_CONFIG['path'] if set, otherwise <EMBEDDED_DB_CONFIG directory>/<database>.<extension>.
+    if db_config.get('path'):
+        return db_config['path']
+    return os.path.join(EMBEDDED_DB_CONFIG['directory'], f"{db_config.get('database') or 'prechart2db'}.{extension}")
+
+def file_stamp(path, wal_suffix):
+    # (mtime, size) of the database file and its write-ahead log: any committed write changes one of them.
+    # An empty log is left out, since opening a connection recreates it without changing any data.
+    stamp = []
+    for file_path in (path, path + wal_suffix):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((stat.st_mtime_ns, stat.st_size) if stat.st_size else None)
+    return tuple(stamp)
+
+class SQLiteBackend(StorageBackend):
+    # Bulk path: executemany inside one explicit transaction, with WAL and relaxed fsync from the configured PRAGMAs.
+    name = 'sqlite'
+    errors = (sqlite3.Error,)
+    TYPE_NAMES = {'int': 'INTEGER', 'float': 'REAL', 'decimal': 'REAL', 'bool': 'INTEGER', 'datetime': 'TEXT', 'string': 'TEXT'}
+
+    def __init__(self, db_config, status_callback=None, metrics=None, insert_engine=None):
+        super().__init__(db_config, status_callback, metrics, insert_engine)
+        self.path = embedded_path(db_config, 'sqlite3')
+
+    # --- Connections ---
+    def describe(self):
+        return self.path
+
+    def acquire(self, create_db=False):
+        if self.path != ':memory:':
+            if not create_db and not os.path.exists(self.path):
+                raise sqlite3.OperationalError(f"데이터베이스 파일이 없습니다: {self.path}")
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        # Autocommit mode at the driver level; transactions are opened explicitly so DDL takes part in them too.
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        try:
+            for pragma, value in EMBEDDED_DB_CONFIG['sqlite_pragmas'].items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+            conn.execute("BEGIN")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        conn.close()
+
+    def commit(self, conn):
+        conn.commit()
+        conn.execute("BEGIN")
+
+    def rollback(self, conn):
+        conn.rollback()
+        conn.execute("BEGIN")
+
+    def is_missing_table_error(self, error):
+        return isinstance(error, sqlite3.OperationalError) and 'no such table' in str(error)
+
+    # --- Catalog ---
+    def table_exists(self, cursor, table_name):
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+        return cursor.fetchone()[0] > 0
+
+    def has_column(self, cursor, table_name, column_name):
+        cursor.execute(f"PRAGMA table_info({self.quote(table_name)})")
+        return any(row[1] == column_name for row in cursor.fetchall())
+
+    def list_tables(self, cursor):
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")
+        return [row[0] for row in cursor.fetchall()]
+
+    def column_types(self, cursor, table_name):
+        cursor.execute(f"PRAGMA table_info({self.quote(table_name)})")
+        return [(row[1], row[2]) for row in cursor.fetchall()]
+
+    def indexed_columns(self, cursor, table_name):
+        cursor.execute(f"PRAGMA table_info({self.quote(table_name)})")
+        info = cursor.fetchall()
+        not_null = {row[1]: bool(row[3]) or row[5] > 0 for row in info}
+        # `id INTEGER PRIMARY KEY` is the rowid itself and does not appear in index_list.
+        leading = {row[1] for row in info if row[5] == 1}
+        cursor.execute(f"PRAGMA index_list({self.quote(table_name)})")
+        for index_name in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"PRAGMA index_info({self.quote(index_name)})")
+            leading.update(row[2] for row in cursor.fetchall() if row[0] == 0 and row[2])
+        return {column: not_null.get(column, False) for column in leading}
+
+    def table_version(self, cursor, table_name):
+        return file_stamp(self.path, '-wal')
+
+    # --- Aggregates ---
+    def floor_sql(self, expression):
+        # FLOOR needs the optional math extension; truncation is the same for the non-negative offsets used here.
+        return f"CAST({expression} AS INTEGER)"
+
+    def stddev_sql(self, expression):
+        return None
+
+    # --- Type mapping and DDL ---
+    def column_type_sql(self, column_type):
+        return self.TYPE_NAMES.get(column_type.kind, 'TEXT')
+
+    def add_fingerprint_index(self, cursor, table_name):
+        # Index names are schema-wide in SQLite and follow the table through renames, so each gets a unique suffix.
+        index_name = f"uq{FINGERPRINT_COLUMN}_{uuid.uuid4().hex[:8]}"
+        cursor.execute(f"CREATE UNIQUE INDEX {self.quote(index_name)} ON {self.quote(table_name)} ({self.quote(FINGERPRINT_COLUMN)})")
+
+    # --- Inserts ---
+    def insert_sql(self, table_name, safe_columns, fingerprinted):
+        insert_query = super().insert_sql(table_name, safe_columns, fingerprinted)
+        if fingerprinted:
+            # Skips only uniqueness conflicts; NOT NULL and type errors still raise, unlike INSERT OR IGNORE.
+            insert_query += " ON CONFLICT DO NOTHING"
+        return insert_query
@@ -0,0 +1,159 @@
+import glob
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import pandas as pd
+from .config import INGEST_CONFIG, POOL_CONFIG
+from .data_importer import DataImporter
+from .database_manager import DatabaseManager
+
+def _parse_file(file_path, load_options):
+    # Runs in a worker process; must stay a module-level function so it can be pickled.
+    messages = []
+    importer = DataImporter(status_callback=messages.append)
+    started_at = time.perf_counter()
+    df = importer.load_data(file_path, **load_options)
+    return df, importer.last_schema, time.perf_counter() - started_at, messages
+
+class BatchIngestor:
+    # Parses files in a process pool and loads them over the shared connection pool with bounded concurrency.
+    def __init__(self, db_config=None, status_callback=None, parse_workers=None, db_workers=None, insert_engine=None, load_options=None):
+        self.db_config = db_config
+        self.status_callback = status_callback if status_callback else print
+        self.parse_workers = parse_workers if parse_workers else (INGEST_CONFIG['parse_workers'] or os.cpu_count() or 1)
+        # More DB workers than pooled connections would only queue on checkout.
+        self.db_workers = min(db_workers if db_workers else INGEST_CONFIG['db_workers'], POOL_CONFIG['max_size'])
+        self.insert_engine = insert_engine
+        self.load_options = load_options if load_options else {}
+        self._status_lock = threading.Lock()
+
+    def _update_status(self, message):
+        with self._status_lock:
+            self.status_callback(message)
+
+    def collect_files(self, inputs):
+        files = []
+        for item in inputs:
+            if os.path.isdir(item):
+                for pattern in INGEST_CONFIG['file_patterns']:
+                    files.extend(glob.glob(os.path.join(item, pattern)))
+            else:
+                files.extend(glob.glob(item))
+        # De-duplicate while keeping a stable order.
+        return sorted(set(os.path.abspath(path) for path in files))
+
+    def _load_into_db(self, file_path, mode, df, schema):
+        table_name = os.path.splitext(os.path.basename(file_path))[0]
+        prefix = f"[{os.path.basename(file_path)}] "
+        db_manager = DatabaseManager(db_config=self.db_config, insert_engine=self.insert_engine,
+                                     status_callback=lambda msg: self._update_status(prefix + msg))
+        if mode == 'append':
+            return db_manager.append_new_data(df, table_name)
+        return db_manager.overwrite_table(df, table_name, schema=schema)
+
+    def _load_streaming(self, file_path, mode):
+        # 'tail' and 'sheets' modes stream the file on the DB worker thread instead of parsing it whole in a worker
+        # process: 'tail' reads only the bytes added since the last run, 'sheets' loads every sheet of a workbook
+        # into its own table in one pass.
+        table_name = os.path.splitext(os.path.basename(file_path))[0]
+        prefix = f"[{os.path.basename(file_path)}] "
+        db_manager = DatabaseManager(db_config=self.db_config, insert_engine=self.insert_engine,
+                                     status_callback=lambda msg: self._update_status(prefix + msg))
+        importer = DataImporter(status_callback=lambda msg: self._update_status(prefix + msg))
+        started_at = time.perf_counter()
+        if mode == 'sheets':
+            success, message = db_manager.load_excel_sheets(importer, file_path, table_name)
+        else:
+            options = {key: value for key, value in self.load_options.items() if key in ('csv_delimiter', 'csv_encoding')}
+            success, message = db_manager.append_file_tail(importer, file_path, table_name, options)
+        return success, message, db_manager.last_load_rows, time.perf_counter() - started_at
+
+    def run(self, files, default_mode='overwrite', file_modes=None):
+        # `file_modes` maps a file name (with or without extension) to 'overwrite', 'append', 'tail' or 'sheets'.
+        file_modes = file_modes if file_modes else {}
+        results = {}
+        # Parsed frames waiting for a DB worker are the memory high-water mark, so at most this many files are
+        # parsing, parsed or loading at once. Further parses are submitted as earlier files finish.
+        max_in_flight = self.parse_workers + self.db_workers
+
+        def mode_for(file_path):
+            name = os.path.basename(file_path)
+            return file_modes.get(name, file_modes.get(os.path.splitext(name)[0], default_mode))
+
+        def streaming_job(file_path, mode):
+            try:
+                success, message, rows, db_seconds = self._load_streaming(file_path, mode)
+                results[file_path].update(success=success, message=message, rows=rows, db_seconds=db_seconds)
+            except Exception as e:
+                results[file_path].update(message=f"DB 적재 중 예상치 못한 오류: {e}")
+
+        def db_job(file_path, df, schema, parse_seconds):
+            try:
+                started_at = time.perf_counter()
+                success, message = self._load_into_db(file_path, mode_for(file_path), df, schema)
+                results[file_path].update(success=success, message=message, rows=len(df),
+                                          parse_seconds=parse_seconds, db_seconds=time.perf_counter() - started_at)
+            except Exception as e:
+                results[file_path].update(message=f"DB 적재 중 예상치 못한 오류: {e}", rows=len(df), parse_seconds=parse_seconds)
+
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as parse_pool, \
+                ThreadPoolExecutor(max_workers=self.db_workers) as db_pool:
+            to_parse = []
+            streaming_futures = []
+            for file_path in files:
+                results[file_path] = {'file': os.path.basename(file_path), 'mode': mode_for(file_path), 'success': False,
+                                      'message': '', 'rows': 0, 'parse_seconds': 0.0, 'db_seconds': 0.0}
+                if mode_for(file_path) in ('tail', 'sheets'):
+                    streaming_futures.append(db_pool.submit(streaming_job, file_path, mode_for(file_path)))
+                else:
+                    to_parse.append(file_path)
+
+            parse_futures = {}
+            db_futures = set()
+            next_file = 0
+            while next_file < len(to_parse) or parse_futures or db_futures:
+                while next_file < len(to_parse) and len(parse_futures) + len(db_futures) < max_in_flight:
+                    file_path = to_parse[next_file]
+                    next_file += 1
+                    parse_futures[parse_pool.submit(_parse_file, file_path, self.load_options)] = file_path
+                    self._update_status(f"파싱 대기열에 추가: {os.path.basename(file_path)}")
+                done, _ = wait(set(parse_futures) | db_futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in db_futures:
+                        db_futures.discard(future)
+                        continue
+                    file_path = parse_futures.pop(future)
+                    try:
+                        df, schema, parse_seconds, messages = future.result()
+                    except Exception as e:
+                        df, schema, parse_seconds, messages = None, None, 0.0, [f"파싱 프로세스 오류: {e}"]
+                    if df is None:
+                        results[file_path].update(message=messages[-1] if messages else "파일을 읽지 못했습니다.")
+                        continue
+                    self._update_status(f"[{os.path.basename(file_path)}] 파싱 완료: {len(df):,}행, {parse_seconds:.2f}초")
+                    db_futures.add(db_pool.submit(db_job, file_path, df, schema, parse_seconds))
+            for future in streaming_futures:
+                future.result()
+
+        return [results[file_path] for file_path in files]
+
+    def format_summary(self, results):
+        rows = []
+        for result in results:
+            total_seconds = result['parse_seconds'] + result['db_seconds']
+            rows.append({
+                '파일': result['file'],
+                '모드': result['mode'],
+                '결과': '성공' if result['success'] else '실패',
+                '행 수': result['rows'],
+                '파싱(초)': round(result['parse_seconds'], 2),
+                'DB(초)': round(result['db_seconds'], 2),
+                '행/초': round(result['rows'] / total_seconds) if total_seconds else 0,
+            })
+        summary = pd.DataFrame(rows)
+        failures = [f"- {result['file']}: {result['message']}" for result in results if not result['success']]
+        text = summary.to_string(index=False) if rows else "처리할 파일이 없습니다."
+        if failures:
+            text += "\n\n실패한 파일:\n" + "\n".join(failures)
+        return text
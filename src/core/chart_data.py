@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+from .config import CHART_CONFIG
+
+# Chart inputs for a numeric column computed once with vectorised NumPy, so drawing only ever touches
+# a few hundred bins, quartiles and curve points no matter how many rows the column has.
+
+def numeric_values(series):
+    # Non-null values as float64 (nullable integer and boolean columns included).
+    return pd.to_numeric(series, errors='coerce').dropna().to_numpy(dtype='float64')
+
+def histogram_bins(values, max_bins=None):
+    # (edges, counts) with NumPy's 'auto' bin rule (as seaborn's histplot uses), capped at `max_bins`.
+    max_bins = max_bins if max_bins else CHART_CONFIG['histogram_max_bins']
+    if not len(values):
+        return np.array([]), np.array([], dtype='int64')
+    edges = np.histogram_bin_edges(values, bins='auto')
+    if len(edges) - 1 > max_bins:
+        edges = np.histogram_bin_edges(values, bins=max_bins)
+    counts, edges = np.histogram(values, bins=edges)
+    return edges, counts
+
+def box_stats(values, label, max_fliers=None):
+    # Quartiles and Tukey whiskers (the most extreme values within 1.5 IQR) in the form matplotlib's Axes.bxp
+    # takes. Outliers beyond the whiskers are capped to an evenly spaced subset of `max_fliers` points.
+    max_fliers = max_fliers if max_fliers is not None else CHART_CONFIG['max_fliers']
+    if not len(values):
+        return None
+    q1, median, q3 = np.quantile(values, (0.25, 0.5, 0.75))
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    fliers = np.sort(values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)])
+    if len(fliers) > max_fliers:
+        # Evenly spaced ranks keep the extremes (first and last) and the shape of the tail.
+        fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).round().astype('int64')]
+    return {
+        'label': label, 'med': float(median), 'q1': float(q1), 'q3': float(q3),
+        'whislo': float(inside.min()), 'whishi': float(inside.max()),
+        'fliers': fliers,
+    }
+
+def kde_curve(values, edges, sample_size=None, grid_points=None, rng=None):
+    # Gaussian KDE (Scott's bandwidth) fitted on at most `sample_size` random values and scaled to histogram
+    # counts over `edges`, like histplot(kde=True). Cost is sample_size x grid_points, independent of the row count.
+    sample_size = sample_size if sample_size else CHART_CONFIG['kde_sample_size']
+    grid_points = grid_points if grid_points else CHART_CONFIG['kde_grid_points']
+    if len(values) < 2 or len(edges) < 2:
+        return None
+    rng = rng if rng is not None else np.random.default_rng(0)
+    sample = rng.choice(values, size=sample_size, replace=False) if len(values) > sample_size else values
+    bandwidth = float(np.std(sample, ddof=1)) * len(sample) ** (-1 / 5)
+    if not bandwidth > 0:
+        return None
+    grid = np.linspace(edges[0], edges[-1], grid_points)
+    density = np.zeros(grid_points)
+    # Blocks of the sample keep the (block x grid) matrix small.
+    for start in range(0, len(sample), 1000):
+        offsets = (grid[None, :] - sample[start:start + 1000, None]) / bandwidth
+        density += np.exp(-0.5 * offsets * offsets).sum(axis=0)
+    density /= len(sample) * bandwidth * np.sqrt(2 * np.pi)
+    bin_width = (edges[-1] - edges[0]) / (len(edges) - 1)
+    return grid, density * len(values) * bin_width
+
+def numeric_chart_data(series, label=None):
+    # Everything the histogram + box plot figure needs for one numeric column.
+    values = numeric_values(series)
+    edges, counts = histogram_bins(values)
+    return {'edges': edges, 'counts': counts, 'box': box_stats(values, label if label is not None else series.name),
+            'kde': kde_curve(values, edges)}
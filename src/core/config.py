@@ -1,5 +1,8 @@
+import os
+
 # --- Database Configuration ---
 DB_CONFIG = {
+    'backend': 'mysql',  # "mysql", "sqlite" or "duckdb" (see EMBEDDED_DB_CONFIG for the file-based ones)
     'host': '127.0.0.1',
     'user': 'root',
     'password': '0000',
@@ -7,6 +10,111 @@ DB_CONFIG = {
     'charset': 'utf8'
 }
 
+# --- Embedded Database Configuration (DB_CONFIG['backend'] = "sqlite" / "duckdb") ---
+EMBEDDED_DB_CONFIG = {
+    # Database files are <directory>/<database>.sqlite3 or .duckdb unless DB_CONFIG has a 'path'
+    "directory": os.path.join(os.path.expanduser("~"), ".prechart2db", "databases"),
+    "sqlite_pragmas": {
+        "journal_mode": "WAL",  # Readers are not blocked by a running load
+        "synchronous": "NORMAL",  # fsync at checkpoints only; safe with WAL
+        "temp_store": "MEMORY",
+        "cache_size": -64 * 1024  # Negative values are KiB: 64 MiB page cache
+    },
+    "duckdb_threads": None  # None lets DuckDB use every core
+}
+
+# --- Data Import Configuration ---
+IMPORT_CONFIG = {
+    "chunksize": 50000  # Rows per chunk in streaming mode
+}
+
+# --- Excel Reader Configuration ---
+EXCEL_CONFIG = {
+    "engine": "auto",  # "auto" (python-calamine if installed, else openpyxl read-only), "calamine", "openpyxl" or "pandas"
+    "chunk_rows": 50000  # Rows per DataFrame handed out while a sheet is streamed
+}
+
+# --- DataFrame Compaction Configuration (after DataImporter.load_data) ---
+COMPACTION_CONFIG = {
+    "enabled": True,
+    "category_max_ratio": 0.5,  # Text columns with at most this share of distinct values become 'category'
+    "downcast_integers": True,  # Smallest integer width that holds the column's min and max
+    "downcast_floats": True,  # float32 only when every value survives the round trip exactly
+    "arrow_strings": True  # Remaining text columns use pandas' Arrow-backed string dtype when pyarrow is installed
+}
+
+# --- Type Inference Configuration ---
+INFERENCE_CONFIG = {
+    "sample_size": 1000  # Values per column used to rule out types before the full-column check
+}
+
+# --- Schema Planning Configuration ---
+SCHEMA_CONFIG = {
+    "right_size": True,  # Size column types from column statistics; False keeps BIGINT/DOUBLE/VARCHAR(255)
+    "varchar_headroom": 1.5,  # VARCHAR length = longest value x headroom, so slightly longer appends still fit
+    "varchar_max_bytes": 8192,  # Longer values use TEXT/MEDIUMTEXT/LONGTEXT
+    "widen_on_append": True  # Appends ALTER planned columns that the new rows would overflow (MySQL)
+}
+
+# --- Parsed File Cache Configuration ---
+CACHE_CONFIG = {
+    "enabled": True,  # Requires pyarrow; silently disabled when it is not installed
+    "directory": os.path.join(os.path.expanduser("~"), ".prechart2db", "parse_cache"),
+    "max_bytes": 2 * 1024 * 1024 * 1024  # Least recently used entries are evicted above this size
+}
+
+# --- Stage Metrics Configuration ---
+METRICS_CONFIG = {
+    "trace_memory": False,  # Measure per-stage peak memory with tracemalloc (slows allocation-heavy stages noticeably)
+    "export_path": None,  # JSON lines file each finished run is appended to, e.g. "metrics/runs.jsonl"
+    "max_runs": 50  # Runs kept in memory for the UI breakdown tables
+}
+
+# --- Connection Pool Configuration ---
+POOL_CONFIG = {
+    "max_size": 5,  # Connections shared by all DatabaseManagers with the same DB_CONFIG
+    "idle_timeout": 300,  # Seconds before an idle connection is closed
+    "checkout_timeout": 30  # Seconds to wait for a free connection
+}
+
+# --- Insert Engine Configuration ---
+INSERT_CONFIG = {
+    "engine": "executemany",  # "load_data": LOAD DATA LOCAL INFILE, falls back to executemany if the server disables it
+    "batch_rows": 10000,  # Upper bound on rows per batch
+    "batch_bytes": None,  # Byte budget per batch; None derives it from the server's max_allowed_packet
+    "packet_fill_ratio": 0.8,  # Share of max_allowed_packet used when batch_bytes is None
+    "max_batch_bytes": 16 * 1024 * 1024,
+    "row_size_sample": 1000,  # Rows sampled to estimate the encoded row size
+    "commit_every_batch": False  # Commit after each batch instead of once per load
+}
+
+# --- Load Manifest Configuration (resumable streaming loads) ---
+LOAD_MANIFEST_CONFIG = {
+    "enabled": True,  # Record every committed chunk so an interrupted load of the same file resumes after it
+    "table": "_load_manifest"
+}
+
+# --- Tail-Append Configuration (growing CSV files, see core/tail_append.py) ---
+TAIL_APPEND_CONFIG = {
+    "table": "_tail_offsets",  # Per source file: byte offset already ingested, header signature, checksums
+    "prefix_bytes": 1024 * 1024,  # Leading bytes checksummed to detect a rewritten file
+    "tail_bytes": 64 * 1024  # Bytes before the stored offset checksummed as well
+}
+
+# --- Overwrite Configuration ---
+OVERWRITE_CONFIG = {
+    "staging_suffix": "__staging",  # Overwrites load here first, then swap in with one RENAME TABLE
+    "backup_suffix": "__backup",
+    "keep_backup": False  # Keep the replaced table as <table>__backup until the next overwrite
+}
+
+# --- Batch Ingest CLI Configuration (run_ingest.py) ---
+INGEST_CONFIG = {
+    "parse_workers": None,  # Parsing processes; None uses every CPU core
+    "db_workers": 2,  # Concurrent DB loads, capped at POOL_CONFIG['max_size']
+    "file_patterns": ("*.csv", "*.xlsx", "*.xls")  # Files picked up when a directory is given
+}
+
 # --- App Information ---
 APP_CONFIG = {
     "version": "1.0.0",
@@ -28,6 +136,44 @@ TKINTER_CONFIG = {
     "geometry": "800x600"
 }
 
+# --- Profiling Cache Configuration (Streamlit analysis tabs) ---
+PROFILE_CACHE_CONFIG = {
+    "max_bytes": 256 * 1024 * 1024  # Oldest results are evicted beyond this estimated size
+}
+
+# --- DB Table Analysis Configuration (aggregates run inside the database) ---
+TABLE_ANALYSIS_CONFIG = {
+    "histogram_bins": 30,
+    "quantile_buckets": 1000,  # Fine histogram buckets the box plot quartiles are interpolated from
+    "skip_columns": ("id", "_row_fingerprint")  # Bookkeeping columns added by DatabaseManager
+}
+
+# --- Streaming Profiler Configuration (files profiled chunk by chunk, see core/stream_profiler.py) ---
+STREAM_PROFILE_CONFIG = {
+    "sample_rows": 10000,  # Reservoir sample kept for previews
+    "hll_precision": 14,  # 2**14 registers per column: ~0.8% distinct-count error, 16 KiB
+    "quantile_capacity": 2048,  # Items per sketch level; rank error stays well under 0.1% of the rows
+    "heavy_hitters": 1000,  # Values tracked per column for the top-N frequencies
+    "histogram_bins": 30
+}
+
+# --- DB Table Browser Configuration ---
+BROWSE_CONFIG = {
+    "page_size": 100,
+    "page_cache_bytes": 32 * 1024 * 1024,  # Recently viewed pages kept per process (LRU)
+    "export_chunk_rows": 50000,  # Rows fetched from the server-side cursor per CSV write
+    "export_directory": os.path.join(os.path.expanduser("~"), ".prechart2db", "exports")
+}
+
+# --- Chart Data Configuration (core/chart_data.py) ---
+CHART_CONFIG = {
+    "histogram_max_bins": 100,  # Upper bound on the 'auto' bin rule
+    "kde_sample_size": 5000,  # Random values the KDE curve is fitted on
+    "kde_grid_points": 200,
+    "max_fliers": 500,  # Outlier points drawn on the box plot (evenly spaced by rank)
+    "image_dpi": 100  # Rendered chart images are cached per (data fingerprint, column, chart type)
+}
+
 # --- Data Visualization & Analysis Configuration ---
 VISUALIZATION_CONFIG = {
     "top_n_categories": 20,  # For bar charts
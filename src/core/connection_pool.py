@@ -0,0 +1,101 @@
+import threading
+import time
+import pymysql
+from .config import POOL_CONFIG
+
+class ConnectionPool:
+    # One pool per distinct connection config, shared by every DatabaseManager that uses it.
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, connect_kwargs, database, max_size=None, idle_timeout=None, checkout_timeout=None):
+        self.connect_kwargs = connect_kwargs
+        self.database = database
+        self.max_size = max_size if max_size else POOL_CONFIG['max_size']
+        self.idle_timeout = idle_timeout if idle_timeout is not None else POOL_CONFIG['idle_timeout']
+        self.checkout_timeout = checkout_timeout if checkout_timeout is not None else POOL_CONFIG['checkout_timeout']
+        self._idle = []  # (connection, released_at), most recently used last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self.database_ready = False
+
+    @classmethod
+    def for_config(cls, db_config):
+        connect_kwargs = {k: v for k, v in db_config.items() if k != 'database'}
+        key = (tuple(sorted((k, repr(v)) for k, v in connect_kwargs.items())), db_config.get('database'))
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls(connect_kwargs, db_config.get('database'))
+                cls._pools[key] = pool
+            return pool
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [conn for conn, released_at in self._idle if now - released_at > self.idle_timeout]
+            self._idle = [(conn, released_at) for conn, released_at in self._idle if now - released_at <= self.idle_timeout]
+        for conn in expired:
+            self._close_quietly(conn)
+
+    def _take_idle(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn, _ = self._idle.pop()
+            try:
+                conn.ping(reconnect=False)
+                return conn
+            except pymysql.Error:
+                self._close_quietly(conn)
+
+    def _open(self, create_db):
+        conn = pymysql.connect(**self.connect_kwargs)
+        try:
+            if create_db and not self.database_ready:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{self.database}`")
+            conn.select_db(self.database)
+        except Exception:
+            self._close_quietly(conn)
+            raise
+        # select_db succeeded, so the database exists for the lifetime of this pool.
+        self.database_ready = True
+        return conn
+
+    def acquire(self, create_db=False):
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise TimeoutError(f"{self.checkout_timeout}초 안에 사용 가능한 DB 연결을 얻지 못했습니다. (풀 크기 {self.max_size})")
+        try:
+            self._evict_idle()
+            conn = self._take_idle()
+            return conn if conn is not None else self._open(create_db)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn):
+        try:
+            if conn.open:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def discard(self, conn):
+        # For connections left in an unknown state (e.g. the rollback after an error failed).
+        self._close_quietly(conn)
+        self._slots.release()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
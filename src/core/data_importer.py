@@ -1,57 +1,128 @@
+import io
 import pandas as pd
 import os
+from .config import IMPORT_CONFIG, CACHE_CONFIG, COMPACTION_CONFIG
+from .excel_reader import ExcelWorkbook, streaming_engine
+from .frame_compaction import compact_frame
+from .metrics import NULL_METRICS
+from .parse_cache import ParsedFileCache
+from .tail_append import ByteRangeReader
+from .type_inference import TypeInferencer
 
 class DataImporter:
-    def __init__(self, status_callback=None):
+    def __init__(self, status_callback=None, cache=None, metrics=None, use_cache=True):
         self.status_callback = status_callback if status_callback else print
+        self.metrics = metrics if metrics else NULL_METRICS # MetricsRecorder for per-stage timings
+        if cache is None and use_cache and CACHE_CONFIG['enabled']:
+            cache = ParsedFileCache()
+        # `use_cache=False` always parses, e.g. for benchmarks that time parsing.
+        self.cache = cache if use_cache and cache is not None and cache.available else None
+        self.type_inferencer = TypeInferencer()
+        self.last_schema = None # TableSchema of the most recent load, for DatabaseManager
+        self.last_compaction = None # CompactionReport of the most recent load_data, None when compaction is off
 
     def _update_status(self, message):
         self.status_callback(message)
 
-    def load_data(self, file_input, csv_delimiter=',', csv_encoding='utf-8', excel_sheet_name=None):
-        # This function now accepts either a file path (string) or a file-like object.
+    def _resolve_input(self, file_input):
+        # Accepts either a file path (string) or a file-like object.
         if file_input is None:
             self._update_status("오류: 파일 경로 또는 객체가 제공되지 않았습니다.")
-            return None
-
-        file_name = ""
-        file_object = None
+            return None, None
 
         if isinstance(file_input, str): # It's a file path
-            file_name = os.path.basename(file_input)
-            file_object = file_input
-        elif hasattr(file_input, 'name'): # It's a file-like object (e.g., from Streamlit)
-            file_name = file_input.name
-            file_object = file_input
-        else:
-            self._update_status("오류: 잘못된 파일 입력 타입입니다.")
+            return os.path.basename(file_input), file_input
+        if hasattr(file_input, 'name'): # It's a file-like object (e.g., from Streamlit)
+            return file_input.name, file_input
+
+        self._update_status("오류: 잘못된 파일 입력 타입입니다.")
+        return None, None
+
+    def _input_size(self, file_object):
+        # Size in bytes of the raw input, for the metrics; None when it cannot be told cheaply.
+        try:
+            if isinstance(file_object, str): return os.path.getsize(file_object)
+            if hasattr(file_object, 'getbuffer'): return file_object.getbuffer().nbytes
+            if hasattr(file_object, 'size'): return int(file_object.size)
+        except (OSError, TypeError, ValueError):
+            pass
+        return None
+
+    def _convert_types(self, df, schema=None):
+        # Infers a schema (or reuses the one from an earlier chunk) and returns the typed frame.
+        if schema is None:
+            with self.metrics.span('type_inference', rows=len(df)):
+                schema, df = self.type_inferencer.infer(df)
+            self.last_schema = schema
+            return df
+        with self.metrics.span('type_conversion', rows=len(df)):
+            df, mismatched = self.type_inferencer.apply(df, schema)
+        if mismatched:
+            self._update_status(f"경고: 컬럼 {', '.join(mismatched)}의 값이 첫 청크에서 추론한 타입과 맞지 않아 문자열로 유지합니다.")
+        return df
+
+    def _compact(self, df):
+        # Shrinks the frame handed to the UI (category, narrowed numbers, Arrow strings); the schema keeps the inferred kinds.
+        self.last_compaction = None
+        if not COMPACTION_CONFIG['enabled']:
+            return df
+        with self.metrics.span('compaction', rows=len(df)):
+            df, self.last_compaction = compact_frame(df)
+        self._update_status(self.last_compaction.summary())
+        return df
+
+    def load_data(self, file_input, csv_delimiter=',', csv_encoding='utf-8', excel_sheet_name=None):
+        file_name, file_object = self._resolve_input(file_input)
+        if file_object is None:
             return None
 
         file_extension = os.path.splitext(file_name)[1].lower()
         df = None
 
         try:
-            if file_extension == '.csv':
-                # Load all data as strings to prevent type inference errors
-                df = pd.read_csv(file_object, sep=csv_delimiter, encoding=csv_encoding, dtype=str)
-                self._update_status(f"CSV 파일 로드 성공: {file_name}")
-            elif file_extension in ('.xlsx', '.xls'):
-                # Load all data as strings
-                if excel_sheet_name:
-                    df = pd.read_excel(file_object, sheet_name=excel_sheet_name, dtype=str)
-                else:
-                    df = pd.read_excel(file_object, dtype=str) # 첫 번째 시트 로드
-                self._update_status(f"Excel 파일 로드 성공: {file_name}")
-            else:
+            cache_key = None
+            if self.cache and file_extension in ('.csv', '.xlsx', '.xls'):
+                with self.metrics.span('cache_lookup') as span:
+                    cache_key = self.cache.make_key(file_object, extension=file_extension, csv_delimiter=csv_delimiter,
+                                                    csv_encoding=csv_encoding, excel_sheet_name=excel_sheet_name)
+                    cached = self.cache.get(cache_key)
+                    span.rows = len(cached[0]) if cached is not None else 0
+                if cached is not None:
+                    df, self.last_schema = cached
+                    self._update_status(f"캐시에서 파일 로드 성공: {file_name}. 총 {len(df)} 행, 컬럼: {', '.join(df.columns)}")
+                    return self._compact(df)
+
+            if file_extension not in ('.csv', '.xlsx', '.xls'):
                 self._update_status(f"지원하지 않는 파일 형식: {file_extension}")
                 return None
+            with self.metrics.span('parse', nbytes=self._input_size(file_object)) as span:
+                if file_extension == '.csv':
+                    # Load all data as strings to prevent type inference errors
+                    df = pd.read_csv(file_object, sep=csv_delimiter, encoding=csv_encoding, dtype=str)
+                    self._update_status(f"CSV 파일 로드 성공: {file_name}")
+                elif streaming_engine(file_extension):
+                    # Read-only row streaming; only the requested sheet is parsed.
+                    with ExcelWorkbook(file_object, file_extension) as book:
+                        df = book.read_sheet(excel_sheet_name if excel_sheet_name else 0)
+                    self._update_status(f"Excel 파일 로드 성공: {file_name} ({book.engine})")
+                else:
+                    # Load all data as strings
+                    if excel_sheet_name:
+                        df = pd.read_excel(file_object, sheet_name=excel_sheet_name, dtype=str)
+                    else:
+                        df = pd.read_excel(file_object, dtype=str) # 첫 번째 시트 로드
+                    self._update_status(f"Excel 파일 로드 성공: {file_name}")
+                span.rows = len(df)
 
-            # Convert columns to numeric where possible, ignoring errors for mixed-type columns
-            for col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='ignore')
+            df = self._convert_types(df)
+            if cache_key:
+                with self.metrics.span('cache_store', rows=len(df)):
+                    stored = self.cache.put(cache_key, df, self.last_schema)
+                if stored:
+                    self._update_status("파싱 결과를 캐시에 저장했습니다.")
 
             self._update_status(f"파일 읽기 및 타입 변환 성공. 총 {len(df)} 행, 컬럼: {', '.join(df.columns)}")
-            return df
+            return self._compact(df)
 
         except FileNotFoundError:
             self._update_status(f"파일을 찾을 수 없습니다: {file_name}")
@@ -59,3 +130,132 @@ class DataImporter:
         except Exception as e:
             self._update_status(f"파일 로드 중 오류 발생 ({file_name}): {e}")
             return None
+
+    def iter_chunks(self, file_input, csv_delimiter=',', csv_encoding='utf-8', excel_sheet_name=None, chunksize=None,
+                    schema=None, skip_chunks=0):
+        # Streaming mode: yields DataFrames of at most `chunksize` rows so memory stays bounded.
+        # `schema` replaces inference on the first chunk; `skip_chunks` leading chunks are read past without being
+        # converted or yielded (a resumed load passes both, so the remaining chunks convert exactly as before).
+        file_name, file_object = self._resolve_input(file_input)
+        if file_object is None:
+            return
+
+        chunksize = chunksize or IMPORT_CONFIG['chunksize']
+        file_extension = os.path.splitext(file_name)[1].lower()
+
+        try:
+            if file_extension == '.csv':
+                reader = pd.read_csv(file_object, sep=csv_delimiter, encoding=csv_encoding, dtype=str, chunksize=chunksize)
+            elif file_extension in ('.xlsx', '.xls') and streaming_engine(file_extension):
+                sheet = excel_sheet_name if excel_sheet_name else 0
+                with ExcelWorkbook(file_object, file_extension) as book:
+                    self._update_status(f"스트리밍 로드 시작: {file_name} ({book.engine}, 청크 크기 {chunksize:,}행)")
+                    yield from self._iter_typed_chunks(book.iter_frames(sheet, chunksize), file_name, schema, skip_chunks)
+                return
+            elif file_extension in ('.xlsx', '.xls'):
+                # read_excel has no chunksize; the sheet is read once and handed out in slices.
+                sheet = excel_sheet_name if excel_sheet_name else 0
+                with self.metrics.span('parse', nbytes=self._input_size(file_object)) as span:
+                    sheet_df = pd.read_excel(file_object, sheet_name=sheet, dtype=str)
+                    span.rows = len(sheet_df)
+                reader = (sheet_df.iloc[start:start + chunksize] for start in range(0, len(sheet_df), chunksize))
+            else:
+                self._update_status(f"지원하지 않는 파일 형식: {file_extension}")
+                return
+
+            self._update_status(f"스트리밍 로드 시작: {file_name} (청크 크기 {chunksize:,}행)")
+            yield from self._iter_typed_chunks(reader, file_name, schema, skip_chunks)
+
+        except FileNotFoundError:
+            self._update_status(f"파일을 찾을 수 없습니다: {file_name}")
+            raise
+        except Exception as e:
+            self._update_status(f"스트리밍 로드 중 오류 발생 ({file_name}): {e}")
+            raise
+
+    def excel_sheet_names(self, file_input):
+        # Sheet names in workbook order, read from the workbook index without parsing any sheet.
+        file_name, file_object = self._resolve_input(file_input)
+        if file_object is None:
+            return None
+        file_extension = os.path.splitext(file_name)[1].lower()
+        try:
+            if streaming_engine(file_extension):
+                with ExcelWorkbook(file_object, file_extension) as book:
+                    return book.sheet_names
+            with pd.ExcelFile(file_object) as book:
+                return list(book.sheet_names)
+        except Exception as e:
+            self._update_status(f"시트 목록을 읽지 못했습니다 ({file_name}): {e}")
+            return None
+        finally:
+            if hasattr(file_object, 'seek'):
+                file_object.seek(0)
+
+    def iter_excel_sheets(self, file_input, sheet_names=None, chunksize=None):
+        # One pass over a workbook: yields (sheet name, typed chunk iterator) for every sheet (or `sheet_names`),
+        # opening the workbook once. Each sheet gets its own inferred schema; consume one iterator before the next.
+        file_name, file_object = self._resolve_input(file_input)
+        if file_object is None:
+            return
+        file_extension = os.path.splitext(file_name)[1].lower()
+        if file_extension not in ('.xlsx', '.xls'):
+            self._update_status(f"Excel 파일이 아닙니다: {file_name}")
+            return
+        chunksize = chunksize or IMPORT_CONFIG['chunksize']
+        if not streaming_engine(file_extension):
+            # Without a streaming engine every sheet is read whole (pd.read_excel), but the workbook is still opened once.
+            with pd.ExcelFile(file_object) as book:
+                for sheet_name in (sheet_names or book.sheet_names):
+                    sheet_df = book.parse(sheet_name, dtype=str)
+                    reader = (sheet_df.iloc[start:start + chunksize] for start in range(0, len(sheet_df), chunksize))
+                    yield sheet_name, self._iter_typed_chunks(reader, f"{file_name} [{sheet_name}]")
+            return
+        with ExcelWorkbook(file_object, file_extension) as book:
+            names = sheet_names or book.sheet_names
+            self._update_status(f"Excel 시트 {len(names)}개를 한 번에 읽습니다: {', '.join(map(str, names))} ({book.engine})")
+            for sheet_name in names:
+                yield sheet_name, self._iter_typed_chunks(book.iter_frames(sheet_name, chunksize), f"{file_name} [{sheet_name}]")
+
+    def iter_csv_range(self, file_path, start, end, columns=None, csv_delimiter=',', csv_encoding='utf-8', chunksize=None, schema=None):
+        # Like iter_chunks, but parses only bytes [start, end) of a CSV file (tail-append of a growing file).
+        # A range that does not begin at 0 has no header line, so `columns` must name the fields.
+        file_name = os.path.basename(file_path)
+        chunksize = chunksize or IMPORT_CONFIG['chunksize']
+        header = {'header': None, 'names': list(columns)} if start else {}
+        try:
+            with io.BufferedReader(ByteRangeReader(file_path, start, end)) as byte_range:
+                reader = pd.read_csv(byte_range, sep=csv_delimiter, encoding=csv_encoding, dtype=str, chunksize=chunksize, **header)
+                self._update_status(f"스트리밍 로드 시작: {file_name} ({start:,}~{end:,}바이트, 청크 크기 {chunksize:,}행)")
+                yield from self._iter_typed_chunks(reader, file_name, schema)
+        except pd.errors.EmptyDataError:
+            self._update_status(f"새로 추가된 행이 없습니다: {file_name}")
+        except Exception as e:
+            self._update_status(f"스트리밍 로드 중 오류 발생 ({file_name}): {e}")
+            raise
+
+    def _iter_typed_chunks(self, reader, file_name, schema=None, skip_chunks=0):
+        # Converts and yields the raw chunks of `reader` with one schema (given, or inferred from the first chunk).
+        total_rows = 0
+        if schema is not None:
+            self.last_schema = schema
+        chunk_number = 0
+        while True:
+            # Timed per chunk rather than around the yield, so time spent by the consumer is not counted here.
+            with self.metrics.span('parse_chunk') as span:
+                chunk = next(reader, None)
+                span.rows = len(chunk) if chunk is not None else 0
+            if chunk is None:
+                break
+            chunk_number += 1
+            if chunk_number <= skip_chunks:
+                if chunk_number == skip_chunks:
+                    skipped = f"1~{skip_chunks}" if skip_chunks > 1 else "1"
+                    self._update_status(f"이미 적재된 청크 {skipped}을(를) 건너뛰었습니다.")
+                continue
+            chunk = self._convert_types(chunk, schema)
+            schema = self.last_schema
+            total_rows += len(chunk)
+            self._update_status(f"청크 {chunk_number} 읽기 완료 (누적 {total_rows:,}행)")
+            yield chunk
+        self._update_status(f"스트리밍 로드 완료: {file_name} (총 {total_rows:,}행)")
@@ -1,133 +1,836 @@
-import pymysql
-from pymysql import Error
+import io
+import os
+import time
 import pandas as pd
-from .config import DB_CONFIG
+from .backends import get_backend
+from .config import BROWSE_CONFIG, DB_CONFIG, IMPORT_CONFIG, INSERT_CONFIG, LOAD_MANIFEST_CONFIG, OVERWRITE_CONFIG, SCHEMA_CONFIG, TAIL_APPEND_CONFIG
+from .fingerprint import FINGERPRINT_COLUMN, row_fingerprints
+from .load_manifest import LoadCheckpoint, MANIFEST_COLUMNS
+from .metrics import NULL_METRICS
+from .profile_cache import ProfileCache
+from .tail_append import CsvFileScan, TailState, TAIL_STATE_COLUMNS
+
+# Operators accepted in fetch_page/export_table filters; anything else is rejected before SQL is built.
+FILTER_OPERATORS = ('=', '!=', '<', '<=', '>', '>=', 'LIKE', 'IS NULL', 'IS NOT NULL')
+
+class OperationCancelled(Exception):
+    # Raised at a batch or chunk boundary once the caller's cancel_check returns True.
+    pass
+
+class InsertProgress:
+    # Reports percent done (when the total is known) and throughput through a status callback,
+    # and raw (rows done, total rows) through an optional progress callback, e.g. for a progress bar.
+    def __init__(self, total_rows, status_callback, progress_callback=None):
+        self.total_rows = total_rows
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback
+        self.rows_done = 0
+        self.started_at = time.perf_counter()
+
+    def advance(self, rows):
+        self.rows_done += rows
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        rate = self.rows_done / elapsed
+        if self.total_rows:
+            percent = min(100.0, self.rows_done / self.total_rows * 100)
+            self.status_callback(f"삽입 진행률 {percent:.1f}% ({self.rows_done:,}/{self.total_rows:,}행), {rate:,.0f}행/초")
+        else:
+            self.status_callback(f"삽입 진행: {self.rows_done:,}행, {rate:,.0f}행/초")
+        if self.progress_callback:
+            self.progress_callback(self.rows_done, self.total_rows)
+
+def sanitize_identifier(name):
+    return ''.join(c for c in str(name) if c.isalnum() or c == '_').replace(' ', '_')
+
+def column_mapping(df):
+    # (original column, sanitized column) pairs of the columns stored in a table; unusable names (e.g. '#') and the
+    # reserved fingerprint column are dropped.
+    mapping = [(col, sanitize_identifier(col)) for col in df.columns]
+    return [(col, safe_col) for col, safe_col in mapping if safe_col and safe_col != FINGERPRINT_COLUMN]
+
+def stored_row_fingerprints(df):
+    # Row fingerprints as stored in the table: over the mapped columns only, like _insert_rows and sync_changes.
+    return row_fingerprints(df[[col for col, _ in column_mapping(df)]])
+
+class CountedChunks:
+    # Passes a chunk stream through while counting its rows.
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.rows = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.rows += len(chunk)
+            yield chunk
+
+class TablePage:
+    # One page of fetch_page. `first_key` / `last_key` are the (sort value, id) positions of the first and
+    # last row; pass `last_key` back to get the next page, or `first_key` with backward=True for the previous one.
+    def __init__(self, rows, sort_column, has_previous, has_next):
+        self.rows = rows
+        self.has_previous = has_previous
+        self.has_next = has_next
+        self.first_key = self._key(rows.iloc[0], sort_column) if len(rows) else None
+        self.last_key = self._key(rows.iloc[-1], sort_column) if len(rows) else None
+
+    @staticmethod
+    def _key(row, sort_column):
+        def plain(value):
+            # Back to driver-bindable Python values (NumPy scalars and Timestamps come out of the DataFrame).
+            if isinstance(value, pd.Timestamp): return value.to_pydatetime()
+            return value.item() if hasattr(value, 'item') else value
+        return (plain(row[sort_column]) if sort_column else None, plain(row['id']))
 
 class DatabaseManager:
-    def __init__(self, db_config=None, status_callback=None):
+    # Recently viewed pages, shared by every manager in the process (Streamlit builds a new one per rerun).
+    # Keys carry the table version stamp, so pages of a table that changed are never served.
+    _page_cache = ProfileCache(max_bytes=BROWSE_CONFIG['page_cache_bytes'])
+
+    def __init__(self, db_config=None, status_callback=None, insert_engine=None, progress_callback=None, cancel_check=None, metrics=None):
         self.DB_CONFIG = db_config if db_config else DB_CONFIG
         self.status_callback = status_callback if status_callback else print
+        self.metrics = metrics if metrics else NULL_METRICS # MetricsRecorder for per-stage timings
+        self.progress_callback = progress_callback
+        self.cancel_check = cancel_check
+        self.insert_engine = insert_engine if insert_engine else INSERT_CONFIG['engine']
+        self.last_load_rows = 0 # rows read by the most recent append_file_tail / load_excel_sheets
+        # Connections, SQL dialect, DDL and the bulk insert path of the database chosen by DB_CONFIG['backend'].
+        self.backend = get_backend(self.DB_CONFIG, status_callback=self._update_status, metrics=self.metrics,
+                                   insert_engine=self.insert_engine)
 
     def _update_status(self, message):
         self.status_callback(message)
 
+    def _raise_if_cancelled(self):
+        # Called between batches and chunks, so a cancelled operation stops at a transaction boundary and rolls back.
+        if self.cancel_check and self.cancel_check():
+            raise OperationCancelled("사용자에 의해 작업이 취소되었습니다.")
+
     def _connect_to_db(self, create_db=False):
-        conn = None
         try:
-            db_config_no_db = self.DB_CONFIG.copy()
-            if 'database' in db_config_no_db:
-                del db_config_no_db['database']
-            
-            conn = pymysql.connect(**db_config_no_db)
-            if create_db:
-                with conn.cursor() as cursor:
-                    self._update_status(f"데이터베이스 '{self.DB_CONFIG['database']}' 존재 여부 확인 및 생성...")
-                    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{self.DB_CONFIG['database']}`")
-                self._update_status(f"데이터베이스 '{self.DB_CONFIG['database']}' 확인 또는 생성 완료.")
-            
-            conn.select_db(self.DB_CONFIG['database'])
-            self._update_status(f"데이터베이스 '{self.DB_CONFIG['database']}' 연결 성공.")
+            if create_db and not self.backend.database_ready:
+                self._update_status(f"데이터베이스 '{self.backend.describe()}' 존재 여부 확인 및 생성...")
+            with self.metrics.span('connect'):
+                conn = self.backend.acquire(create_db=create_db)
+            self._update_status(f"데이터베이스 '{self.backend.describe()}' 연결 성공.")
             return conn
-        except Error as e:
+        except self.backend.errors + (TimeoutError, OSError) as e:
             self._update_status(f"DB 연결 실패: {e}")
-            if conn: conn.close()
             return None
 
-    def _get_mysql_type(self, pandas_dtype):
-        if 'int' in str(pandas_dtype): return 'BIGINT'
-        if 'float' in str(pandas_dtype): return 'DOUBLE'
-        if 'datetime' in str(pandas_dtype): return 'DATETIME'
-        if 'bool' in str(pandas_dtype): return 'BOOLEAN'
-        return 'VARCHAR(255)'
+    def _commit(self, conn):
+        with self.metrics.span('commit'):
+            self.backend.commit(conn)
 
-    def _create_table_from_dataframe(self, cursor, df, table_name):
-        safe_table_name = ''.join(c for c in table_name if c.isalnum() or c == '_').replace(' ', '_')
-        if not safe_table_name: safe_table_name = "untitled_table"
+    def _rollback(self, conn):
+        self.backend.rollback(conn)
 
-        columns_sql = ["`id` INT AUTO_INCREMENT PRIMARY KEY"]
-        for col_name, dtype in df.dtypes.items():
-            safe_col_name = ''.join(c for c in col_name if c.isalnum() or c == '_').replace(' ', '_')
-            if not safe_col_name: continue
-            mysql_type = self._get_mysql_type(dtype)
-            columns_sql.append(f"`{safe_col_name}` {mysql_type}")
+    def _release_connection(self, conn):
+        self.backend.release(conn)
 
-        if len(columns_sql) <= 1: raise ValueError("테이블을 생성할 컬럼 정보가 없습니다.")
+    def _sanitize_identifier(self, name):
+        return sanitize_identifier(name)
+
+    def _create_table_from_dataframe(self, cursor, df, table_name, schema=None, exact=True, defer_indexes=False):
+        # `exact=False` when `df` is only the first chunk of a stream, so planned widths get headroom.
+        # `defer_indexes` leaves the fingerprint unique key to _build_deferred_indexes after the load.
+        safe_table_name = self._sanitize_identifier(table_name)
+        if not safe_table_name: safe_table_name = "untitled_table"
+
+        column_definitions = self.backend.column_definitions(df, self._column_mapping(df), schema, exact)
+        if not column_definitions: raise ValueError("테이블을 생성할 컬럼 정보가 없습니다.")
 
         self._update_status(f"테이블 '{safe_table_name}'을(를) 재생성하여 스키마를 업데이트합니다.")
-        cursor.execute(f"DROP TABLE IF EXISTS `{safe_table_name}`")
-        create_table_query = f"CREATE TABLE `{safe_table_name}` ({', '.join(columns_sql)})"
+        create_table_query = self.backend.create_table_sql(safe_table_name, column_definitions, defer_indexes)
         self._update_status(f"테이블 생성 쿼리 실행: {create_table_query}")
-        cursor.execute(create_table_query)
+        with self.metrics.span('create_table'):
+            self.backend.drop_table(cursor, safe_table_name)
+            cursor.execute(create_table_query)
         return safe_table_name
 
-    def _insert_data_into_table(self, cursor, df, table_name, check_duplicates=True):
-        safe_columns = [''.join(c for c in col if c.isalnum() or c == '_').replace(' ', '_') for col in df.columns]
-        safe_columns = [col for col in safe_columns if col]
-        if not safe_columns: raise ValueError("데이터를 삽입할 컬럼 정보가 없습니다.")
+    def _build_deferred_indexes(self, cursor, table_name):
+        self._update_status(f"테이블 '{table_name}'의 인덱스를 생성합니다...")
+        with self.metrics.span('build_index'):
+            self.backend.add_fingerprint_index(cursor, table_name)
+
+    def _table_exists(self, cursor, table_name):
+        return self.backend.table_exists(cursor, table_name)
+
+    def _shadow_table_name(self, safe_table_name, suffix):
+        # MySQL identifiers are limited to 64 characters.
+        return f"{safe_table_name[:64 - len(suffix)]}{suffix}"
 
-        columns_str = ", ".join([f"`{col}`" for col in safe_columns])
-        data_to_insert = [tuple(None if pd.isna(x) else x for x in y) for y in df.to_numpy()]
+    def _swap_in_staging(self, cursor, safe_table_name, staging_table_name):
+        # Both renames happen in one step (MySQL RENAME TABLE) or one transaction, so readers never see a missing or partial table.
+        backup_table_name = self._shadow_table_name(safe_table_name, OVERWRITE_CONFIG['backup_suffix'])
+        with self.metrics.span('swap'):
+            if self._table_exists(cursor, safe_table_name):
+                self.backend.drop_table(cursor, backup_table_name)
+                self.backend.rename_tables(cursor, [(safe_table_name, backup_table_name), (staging_table_name, safe_table_name)])
+                if OVERWRITE_CONFIG['keep_backup']:
+                    self._update_status(f"기존 테이블을 '{backup_table_name}'(으)로 보관했습니다.")
+                else:
+                    self.backend.drop_table(cursor, backup_table_name)
+            else:
+                self.backend.rename_tables(cursor, [(staging_table_name, safe_table_name)])
+        self._update_status(f"스테이징 테이블을 '{safe_table_name}'(으)로 교체했습니다.")
 
-        if check_duplicates:
-            self._update_status(f"테이블 '{table_name}'에서 기존 데이터 조회 중... (중복 방지)")
-            cursor.execute(f"SELECT {columns_str} FROM `{table_name}`")
+    def _drop_staging_quietly(self, conn, staging_table_name):
+        try:
+            with self.backend.cursor(conn) as cursor:
+                self.backend.drop_table(cursor, staging_table_name)
+            self._commit(conn)
+        except Exception:
+            pass
+
+    def _column_mapping(self, df):
+        mapping = column_mapping(df)
+        if not mapping: raise ValueError("데이터를 삽입할 컬럼 정보가 없습니다.")
+        return mapping
+
+    def _has_fingerprint_column(self, cursor, table_name):
+        return self.backend.has_column(cursor, table_name, FINGERPRINT_COLUMN)
+
+    def _fetch_existing_rows(self, cursor, df, table_name):
+        # Legacy path for tables created before the fingerprint column existed: pulls the whole table.
+        columns_str = ", ".join([self.backend.quote(safe_col) for _, safe_col in self._column_mapping(df)])
+        self._update_status(f"테이블 '{table_name}'에 지문 컬럼이 없어 기존 데이터 전체를 조회합니다. (한 번 '덮어쓰기'하면 빠른 중복 확인이 적용됩니다)")
+        with self.metrics.span('dedup_select') as span:
+            cursor.execute(f"SELECT {columns_str} FROM {self.backend.quote(table_name)}")
             existing_data = {tuple(str(item) for item in row) for row in cursor.fetchall()}
-            self._update_status(f"기존 데이터 {len(existing_data)}개 조회 완료.")
-            
-            df_tuples_str = [tuple(str(item) for item in row) for row in data_to_insert]
-            new_data_indices = [i for i, row_tuple in enumerate(df_tuples_str) if row_tuple not in existing_data]
-            data_to_insert = [data_to_insert[i] for i in new_data_indices]
-
-        total_rows_in_file = len(df)
-        inserted_rows_count = len(data_to_insert)
+            span.rows = len(existing_data)
+        self._update_status(f"기존 데이터 {len(existing_data)}개 조회 완료.")
+        return existing_data
+
+    def _widen_columns(self, cursor, table_name, df):
+        # Lets the backend widen column types the rows about to be written would overflow. Call before the
+        # transaction writes anything: on MySQL the ALTER TABLE commits implicitly.
+        if not SCHEMA_CONFIG['widen_on_append'] or df.empty:
+            return
+        with self.metrics.span('widen_columns', rows=len(df)):
+            self.backend.widen_columns(cursor, table_name, df, self._column_mapping(df))
+
+    def _new_progress(self, total_rows=None):
+        return InsertProgress(total_rows, self._update_status, self.progress_callback)
+
+    def _insert_rows(self, cursor, df, table_name, check_duplicates=True, existing_data=None, fingerprinted=True, progress=None,
+                     unique_in_frame=False):
+        # Returns (rows in df, rows inserted). On fingerprinted tables the backend filters duplicates inside
+        # the database; `existing_data` is only used for legacy tables. `unique_in_frame` drops repeated
+        # rows in pandas, for tables whose unique key is only built after the load.
+        mapping = self._column_mapping(df)
+        source_columns = [col for col, _ in mapping]
+        safe_columns = [safe_col for _, safe_col in mapping]
+        data = df[source_columns]
+        total_rows = len(df)
+        fingerprints = None
+
+        if fingerprinted:
+            with self.metrics.span('fingerprint', rows=len(data)):
+                fingerprints = row_fingerprints(data)
+            safe_columns = safe_columns + [FINGERPRINT_COLUMN]
+            if unique_in_frame:
+                first_seen = ~fingerprints.duplicated()
+                data, fingerprints = data[first_seen], fingerprints[first_seen]
+        elif check_duplicates:
+            if existing_data is None:
+                existing_data = self._fetch_existing_rows(cursor, df, table_name)
+            rows = self.backend.rows_for_insert(data)
+            with self.metrics.span('dedup_compare', rows=len(rows)):
+                df_tuples_str = [tuple(str(item) for item in row) for row in rows]
+                data = data[[row_tuple not in existing_data for row_tuple in df_tuples_str]]
+
+        if data.empty:
+            return total_rows, 0
+
+        progress = progress if progress else self._new_progress(len(data))
+        inserted_rows = self.backend.insert_frame(cursor, table_name, data, safe_columns, fingerprints, progress,
+                                                  check_cancel=self._raise_if_cancelled)
+        return total_rows, inserted_rows
+
+    def _insert_data_into_table(self, cursor, df, table_name, check_duplicates=True, unique_in_frame=False):
+        fingerprinted = self._has_fingerprint_column(cursor, table_name)
+        total_rows_in_file, inserted_rows_count = self._insert_rows(cursor, df, table_name, check_duplicates,
+                                                                    fingerprinted=fingerprinted,
+                                                                    unique_in_frame=unique_in_frame)
         skipped_rows_count = total_rows_in_file - inserted_rows_count
 
-        if not data_to_insert:
+        if not inserted_rows_count:
             self._update_status(f"새로 추가할 데이터가 없습니다. ({skipped_rows_count}개 중복으로 건너뜀)")
             return True, f"파일의 모든 데이터({total_rows_in_file}개)가 이미 데이터베이스에 존재합니다."
 
-        placeholders = ", ".join(["%s"] * len(safe_columns))
-        insert_query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
-        self._update_status(f"{inserted_rows_count}개의 신규 데이터를 테이블 '{table_name}'에 삽입합니다. ({skipped_rows_count}개 중복으로 건너뜀)")
-        cursor.executemany(insert_query, data_to_insert)
+        self._update_status(f"{inserted_rows_count}개의 신규 데이터를 테이블 '{table_name}'에 삽입했습니다. ({skipped_rows_count}개 중복으로 건너뜀)")
         return True, f"파일의 {total_rows_in_file}개 데이터 중, 신규 데이터 {inserted_rows_count}개가 삽입되었고, {skipped_rows_count}개는 건너뛰었습니다."
 
-    def overwrite_table(self, df, table_name):
+    def overwrite_table(self, df, table_name, schema=None):
         conn = None
+        staging_table_name = None
         try:
             conn = self._connect_to_db(create_db=True)
             if not conn: return False, "데이터베이스에 연결할 수 없습니다."
-            with conn.cursor() as cursor:
-                safe_table_name = self._create_table_from_dataframe(cursor, df, table_name)
-                _, message = self._insert_data_into_table(cursor, df, safe_table_name, check_duplicates=False)
-                conn.commit()
+            # Load into a staging table and swap it in, so the current table stays readable until the end.
+            safe_table_name = self._sanitize_identifier(table_name) or "untitled_table"
+            staging_table_name = self._shadow_table_name(safe_table_name, OVERWRITE_CONFIG['staging_suffix'])
+            with self.backend.cursor(conn) as cursor:
+                self._create_table_from_dataframe(cursor, df, staging_table_name, schema, defer_indexes=True)
+                _, message = self._insert_data_into_table(cursor, df, staging_table_name, check_duplicates=False, unique_in_frame=True)
+                self._commit(conn)
+                self._raise_if_cancelled()
+                self._build_deferred_indexes(cursor, staging_table_name)
+                self._raise_if_cancelled()
+                self._swap_in_staging(cursor, safe_table_name, staging_table_name)
+                self._commit(conn)
             return True, f"테이블 '{safe_table_name}'을(를) 성공적으로 덮어썼습니다. {message}"
         except Exception as e:
-            if conn: conn.rollback()
+            if conn:
+                self._rollback(conn)
+                self._drop_staging_quietly(conn, staging_table_name)
             self._update_status(f"덮어쓰기 작업 실패: {e}")
             return False, f"덮어쓰기 작업 중 오류 발생: {e}"
         finally:
-            if conn: conn.close()
+            if conn: self._release_connection(conn)
 
     def append_new_data(self, df, table_name):
         conn = None
         try:
             conn = self._connect_to_db(create_db=False) # DB가 없으면 실패
             if not conn: return False, "데이터베이스에 연결할 수 없습니다. 먼저 DB를 생성해야 할 수 있습니다."
-            with conn.cursor() as cursor:
-                safe_table_name = ''.join(c for c in table_name if c.isalnum() or c == '_').replace(' ', '_')
+            with self.backend.cursor(conn) as cursor:
+                safe_table_name = self._sanitize_identifier(table_name)
+                self._widen_columns(cursor, safe_table_name, df)
                 _, message = self._insert_data_into_table(cursor, df, safe_table_name, check_duplicates=True)
-                conn.commit()
+                self._commit(conn)
             return True, message
-        except Error as e:
-            if conn: conn.rollback()
-            if e.args[0] == 1146: # Table doesn't exist
+        except self.backend.errors as e:
+            if conn: self._rollback(conn)
+            if self.backend.is_missing_table_error(e):
                 return False, f"테이블 '{table_name}'이(가) 존재하지 않습니다. 먼저 '덮어쓰기'를 실행하여 테이블을 생성해주세요."
             self._update_status(f"추가 작업 실패: {e}")
             return False, f"데이터 추가 작업 중 오류 발생: {e}"
         except Exception as e:
-            if conn: conn.rollback()
+            if conn: self._rollback(conn)
             self._update_status(f"추가 작업 실패: {e}")
             return False, f"데이터 추가 작업 중 오류 발생: {e}"
         finally:
-            if conn: conn.close()
+            if conn: self._release_connection(conn)
+
+    def _ids_for_fingerprints(self, cursor, table_name, fingerprints):
+        # fingerprint -> id for the given fingerprints, looked up through the unique index in batches.
+        ids = {}
+        unique = list(dict.fromkeys(fingerprints))
+        q = self.backend.quote
+        for start in range(0, len(unique), INSERT_CONFIG['batch_rows']):
+            batch = unique[start:start + INSERT_CONFIG['batch_rows']]
+            cursor.execute(f"SELECT {q('id')}, {q(FINGERPRINT_COLUMN)} FROM {q(table_name)} WHERE {q(FINGERPRINT_COLUMN)} IN ({self.backend.placeholders(len(batch))})", batch)
+            ids.update({fp: row_id for row_id, fp in cursor.fetchall()})
+        return ids
+
+    def sync_changes(self, table_name, update_rows, update_fingerprints, insert_rows, delete_fingerprints):
+        # Writes only the rows edited in the UI (see EditLog.sync_payload) in one transaction.
+        # Rows are matched by the fingerprint they had when loaded, so the table must have the fingerprint column.
+        conn = None
+        try:
+            conn = self._connect_to_db(create_db=False)
+            if not conn: return False, "데이터베이스에 연결할 수 없습니다."
+            safe_table_name = self._sanitize_identifier(table_name)
+            q = self.backend.quote
+            with self.backend.cursor(conn) as cursor:
+                if not self._has_fingerprint_column(cursor, safe_table_name):
+                    return False, f"테이블 '{safe_table_name}'에 지문 컬럼이 없어 변경분 동기화를 할 수 없습니다. 먼저 '덮어쓰기'를 실행해주세요."
+                self._widen_columns(cursor, safe_table_name, update_rows)
+                self._widen_columns(cursor, safe_table_name, insert_rows)
+                ids = self._ids_for_fingerprints(cursor, safe_table_name, list(update_fingerprints) + list(delete_fingerprints))
+                updated = deleted = missing = 0
+
+                if not update_rows.empty:
+                    mapping = self._column_mapping(update_rows)
+                    data = update_rows[[col for col, _ in mapping]]
+                    new_fingerprints = row_fingerprints(data).tolist()
+                    existing_new = self._ids_for_fingerprints(cursor, safe_table_name, new_fingerprints)
+                    set_columns = [safe_col for _, safe_col in mapping] + [FINGERPRINT_COLUMN]
+                    set_str = ", ".join(f"{q(col)} = {self.backend.placeholder}" for col in set_columns)
+                    update_query = f"UPDATE {q(safe_table_name)} SET {set_str} WHERE {q('id')} = {self.backend.placeholder}"
+                    redundant_ids = []
+                    for row, old_fp, new_fp in zip(self.backend.rows_for_insert(data), update_fingerprints, new_fingerprints):
+                        row_id = ids.get(old_fp)
+                        if row_id is None:
+                            missing += 1
+                        elif new_fp in existing_new and existing_new[new_fp] != row_id:
+                            # The edited row now equals another stored row; keep one copy, as inserts would.
+                            redundant_ids.append(row_id)
+                        else:
+                            cursor.execute(update_query, row + (new_fp, row_id))
+                            existing_new[new_fp] = row_id
+                            updated += 1
+                    delete_ids = redundant_ids
+                else:
+                    delete_ids = []
+
+                inserted = 0
+                if not insert_rows.empty:
+                    _, inserted = self._insert_rows(cursor, insert_rows, safe_table_name)
+
+                for fp in delete_fingerprints:
+                    if fp in ids: delete_ids.append(ids[fp])
+                    else: missing += 1
+                for start in range(0, len(delete_ids), INSERT_CONFIG['batch_rows']):
+                    batch = delete_ids[start:start + INSERT_CONFIG['batch_rows']]
+                    cursor.execute(f"DELETE FROM {q(safe_table_name)} WHERE {q('id')} IN ({self.backend.placeholders(len(batch))})", batch)
+                    deleted += self.backend.affected_rows(cursor)
+                self._commit(conn)
+
+            message = f"테이블 '{safe_table_name}' 동기화 완료: 수정 {updated}건, 추가 {inserted}건, 삭제 {deleted}건."
+            if missing:
+                message += f" ({missing}건은 테이블에서 원본 행을 찾지 못해 건너뜀)"
+            self._update_status(message)
+            return True, message
+        except self.backend.errors as e:
+            if conn: self._rollback(conn)
+            if self.backend.is_missing_table_error(e):
+                return False, f"테이블 '{table_name}'이(가) 존재하지 않습니다. 먼저 '덮어쓰기'를 실행하여 테이블을 생성해주세요."
+            self._update_status(f"변경분 동기화 실패: {e}")
+            return False, f"변경분 동기화 중 오류 발생: {e}"
+        except Exception as e:
+            if conn: self._rollback(conn)
+            self._update_status(f"변경분 동기화 실패: {e}")
+            return False, f"변경분 동기화 중 오류 발생: {e}"
+        finally:
+            if conn: self._release_connection(conn)
+
+    def _partial_load_note(self, overwrite, inserted_rows, checkpoint=None):
+        note = "기존 테이블은 변경되지 않았습니다" if overwrite else f"커밋된 {inserted_rows}행은 유지됨"
+        if checkpoint is not None and checkpoint.resumable:
+            note += f", 같은 파일로 다시 실행하면 청크 {checkpoint.committed_chunks + 1}부터 이어서 적재합니다"
+        return note
+
+    def load_chunks(self, chunks, table_name, overwrite=True, total_rows_hint=None, schema=None, checkpoint=None):
+        # Consumes an iterator of DataFrames (e.g. DataImporter.iter_chunks) and commits after each chunk,
+        # so only one chunk is held in memory at a time. `total_rows_hint` enables percent-done reporting.
+        # `schema` may be a TableSchema; it defaults to the checkpoint's schema, then to the dtypes of the first chunk.
+        # With a LoadCheckpoint (see load_file_resumable) every chunk commit also records its progress in the load
+        # manifest, and a failed overwrite keeps its staging table so a resumed run can continue into it.
+        conn = None
+        resuming = checkpoint is not None and checkpoint.resumable
+        total_rows = checkpoint.committed_rows if resuming else 0
+        inserted_rows = checkpoint.inserted_rows if resuming else 0
+        first_chunk_number = checkpoint.committed_chunks + 1 if resuming else 1
+        progress = self._new_progress(total_rows_hint)
+        safe_table_name = self._sanitize_identifier(table_name) or "untitled_table"
+        # Overwrites stream into a staging table (unique key in place, since duplicates span chunks) and swap at the end.
+        staging_table_name = self._shadow_table_name(safe_table_name, OVERWRITE_CONFIG['staging_suffix']) if overwrite else None
+        target_table_name = staging_table_name if overwrite else safe_table_name
+        try:
+            conn = self._connect_to_db(create_db=overwrite)
+            if not conn: return False, "데이터베이스에 연결할 수 없습니다."
+            with self.backend.cursor(conn) as cursor:
+                if checkpoint is not None:
+                    self._ensure_manifest(cursor)
+                table_ready = False
+                existing_data = None
+                fingerprinted = True
+                for chunk_number, chunk in enumerate(chunks, start=first_chunk_number):
+                    self._raise_if_cancelled()
+                    if not table_ready:
+                        table_ready = True
+                        if overwrite:
+                            if not resuming:
+                                # A checkpoint's schema is only known once the importer has typed the first chunk.
+                                table_schema = checkpoint.schema if schema is None and checkpoint is not None else schema
+                                self._create_table_from_dataframe(cursor, chunk, staging_table_name, table_schema, exact=False)
+                        else:
+                            fingerprinted = self._has_fingerprint_column(cursor, safe_table_name)
+                            if not fingerprinted:
+                                existing_data = self._fetch_existing_rows(cursor, chunk, safe_table_name)
+                    # Types come from the first chunk (or the first run), so later chunks may need wider columns.
+                    self._widen_columns(cursor, target_table_name, chunk)
+                    chunk_total, chunk_inserted = self._insert_rows(cursor, chunk, target_table_name,
+                                                                    check_duplicates=not overwrite,
+                                                                    existing_data=existing_data,
+                                                                    fingerprinted=fingerprinted,
+                                                                    progress=progress)
+                    total_rows += chunk_total
+                    inserted_rows += chunk_inserted
+                    if checkpoint is not None:
+                        # Same transaction as the chunk's rows, so the manifest never claims rows that were rolled back.
+                        counters = dict(committed_chunks=chunk_number, committed_rows=total_rows, inserted_rows=inserted_rows)
+                        self._write_checkpoint(cursor, checkpoint, status='running', **counters)
+                        self._commit(conn)
+                        checkpoint.update(status='running', **counters)
+                    else:
+                        self._commit(conn)
+                    self._update_status(f"청크 {chunk_number} 커밋 완료: 누적 {inserted_rows:,}/{total_rows:,}행 삽입")
+
+                if not table_ready and not resuming:
+                    return False, "적재할 데이터가 없습니다."
+                if overwrite:
+                    self._raise_if_cancelled()
+                    self._swap_in_staging(cursor, safe_table_name, staging_table_name)
+                    self._commit(conn)
+                if checkpoint is not None:
+                    self._write_checkpoint(cursor, checkpoint, status='completed')
+                    self._commit(conn)
+                    checkpoint.update(status='completed')
+
+            skipped_rows = total_rows - inserted_rows
+            return True, f"테이블 '{safe_table_name}'에 스트리밍 적재 완료. 총 {total_rows}개 데이터 중 {inserted_rows}개 삽입, {skipped_rows}개 건너뜀."
+        except self.backend.errors as e:
+            if conn: self._abort_chunk_load(conn, staging_table_name, checkpoint)
+            if self.backend.is_missing_table_error(e):
+                return False, f"테이블 '{table_name}'이(가) 존재하지 않습니다. 먼저 '덮어쓰기'를 실행하여 테이블을 생성해주세요."
+            self._update_status(f"스트리밍 적재 실패: {e}")
+            return False, f"스트리밍 적재 중 오류 발생 ({self._partial_load_note(overwrite, inserted_rows, checkpoint)}): {e}"
+        except Exception as e:
+            if conn: self._abort_chunk_load(conn, staging_table_name, checkpoint)
+            self._update_status(f"스트리밍 적재 실패: {e}")
+            return False, f"스트리밍 적재 중 오류 발생 ({self._partial_load_note(overwrite, inserted_rows, checkpoint)}): {e}"
+        finally:
+            if conn: self._release_connection(conn)
+
+    def _abort_chunk_load(self, conn, staging_table_name, checkpoint):
+        # Rolls back the chunk in flight. Without a checkpoint the staging table is dropped; with one it is kept for
+        # the resumed run and the manifest entry is marked failed (best effort: the connection may be what failed).
+        try:
+            self._rollback(conn)
+        except self.backend.errors:
+            pass
+        if checkpoint is None or not checkpoint.resumable:
+            if staging_table_name: self._drop_staging_quietly(conn, staging_table_name)
+        if checkpoint is not None:
+            try:
+                with self.backend.cursor(conn) as cursor:
+                    self._write_checkpoint(cursor, checkpoint, status='failed')
+                self._commit(conn)
+                checkpoint.update(status='failed')
+            except Exception:
+                pass
+
+    # --- Bookkeeping tables (load manifest, tail offsets) ---
+    def _ensure_state_table(self, cursor, table_name, columns):
+        # Created on first use; the first column is the primary key.
+        q = self.backend.quote
+        columns_sql = ", ".join(f"{q(name)} {sql_type}" for name, sql_type in columns)
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {q(table_name)} ({columns_sql}, PRIMARY KEY ({q(columns[0][0])}))")
+
+    def _replace_state_row(self, cursor, table_name, columns, row):
+        # Delete + insert rather than a dialect-specific upsert; both run in the caller's transaction.
+        q = self.backend.quote
+        cursor.execute(f"DELETE FROM {q(table_name)} WHERE {q(columns[0][0])} = {self.backend.placeholder}", (row[0],))
+        columns_sql = ", ".join(q(name) for name, _ in columns)
+        cursor.execute(f"INSERT INTO {q(table_name)} ({columns_sql}) VALUES ({self.backend.placeholders(len(columns))})", row)
+
+    def _read_state_row(self, table_name, columns, key):
+        # The row with primary key `key`, or None (also when the table or the database does not exist yet).
+        conn = None
+        try:
+            conn = self.backend.acquire(create_db=False)
+            with self.backend.cursor(conn) as cursor:
+                if not self._table_exists(cursor, table_name): return None
+                q = self.backend.quote
+                columns_sql = ", ".join(q(name) for name, _ in columns)
+                cursor.execute(f"SELECT {columns_sql} FROM {q(table_name)} WHERE {q(columns[0][0])} = {self.backend.placeholder}", (key,))
+                return cursor.fetchone()
+        except self.backend.errors + (OSError,):
+            return None # unreachable database: the load itself reports the connection problem
+        finally:
+            if conn: self._end_read(conn)
+
+    # --- Load manifest (resumable streaming loads) ---
+    def _ensure_manifest(self, cursor):
+        self._ensure_state_table(cursor, LOAD_MANIFEST_CONFIG['table'], MANIFEST_COLUMNS)
+
+    def _write_checkpoint(self, cursor, checkpoint, **changes):
+        self._replace_state_row(cursor, LOAD_MANIFEST_CONFIG['table'], MANIFEST_COLUMNS, checkpoint.to_row(**changes))
+
+    def _resume_point(self, checkpoint, overwrite):
+        # The manifest entry of an interrupted identical load, if it can still be continued; otherwise None.
+        row = self._read_state_row(LOAD_MANIFEST_CONFIG['table'], MANIFEST_COLUMNS, checkpoint.load_key)
+        if not row: return None
+        previous = LoadCheckpoint.from_row(row)
+        if not previous.resumable: return None
+        if overwrite:
+            staging_table_name = self._shadow_table_name(checkpoint.target_table, OVERWRITE_CONFIG['staging_suffix'])
+            conn = None
+            try:
+                conn = self.backend.acquire(create_db=False)
+                with self.backend.cursor(conn) as cursor:
+                    staging_exists = self._table_exists(cursor, staging_table_name)
+            except self.backend.errors + (OSError,):
+                return None
+            finally:
+                if conn: self._end_read(conn)
+            if not staging_exists:
+                self._update_status(f"이전 적재 기록이 있지만 스테이징 테이블 '{staging_table_name}'이(가) 없어 처음부터 적재합니다.")
+                return None
+        return previous
+
+    def load_file_resumable(self, importer, file_input, table_name, overwrite=True, load_options=None, total_rows_hint=None):
+        # Streams `file_input` through `importer.iter_chunks` into `table_name`, recording each committed chunk in
+        # the load manifest. If an identical earlier load (same file content, options, table and mode) was
+        # interrupted, its committed chunks are skipped and the load continues from the first uncommitted one.
+        load_options = dict(load_options or {})
+        if not LOAD_MANIFEST_CONFIG['enabled']:
+            return self.load_chunks(importer.iter_chunks(file_input, **load_options), table_name, overwrite, total_rows_hint)
+        file_name = file_input if isinstance(file_input, str) else getattr(file_input, 'name', '')
+        safe_table_name = self._sanitize_identifier(table_name) or "untitled_table"
+        with self.metrics.span('file_hash'):
+            checkpoint = LoadCheckpoint.for_file(file_input, os.path.basename(file_name), safe_table_name,
+                                                 'overwrite' if overwrite else 'append', load_options, IMPORT_CONFIG['chunksize'])
+        previous = self._resume_point(checkpoint, overwrite)
+        if previous:
+            checkpoint = previous
+            self._update_status(f"중단된 적재 기록을 찾았습니다 ({checkpoint.updated_at}): 청크 {checkpoint.committed_chunks}까지 "
+                                f"{checkpoint.committed_rows:,}행이 커밋되어 있어 청크 {checkpoint.committed_chunks + 1}부터 이어서 적재합니다.")
+
+        def chunks():
+            for chunk in importer.iter_chunks(file_input, chunksize=checkpoint.chunk_rows, schema=checkpoint.schema,
+                                              skip_chunks=checkpoint.committed_chunks if previous else 0, **load_options):
+                if checkpoint.schema is None:
+                    checkpoint.schema = importer.last_schema # stored with the first checkpoint, reused on resume
+                yield chunk
+        return self.load_chunks(chunks(), table_name, overwrite, total_rows_hint, checkpoint=checkpoint)
+
+    def load_excel_sheets(self, importer, file_input, table_name, overwrite=True, sheet_names=None):
+        # Loads every sheet of a workbook (or `sheet_names`) into its own table "<table_name>_<sheet>" in one pass:
+        # the workbook is opened once and each sheet is streamed through load_chunks.
+        # The rows read across all sheets end up in last_load_rows.
+        self.last_load_rows = 0
+        results = []
+        for sheet_name, chunks in importer.iter_excel_sheets(file_input, sheet_names=sheet_names):
+            sheet_table = self._sanitize_identifier(f"{table_name}_{sheet_name}")[:64]
+            self._update_status(f"시트 '{sheet_name}' -> 테이블 '{sheet_table}' 적재를 시작합니다.")
+            chunks = CountedChunks(chunks)
+            success, message = self.load_chunks(chunks, sheet_table, overwrite)
+            self.last_load_rows += chunks.rows
+            results.append((sheet_name, success, message))
+            if self.cancel_check and self.cancel_check():
+                break
+        if not results:
+            return False, "적재할 시트가 없습니다."
+        failed = [sheet_name for sheet_name, success, _ in results if not success]
+        details = "\n".join(f"- {sheet_name}: {message}" for sheet_name, _, message in results)
+        if failed:
+            return False, f"시트 {len(results)}개 중 {len(failed)}개 적재 실패 ({', '.join(map(str, failed))}).\n{details}"
+        return True, f"시트 {len(results)}개를 각각의 테이블로 적재했습니다.\n{details}"
+
+    # --- Tail-append (growing CSV files) ---
+    def append_file_tail(self, importer, file_path, table_name, load_options=None):
+        # Appends only the rows added to a CSV file since the last run. The tail state table records, per source
+        # file, the byte offset already ingested with a header signature and checksums. While they still match,
+        # only bytes past the offset are parsed and inserted. If the file was rewritten (or on the first run) it is
+        # read in full and deduplicated against the table like append_new_data. An absent table is created.
+        self.last_load_rows = 0
+        load_options = dict(load_options or {})
+        if not isinstance(file_path, str) or os.path.splitext(file_path)[1].lower() != '.csv':
+            return False, "증분 추가 적재는 경로로 지정한 CSV 파일만 지원합니다."
+        safe_table_name = self._sanitize_identifier(table_name) or "untitled_table"
+        options = {key: load_options[key] for key in ('csv_delimiter', 'csv_encoding') if key in load_options}
+        try:
+            scan = CsvFileScan(file_path)
+        except (OSError, ValueError) as e:
+            return False, f"파일을 확인할 수 없습니다: {e}"
+        state = TailState(file_path, safe_table_name, options)
+        row = self._read_state_row(TAIL_APPEND_CONFIG['table'], TAIL_STATE_COLUMNS, state.source_key)
+        previous = TailState.from_row(row) if row else None
+        table_exists = self._target_table_exists(safe_table_name)
+
+        if previous and table_exists and previous.continues(scan):
+            state = previous
+            if scan.end == state.byte_offset:
+                return True, f"'{os.path.basename(file_path)}'에 새로 추가된 행이 없습니다. (적재된 위치 {state.byte_offset:,}바이트)"
+            self._update_status(f"이전 적재 위치 {state.byte_offset:,}바이트부터 새로 추가된 {scan.end - state.byte_offset:,}바이트만 읽습니다.")
+            columns = pd.read_csv(io.BytesIO(scan.header), sep=options.get('csv_delimiter', ','),
+                                  encoding=options.get('csv_encoding', 'utf-8'), nrows=0).columns
+            chunks = importer.iter_csv_range(file_path, state.byte_offset, scan.end, columns=columns,
+                                             schema=state.schema, **options)
+        else:
+            if previous:
+                self._update_status("파일이 처음부터 다시 작성되어(헤더/앞부분 체크섬 불일치) 전체를 읽고 중복을 확인합니다.")
+            chunks = importer.iter_csv_range(file_path, 0, scan.end, **options)
+        chunks = CountedChunks(chunks)
+
+        # A new table is created from the file; an existing one is appended to with fingerprint deduplication, so
+        # rows committed by an interrupted run (before the offset was saved) are not inserted twice.
+        success, message = self.load_chunks(chunks, safe_table_name, overwrite=not table_exists)
+        self.last_load_rows = chunks.rows
+        if not success:
+            return success, message
+        state.advance(scan, chunks.rows, importer.last_schema)
+        conn = None
+        try:
+            conn = self.backend.acquire(create_db=False)
+            with self.backend.cursor(conn) as cursor:
+                self._ensure_state_table(cursor, TAIL_APPEND_CONFIG['table'], TAIL_STATE_COLUMNS)
+                self._replace_state_row(cursor, TAIL_APPEND_CONFIG['table'], TAIL_STATE_COLUMNS, state.to_row())
+            self._commit(conn)
+        except self.backend.errors as e:
+            if conn: self._rollback(conn)
+            return True, f"{message} (적재 위치 저장 실패, 다음 실행은 중복 확인으로 다시 읽습니다: {e})"
+        finally:
+            if conn: self._release_connection(conn)
+        return True, f"{message} 다음 증분 적재는 {state.byte_offset:,}바이트부터 읽습니다."
+
+    def _target_table_exists(self, safe_table_name):
+        conn = None
+        try:
+            conn = self.backend.acquire(create_db=False)
+            with self.backend.cursor(conn) as cursor:
+                return self._table_exists(cursor, safe_table_name)
+        except self.backend.errors + (OSError,):
+            return False
+        finally:
+            if conn: self._end_read(conn)
+
+    # --- Table browsing ---
+    def _end_read(self, conn):
+        # Ends the read transaction so a pooled connection does not keep an old snapshot.
+        try:
+            self._rollback(conn)
+        except self.backend.errors:
+            pass
+        self._release_connection(conn)
+
+    def _browse_columns(self, cursor, safe_table_name, version_key):
+        # (columns to show, {indexed column: NOT NULL?}); cached per table version like the pages themselves.
+        def compute():
+            columns = [name for name, _ in self.backend.column_types(cursor, safe_table_name) if name != FINGERPRINT_COLUMN]
+            if not columns: raise ValueError(f"테이블 '{safe_table_name}'을(를) 찾을 수 없습니다.")
+            return columns, self.backend.indexed_columns(cursor, safe_table_name)
+        return self._page_cache.get_or_compute(version_key, 'browse_columns', compute)
+
+    def _check_browse_request(self, indexed, filters, sort_column):
+        # Only index-backed filters and sort orders keep each page a short index range scan.
+        for column, operator, _ in filters:
+            if column not in indexed: raise ValueError(f"인덱스가 없는 컬럼 '{column}'(으)로는 필터링할 수 없습니다.")
+            if operator not in FILTER_OPERATORS: raise ValueError(f"지원하지 않는 필터 연산자입니다: {operator}")
+        # The keyset condition compares with `=`/`<`/`>`, which NULLs never satisfy, so nullable columns cannot be sort keys.
+        if sort_column and sort_column != 'id' and not indexed.get(sort_column):
+            raise ValueError(f"'{sort_column}' 컬럼은 NOT NULL 인덱스가 없어 정렬에 사용할 수 없습니다.")
+
+    def _browse_query(self, safe_table_name, columns, filters, sort_column, descending, key=None, backward=False, limit=None):
+        # SELECT ... WHERE <filters> AND <after key> ORDER BY <sort column>, id LIMIT n.
+        # Seeks straight to the position instead of skipping rows with OFFSET, so page 10,000 costs what page 1 does.
+        q, p = self.backend.quote, self.backend.placeholder
+        where, params = [], []
+        for column, operator, value in filters:
+            if operator in ('IS NULL', 'IS NOT NULL'):
+                where.append(f"{q(column)} {operator}")
+            else:
+                where.append(f"{q(column)} {operator} {p}")
+                params.append(value)
+        # Going backward scans the opposite way from the requested order; fetch_page flips the rows back.
+        scan_descending = descending != backward
+        comparison = '<' if scan_descending else '>'
+        direction = 'DESC' if scan_descending else 'ASC'
+        sort_column = sort_column if sort_column != 'id' else None
+        if key is not None:
+            if sort_column:
+                where.append(f"({q(sort_column)} {comparison} {p} OR ({q(sort_column)} = {p} AND {q('id')} {comparison} {p}))")
+                params += [key[0], key[0], key[1]]
+            else:
+                where.append(f"{q('id')} {comparison} {p}")
+                params.append(key[1])
+        order = ([f"{q(sort_column)} {direction}"] if sort_column else []) + [f"{q('id')} {direction}"]
+        query = f"SELECT {', '.join(q(column) for column in columns)} FROM {q(safe_table_name)}"
+        if where: query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY " + ", ".join(order)
+        if limit: query += f" LIMIT {int(limit)}"
+        return query, params
+
+    def browse_options(self, table_name):
+        # {'columns', 'filterable', 'sortable'} for building a browse UI; None (with a status message) on failure.
+        conn = None
+        safe_table_name = self._sanitize_identifier(table_name)
+        try:
+            conn = self.backend.acquire(create_db=False)
+            with self.backend.cursor(conn) as cursor:
+                version_key = self._browse_version_key(cursor, safe_table_name)
+                columns, indexed = self._browse_columns(cursor, safe_table_name, version_key)
+            return {'columns': columns,
+                    'filterable': [column for column in columns if column in indexed],
+                    'sortable': [column for column in columns if column == 'id' or indexed.get(column)]}
+        except self.backend.errors + (ValueError, OSError) as e:
+            self._update_status(f"테이블 정보 조회 실패: {e}")
+            return None
+        finally:
+            if conn: self._end_read(conn)
+
+    def _browse_version_key(self, cursor, safe_table_name):
+        version = self.backend.table_version(cursor, safe_table_name)
+        return f"{self.backend.name}:{self.backend.describe()}:{safe_table_name}:{version!r}"
+
+    def fetch_page(self, table_name, key=None, backward=False, page_size=None, filters=None, sort_column=None, descending=False):
+        # One page of `table_name` by keyset pagination on (sort_column, id). `key` is a TablePage's
+        # last_key (next page) or first_key with backward=True (previous page); None starts from the top.
+        # `filters` is a list of (column, operator, value) on indexed columns. Returns a TablePage, or None on failure.
+        page_size = int(page_size or BROWSE_CONFIG['page_size'])
+        filters = [tuple(item) for item in (filters or [])]
+        safe_table_name = self._sanitize_identifier(table_name)
+        conn = None
+        try:
+            conn = self.backend.acquire(create_db=False)
+            with self.backend.cursor(conn) as cursor:
+                version_key = self._browse_version_key(cursor, safe_table_name)
+                columns, indexed = self._browse_columns(cursor, safe_table_name, version_key)
+                self._check_browse_request(indexed, filters, sort_column)
+
+                def compute():
+                    # One extra row tells whether another page follows in the scan direction.
+                    query, params = self._browse_query(safe_table_name, columns, filters, sort_column, descending,
+                                                       key, backward, limit=page_size + 1)
+                    with self.metrics.span('browse_page'):
+                        cursor.execute(query, params)
+                        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+                request = repr((filters, sort_column, bool(descending), key, bool(backward), page_size))
+                rows = self._page_cache.get_or_compute(version_key, 'page', compute, request)
+        except self.backend.errors + (ValueError, OSError) as e:
+            self._update_status(f"테이블 페이지 조회 실패: {e}")
+            return None
+        finally:
+            if conn: self._end_read(conn)
+
+        more = len(rows) > page_size
+        rows = rows.iloc[:page_size]
+        if backward:
+            rows = rows.iloc[::-1]
+        rows = rows.reset_index(drop=True)
+        if backward:
+            return TablePage(rows, sort_column, has_previous=more, has_next=True)
+        return TablePage(rows, sort_column, has_previous=key is not None, has_next=more)
+
+    def export_table(self, table_name, file_path, filters=None, sort_column=None, descending=False, chunk_rows=None):
+        # Writes the (filtered, sorted) table to a UTF-8 CSV through a server-side cursor: rows stream from the
+        # database `chunk_rows` at a time, so memory stays flat however large the table is.
+        chunk_rows = int(chunk_rows or BROWSE_CONFIG['export_chunk_rows'])
+        filters = [tuple(item) for item in (filters or [])]
+        safe_table_name = self._sanitize_identifier(table_name)
+        conn = None
+        written_rows = 0
+        try:
+            conn = self._connect_to_db()
+            if not conn: return False, "데이터베이스에 연결할 수 없습니다."
+            with self.backend.cursor(conn) as cursor:
+                columns, indexed = self._browse_columns(cursor, safe_table_name, self._browse_version_key(cursor, safe_table_name))
+                self._check_browse_request(indexed, filters, sort_column)
+            query, params = self._browse_query(safe_table_name, columns, filters, sort_column, descending)
+            directory = os.path.dirname(file_path)
+            if directory: os.makedirs(directory, exist_ok=True)
+            started_at = time.perf_counter()
+            with self.metrics.span('export'), self.backend.streaming_cursor(conn) as cursor, \
+                    open(file_path, 'w', encoding='utf-8-sig', newline='') as output:
+                cursor.execute(query, params)
+                # Header first, so an empty result still produces a valid CSV.
+                pd.DataFrame(columns=columns).to_csv(output, index=False)
+                while True:
+                    self._raise_if_cancelled()
+                    rows = cursor.fetchmany(chunk_rows)
+                    if not rows: break
+                    pd.DataFrame.from_records(rows, columns=columns).to_csv(output, header=False, index=False)
+                    written_rows += len(rows)
+                    rate = written_rows / max(time.perf_counter() - started_at, 1e-9)
+                    self._update_status(f"내보내기 진행: {written_rows:,}행, {rate:,.0f}행/초")
+            return True, f"테이블 '{safe_table_name}'의 {written_rows:,}행을 '{file_path}'(으)로 내보냈습니다."
+        except (OperationCancelled, ValueError, OSError) + self.backend.errors as e:
+            self._update_status(f"내보내기 실패: {e}")
+            return False, f"내보내기 중 오류 발생 ({written_rows:,}행까지 기록됨): {e}"
+        finally:
+            if conn: self._end_read(conn)
@@ -0,0 +1,72 @@
+import pandas as pd
+from .database_manager import stored_row_fingerprints
+from .frame_compaction import make_room
+
+class EditLog:
+    # Row-level change log for an edited DataFrame, keyed by its index labels.
+    # Rows that came from the file remember the fingerprint they had when loaded, which is how
+    # DatabaseManager.sync_changes finds their `id` in the table.
+    def __init__(self):
+        self.changes = {} # label -> {'op': 'update' | 'insert' | 'delete', 'fingerprint': str or None}
+
+    @property
+    def pending_count(self):
+        return len(self.changes)
+
+    def clear(self):
+        self.changes = {}
+
+    def apply_editor_delta(self, df, delta):
+        # Applies a st.data_editor delta ({'edited_rows', 'added_rows', 'deleted_rows'}, positional) to `df`
+        # and returns the patched frame. Only touched rows are fingerprinted or copied.
+        edited_rows = delta.get('edited_rows', {})
+        deleted_positions = delta.get('deleted_rows', [])
+        added_rows = delta.get('added_rows', [])
+        if not (edited_rows or deleted_positions or added_rows):
+            return df
+
+        edited_labels = [df.index[int(position)] for position in edited_rows]
+        deleted_labels = [df.index[int(position)] for position in deleted_positions]
+        untracked = [label for label in dict.fromkeys(edited_labels + deleted_labels) if label not in self.changes]
+        if untracked:
+            # Same columns as the table's fingerprints, so columns the table does not store (e.g. '#') do not count.
+            original_fingerprints = stored_row_fingerprints(df.loc[untracked])
+            for label in untracked:
+                self.changes[label] = {'op': 'update', 'fingerprint': original_fingerprints[label]}
+
+        for position, cells in edited_rows.items():
+            label = df.index[int(position)]
+            for column, value in cells.items():
+                df[column] = make_room(df[column], [value]) # a compacted column may need a new category or width
+                df.loc[label, column] = pd.NA if value is None else value
+
+        for label in deleted_labels:
+            if self.changes[label]['op'] == 'insert':
+                del self.changes[label] # never reached the database
+            else:
+                self.changes[label]['op'] = 'delete'
+        if deleted_labels:
+            df = df.drop(index=deleted_labels)
+
+        if added_rows:
+            next_label = (max(df.index) + 1) if len(df.index) and pd.api.types.is_integer_dtype(df.index.dtype) else len(df)
+            labels = list(range(next_label, next_label + len(added_rows)))
+            added = pd.DataFrame(added_rows, index=labels, columns=df.columns)
+            for column in added.columns:
+                df[column] = make_room(df[column], added[column].tolist())
+                try:
+                    added[column] = added[column].astype(df[column].dtype)
+                except (ValueError, TypeError):
+                    pass # e.g. text typed into a numeric column; concat falls back to a wider dtype
+            df = pd.concat([df, added])
+            for label in labels:
+                self.changes[label] = {'op': 'insert', 'fingerprint': None}
+        return df
+
+    def sync_payload(self, df):
+        # Returns (updated rows, their original fingerprints, inserted rows, fingerprints of deleted rows).
+        update_labels = [label for label, change in self.changes.items() if change['op'] == 'update' and label in df.index]
+        insert_labels = [label for label, change in self.changes.items() if change['op'] == 'insert' and label in df.index]
+        deleted = [change['fingerprint'] for change in self.changes.values() if change['op'] == 'delete']
+        return (df.loc[update_labels], [self.changes[label]['fingerprint'] for label in update_labels],
+                df.loc[insert_labels], deleted)
@@ -0,0 +1,135 @@
+import pandas as pd
+from .config import EXCEL_CONFIG
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# Cell texts read_excel treats as missing by default.
+NA_STRINGS = {'', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A',
+              'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'}
+
+def streaming_engine(extension):
+    # Row-streaming reader for the extension: python-calamine (Rust, also reads .xls) when installed, otherwise
+    # openpyxl in read-only mode for .xlsx. None means only pd.read_excel can read it.
+    engine = EXCEL_CONFIG['engine']
+    if engine in ('auto', 'calamine') and CalamineWorkbook is not None:
+        return 'calamine'
+    if engine in ('auto', 'openpyxl') and openpyxl is not None and extension != '.xls':
+        return 'openpyxl'
+    return None
+
+def cell_text(value):
+    # The text read_excel(dtype=str) produces for one cell; None for an empty or NA cell.
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) # Excel stores every number as a float; whole numbers read back as ints
+    text = str(value)
+    return None if text in NA_STRINGS else text
+
+def column_names(header):
+    # Header cells as read_excel names them: empty cells become "Unnamed: <position>", repeats get ".1", ".2", ...
+    names = []
+    seen = {}
+    for position, value in enumerate(header):
+        name = value if value is not None else f"Unnamed: {position}"
+        base = name
+        while name in seen:
+            seen[base] += 1
+            name = f"{base}.{seen[base]}"
+        seen[name] = 0
+        names.append(name)
+    return names
+
+class ExcelWorkbook:
+    # One open workbook whose sheets are read row by row and handed out as DataFrames of text, instead of
+    # pd.read_excel building the whole sheet (and re-parsing the workbook for every other sheet).
+    def __init__(self, file_object, extension):
+        self.engine = streaming_engine(extension)
+        if hasattr(file_object, 'seek'):
+            file_object.seek(0)
+        if self.engine == 'calamine':
+            self._book = CalamineWorkbook.from_object(file_object)
+            self.sheet_names = list(self._book.sheet_names)
+        elif self.engine == 'openpyxl':
+            # read_only streams the sheet XML; data_only reads cached formula results like read_excel does.
+            self._book = openpyxl.load_workbook(file_object, read_only=True, data_only=True, keep_links=False)
+            self.sheet_names = list(self._book.sheetnames)
+        else:
+            raise ImportError(f"'{extension}' 파일을 스트리밍으로 읽을 엔진(python-calamine 또는 openpyxl)이 없습니다.")
+        self.columns = None # column names of the sheet read last
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if hasattr(self._book, 'close'):
+            self._book.close()
+
+    def sheet_name(self, sheet):
+        # `sheet` is a name or a 0-based position, as for read_excel's sheet_name.
+        if isinstance(sheet, int) and not isinstance(sheet, bool):
+            if not 0 <= sheet < len(self.sheet_names):
+                raise ValueError(f"시트 번호 {sheet}이(가) 범위를 벗어났습니다 (시트 {len(self.sheet_names)}개).")
+            return self.sheet_names[sheet]
+        if sheet not in self.sheet_names:
+            raise ValueError(f"시트 '{sheet}'을(를) 찾을 수 없습니다. (시트 목록: {', '.join(self.sheet_names)})")
+        return sheet
+
+    def _rows(self, name):
+        if self.engine == 'calamine':
+            sheet = self._book.get_sheet_by_name(name)
+            return sheet.iter_rows() if hasattr(sheet, 'iter_rows') else iter(sheet.to_python())
+        sheet = self._book[name]
+        sheet.reset_dimensions() # stored dimensions can be wrong; read every row that is actually there
+        return sheet.iter_rows(values_only=True)
+
+    def iter_frames(self, sheet=0, chunksize=None):
+        # DataFrames of at most `chunksize` rows (object columns of text, None for empty cells). The first non-empty
+        # row is the header and cells past its last cell are ignored. Like read_excel, empty rows inside the data are
+        # kept as all-missing rows and only trailing empty rows are dropped; blank rows above the header are skipped.
+        name = self.sheet_name(sheet)
+        chunksize = chunksize or EXCEL_CONFIG['chunk_rows']
+        self.columns = None
+        batch = []
+        pending = [] # empty rows, kept only if a non-empty row follows
+        start = 0
+        for row in self._rows(name):
+            values = [cell_text(value) for value in row]
+            if self.columns is None:
+                if all(value is None for value in values):
+                    continue
+                while values and values[-1] is None:
+                    values.pop()
+                self.columns = column_names(values)
+                continue
+            width = len(self.columns)
+            values = values[:width] + [None] * (width - len(values))
+            pending.append(values)
+            if all(value is None or value == '' for value in row):
+                continue
+            for values in pending:
+                batch.append(values)
+                if len(batch) == chunksize:
+                    yield pd.DataFrame(batch, columns=self.columns, index=pd.RangeIndex(start, start + len(batch)), dtype=object)
+                    start += len(batch)
+                    batch = []
+            pending = []
+        if batch:
+            yield pd.DataFrame(batch, columns=self.columns, index=pd.RangeIndex(start, start + len(batch)), dtype=object)
+
+    def read_sheet(self, sheet=0):
+        # The whole sheet as one frame (an empty sheet gives an empty frame).
+        frames = list(self.iter_frames(sheet))
+        if not frames:
+            return pd.DataFrame(columns=self.columns or [], dtype=object)
+        return pd.concat(frames) if len(frames) > 1 else frames[0]
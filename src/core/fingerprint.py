@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+FINGERPRINT_COLUMN = '_row_fingerprint'
+FINGERPRINT_LENGTH = 32
+
+# Two independent 64-bit hashes give a 128-bit fingerprint (hash_key must be 16 characters).
+_HASH_KEYS = ('PreChart2DB:fp:1', 'PreChart2DB:fp:2')
+_NULL_TOKEN = '\x00'
+
+
+def _normalize_column(series):
+    # Integral floats are written like ints so that 3 and 3.0 (e.g. after a NaN forced a float column) match.
+    if pd.api.types.is_float_dtype(series.dtype):
+        # float32 (a compacted frame) is widened first, so its values print exactly as the float64 they came from.
+        series = series.astype('float64')
+        text = series.astype(str)
+        integral = series.notna() & (series % 1 == 0) & (series.abs() < 2 ** 53)
+        if integral.any():
+            text = text.astype(object)
+            text[integral] = series[integral].astype('int64').astype(str)
+        return text.where(series.notna(), _NULL_TOKEN)
+    return series.astype(object).where(series.notna(), _NULL_TOKEN).astype(str)
+
+
+def row_fingerprints(df):
+    # Per-row 128-bit hex fingerprint over the stringified values of every column, in column order.
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+    normalized = pd.DataFrame({i: _normalize_column(df.iloc[:, i]) for i in range(df.shape[1])}, index=df.index)
+    high, low = (pd.util.hash_pandas_object(normalized, index=False, hash_key=key).to_numpy(dtype=np.uint64)
+                 for key in _HASH_KEYS)
+    return pd.Series([f"{h:016x}{l:016x}" for h, l in zip(high.tolist(), low.tolist())], index=df.index, dtype=object)
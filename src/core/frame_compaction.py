@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+from .config import COMPACTION_CONFIG
+
+try:
+    import pyarrow # backs pandas' Arrow string dtype
+except ImportError:
+    pyarrow = None
+
+def arrow_string_dtype():
+    # Arrow-backed string dtype with NaN as missing value (pandas' default `str` dtype from 3.0 on); None without pyarrow.
+    if pyarrow is None:
+        return None
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError: # pandas < 2.3
+        return pd.StringDtype('pyarrow')
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:,.0f} {unit}" if unit == 'B' else f"{size:,.1f} {unit}"
+        size /= 1024
+
+def _is_narrowed(dtype):
+    # Integer and float dtypes narrower than 64 bits, i.e. what compact_column may have produced.
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return False
+    return np.dtype(getattr(dtype, 'numpy_dtype', dtype)).itemsize < 8
+
+def compact_column(series, config=None):
+    # Same values in a smaller dtype: low-cardinality text as 'category', integers at the smallest width that
+    # holds them, floats as float32 when that is lossless, other text as Arrow strings. Booleans and datetimes stay.
+    config = config if config else COMPACTION_CONFIG
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        return pd.to_numeric(series, downcast='integer') if config['downcast_integers'] else series
+    if pd.api.types.is_float_dtype(dtype):
+        if config['downcast_floats'] and dtype == np.float64:
+            narrowed = series.astype('float32')
+            if np.array_equal(narrowed.to_numpy(dtype='float64'), series.to_numpy(), equal_nan=True):
+                return narrowed
+        return series
+    if pd.api.types.is_numeric_dtype(dtype):
+        return series
+
+    non_null = series.count()
+    if non_null and series.nunique() <= non_null * config['category_max_ratio']:
+        return series.astype('category')
+    target = arrow_string_dtype() if config['arrow_strings'] else None
+    if target is not None and dtype != target:
+        try:
+            return series.astype(target)
+        except (TypeError, ValueError, pyarrow.ArrowException):
+            pass # e.g. values that are not text at all
+    return series
+
+def compact_frame(df, config=None):
+    # Returns (compacted frame, CompactionReport) for a typed frame from DataImporter.
+    columns = {}
+    rows = []
+    for name in df.columns:
+        series = df[name]
+        compacted = compact_column(series, config)
+        columns[name] = compacted
+        rows.append((name, str(series.dtype), int(series.memory_usage(index=False, deep=True)),
+                     str(compacted.dtype), int(compacted.memory_usage(index=False, deep=True))))
+    return pd.DataFrame(columns, index=df.index), CompactionReport(rows)
+
+def make_room(series, values):
+    # `series`, or a wider version of it, that can hold `values` exactly: for edits of a compacted frame.
+    # Missing categories are added; narrowed numbers go back to 64 bits.
+    values = [value for value in values if not pd.isna(value)]
+    if not values:
+        return series
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        new = [value for value in dict.fromkeys(values) if value not in dtype.categories]
+        if not new:
+            return series
+        try:
+            return series.cat.add_categories(new)
+        except (TypeError, ValueError):
+            return series.astype(object)
+    if _is_narrowed(dtype):
+        if pd.api.types.is_float_dtype(dtype):
+            return series.astype('float64')
+        return series.astype('Int64' if isinstance(dtype, pd.api.extensions.ExtensionDtype) else 'int64')
+    return series
+
+class CompactionReport:
+    # Per-column memory before and after compact_frame, in bytes (deep memory_usage).
+    def __init__(self, rows):
+        self.rows = rows # (column, dtype before, bytes before, dtype after, bytes after)
+
+    @property
+    def before_bytes(self):
+        return sum(row[2] for row in self.rows)
+
+    @property
+    def after_bytes(self):
+        return sum(row[4] for row in self.rows)
+
+    def table(self):
+        return pd.DataFrame([[name, before_dtype, format_bytes(before), after_dtype, format_bytes(after)]
+                             for name, before_dtype, before, after_dtype, after in self.rows],
+                            columns=['컬럼', '기존 dtype', '기존 메모리', '압축 dtype', '압축 메모리'])
+
+    def summary(self):
+        before, after = self.before_bytes, self.after_bytes
+        saved = (1 - after / before) * 100 if before else 0.0
+        return f"메모리 사용량: {format_bytes(before)} -> {format_bytes(after)} ({saved:.0f}% 절감)"
+
+    def memory_report(self):
+        return f"--- 데이터프레임 메모리 압축 ---\n{self.table().to_string(index=False)}\n{self.summary()}"
@@ -0,0 +1,81 @@
+import datetime
+import hashlib
+import json
+from .parse_cache import file_content_hash
+from .type_inference import TableSchema
+
+# Columns of the load manifest table (LOAD_MANIFEST_CONFIG['table']), in the order of LoadCheckpoint.to_row.
+MANIFEST_COLUMNS = (
+    ('load_key', 'VARCHAR(64) NOT NULL'),
+    ('file_name', 'VARCHAR(255)'),
+    ('file_hash', 'VARCHAR(64)'),
+    ('target_table', 'VARCHAR(64)'),
+    ('load_mode', 'VARCHAR(16)'),
+    ('options', 'TEXT'),
+    ('table_schema', 'TEXT'),
+    ('chunk_rows', 'BIGINT'),
+    ('committed_chunks', 'BIGINT'),
+    ('committed_rows', 'BIGINT'),
+    ('inserted_rows', 'BIGINT'),
+    ('status', 'VARCHAR(16)'),
+    ('started_at', 'VARCHAR(32)'),
+    ('updated_at', 'VARCHAR(32)'),
+)
+
+def _now():
+    return datetime.datetime.now().isoformat(sep=' ', timespec='seconds')
+
+class LoadCheckpoint:
+    # One streaming load as recorded in the load manifest: what is loaded (file hash, read options, target table,
+    # mode, chunk size) and how far it got (chunks and rows committed). The key covers everything that decides
+    # chunk boundaries and converted values, so only an identical re-run picks up where the last one stopped.
+    def __init__(self, file_name, file_hash, target_table, mode, options, chunk_rows, schema=None,
+                 committed_chunks=0, committed_rows=0, inserted_rows=0, status='new', started_at=None, updated_at=None):
+        self.file_name = file_name
+        self.file_hash = file_hash
+        self.target_table = target_table
+        self.mode = mode
+        self.options = dict(options)
+        self.chunk_rows = int(chunk_rows)
+        self.schema = schema # TableSchema the chunks were converted with; set once the first chunk is read
+        self.committed_chunks = int(committed_chunks)
+        self.committed_rows = int(committed_rows)
+        self.inserted_rows = int(inserted_rows)
+        self.status = status # new, running, failed, completed
+        self.started_at = started_at or _now()
+        self.updated_at = updated_at or self.started_at
+        identity = json.dumps([file_hash, target_table, mode, self.options, self.chunk_rows], sort_keys=True, default=str)
+        self.load_key = hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def for_file(cls, file_input, file_name, target_table, mode, options, chunk_rows):
+        return cls(file_name, file_content_hash(file_input), target_table, mode, options, chunk_rows)
+
+    @classmethod
+    def from_row(cls, row):
+        values = dict(zip((name for name, _ in MANIFEST_COLUMNS), row))
+        schema = TableSchema.from_dicts(json.loads(values['table_schema'])) if values['table_schema'] else None
+        return cls(values['file_name'], values['file_hash'], values['target_table'], values['load_mode'],
+                   json.loads(values['options'] or '{}'), values['chunk_rows'], schema,
+                   values['committed_chunks'], values['committed_rows'], values['inserted_rows'],
+                   values['status'], values['started_at'], values['updated_at'])
+
+    @property
+    def resumable(self):
+        # An interrupted load with at least one committed chunk ('running' means it died without recording a failure).
+        return self.status in ('running', 'failed') and self.committed_chunks > 0
+
+    def to_row(self, **changes):
+        # Manifest row with `changes` (e.g. status or counters) applied, without modifying this object.
+        values = dict(vars(self), **changes)
+        schema = values['schema']
+        return (self.load_key, values['file_name'], values['file_hash'], values['target_table'], values['mode'],
+                json.dumps(values['options'], sort_keys=True, default=str),
+                json.dumps(schema.to_dicts()) if schema is not None else None,
+                values['chunk_rows'], values['committed_chunks'], values['committed_rows'], values['inserted_rows'],
+                values['status'], values['started_at'], _now())
+
+    def update(self, **changes):
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self.updated_at = _now()
@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+import pandas as pd
+from .config import METRICS_CONFIG
+
+class Span:
+    # One timed stage. Callers fill in `rows` / `nbytes` inside the with-block when they know them.
+    def __init__(self, name, run_id, parent, rows=None, nbytes=None):
+        self.name = name
+        self.run_id = run_id
+        self.parent = parent
+        self.rows = rows
+        self.nbytes = nbytes
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_memory_bytes = None
+        self.error = None
+        self._peak_traced = 0
+        self._start_traced = 0
+
+    def to_dict(self):
+        return {
+            'run_id': self.run_id, 'span': self.name, 'parent': self.parent,
+            'wall_seconds': round(self.wall_seconds, 6), 'cpu_seconds': round(self.cpu_seconds, 6),
+            'rows': self.rows, 'bytes': self.nbytes, 'peak_memory_bytes': self.peak_memory_bytes, 'error': self.error,
+        }
+
+class MetricsRecorder:
+    # Collects stage spans for DataImporter / DatabaseManager runs. Spans nest per thread; CPU time is the
+    # thread's own (time.thread_time). Peak memory uses tracemalloc, which slows Python allocations down,
+    # so it is only measured when `trace_memory` is on.
+    def __init__(self, trace_memory=None, export_path=None):
+        self.trace_memory = METRICS_CONFIG['trace_memory'] if trace_memory is None else trace_memory
+        self.export_path = export_path if export_path else METRICS_CONFIG['export_path']
+        self.records = []
+        self.runs = [] # (run_id, label, started_at) in start order
+        self.current_run = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start_run(self, label):
+        run_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self.runs.append((run_id, label, time.time()))
+            self.current_run = run_id
+            # Only keep a bounded history in memory; exported lines are the long-term record.
+            if len(self.runs) > METRICS_CONFIG['max_runs']:
+                dropped = {run[0] for run in self.runs[:-METRICS_CONFIG['max_runs']]}
+                self.runs = self.runs[-METRICS_CONFIG['max_runs']:]
+                self.records = [record for record in self.records if record['run_id'] not in dropped]
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return run_id
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name, rows=None, nbytes=None):
+        stack = self._stack()
+        current = Span(name, self.current_run, stack[-1].name if stack else None, rows, nbytes)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            traced, peak = tracemalloc.get_traced_memory()
+            for outer in stack: # fold the peak so far into enclosing spans before resetting it
+                outer._peak_traced = max(outer._peak_traced, peak)
+            tracemalloc.reset_peak()
+            current._start_traced = current._peak_traced = traced
+        stack.append(current)
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield current
+        except BaseException as e:
+            current.error = type(e).__name__
+            raise
+        finally:
+            current.wall_seconds = time.perf_counter() - wall_start
+            current.cpu_seconds = time.thread_time() - cpu_start
+            stack.pop()
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                current.peak_memory_bytes = max(current._peak_traced, peak) - current._start_traced
+                for outer in stack:
+                    outer._peak_traced = max(outer._peak_traced, peak)
+            with self._lock:
+                self.records.append(current.to_dict())
+
+    def run_records(self, run_id=None):
+        run_id = run_id if run_id else self.current_run
+        with self._lock:
+            return [record for record in self.records if record['run_id'] == run_id]
+
+    def breakdown(self, run_id=None):
+        # Per-stage totals for one run (the latest by default). Shares are relative to top-level span time.
+        records = self.run_records(run_id)
+        columns = ['단계', '호출 수', '경과(초)', 'CPU(초)', '비율(%)', '행 수', '행/초', '바이트', '최대 메모리(MB)']
+        if not records:
+            return pd.DataFrame(columns=columns)
+        frame = pd.DataFrame(records)
+        for column in ('rows', 'bytes', 'peak_memory_bytes'):
+            frame[column] = pd.to_numeric(frame[column], errors='coerce')
+        total_wall = frame.loc[frame['parent'].isna(), 'wall_seconds'].sum() or frame['wall_seconds'].sum()
+        grouped = frame.groupby('span', sort=False).agg(
+            calls=('span', 'size'), wall=('wall_seconds', 'sum'), cpu=('cpu_seconds', 'sum'),
+            rows=('rows', 'sum'), bytes=('bytes', 'sum'), peak=('peak_memory_bytes', 'max'))
+        report = pd.DataFrame({
+            '단계': grouped.index,
+            '호출 수': grouped['calls'].to_numpy(),
+            '경과(초)': grouped['wall'].round(3).to_numpy(),
+            'CPU(초)': grouped['cpu'].round(3).to_numpy(),
+            '비율(%)': (grouped['wall'] / total_wall * 100).round(1).to_numpy() if total_wall else 0.0,
+            '행 수': grouped['rows'].fillna(0).astype('int64').to_numpy(),
+            '행/초': (grouped['rows'].fillna(0) / grouped['wall'].where(grouped['wall'] > 0)).fillna(0).round().astype('int64').to_numpy(),
+            '바이트': grouped['bytes'].fillna(0).astype('int64').to_numpy(),
+            '최대 메모리(MB)': (grouped['peak'] / (1024 * 1024)).round(1).to_numpy(),
+        })
+        return report.sort_values('경과(초)', ascending=False, kind='stable').reset_index(drop=True)
+
+    def format_breakdown(self, run_id=None):
+        report = self.breakdown(run_id)
+        if report.empty:
+            return "측정된 단계가 없습니다."
+        return f"--- 단계별 성능 측정 ---\n{report.to_string(index=False)}"
+
+    def to_jsonl(self, run_id=None):
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.run_records(run_id))
+
+    def export(self, run_id=None, path=None):
+        # Appends the run's spans to a JSON lines file; returns the path, or None when no path is configured.
+        path = path if path else self.export_path
+        if not path:
+            return None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(self.to_jsonl(run_id))
+        return path
+
+class NullMetrics:
+    # Stand-in when no recorder is passed: spans run the block but record nothing.
+    @contextmanager
+    def span(self, name, rows=None, nbytes=None):
+        yield Span(name, None, None, rows, nbytes)
+
+NULL_METRICS = NullMetrics()
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+from .config import CACHE_CONFIG
+from .type_inference import TableSchema
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError: # pyarrow is optional; without it the cache is disabled
+    pa = feather = None
+
+# Bump when the parse/type-conversion logic changes so old entries are not reused.
+CACHE_FORMAT_VERSION = 3
+# Arrow schema metadata key holding the inferred TableSchema (kinds, decimal scale, datetime format).
+SCHEMA_METADATA_KEY = b'prechart2db.table_schema'
+
+def file_content_hash(file_input):
+    # Hash of a file's bytes (path, buffer or seekable file object); the read position is left unchanged.
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(file_input, str):
+        with open(file_input, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    elif hasattr(file_input, 'getbuffer'): # e.g. Streamlit UploadedFile / BytesIO
+        digest.update(file_input.getbuffer())
+    else:
+        position = file_input.tell()
+        for block in iter(lambda: file_input.read(1024 * 1024), b''):
+            digest.update(block)
+        file_input.seek(position)
+    return digest.hexdigest()
+
+class ParsedFileCache:
+    # Stores parsed, typed DataFrames as Arrow IPC files keyed by file content + load options.
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = directory if directory else CACHE_CONFIG['directory']
+        self.max_bytes = max_bytes if max_bytes else CACHE_CONFIG['max_bytes']
+
+    @property
+    def available(self):
+        return feather is not None
+
+    def _content_hash(self, file_input):
+        return file_content_hash(file_input)
+
+    def make_key(self, file_input, **options):
+        options_str = json.dumps({'version': CACHE_FORMAT_VERSION, **options}, sort_keys=True, default=str)
+        return f"{self._content_hash(file_input)}_{hashlib.blake2b(options_str.encode('utf-8'), digest_size=8).hexdigest()}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.arrow")
+
+    def get(self, key):
+        # (DataFrame, TableSchema) stored under `key`, or None. The schema is stored rather than re-derived from the
+        # dtypes, which cannot tell a decimal from a float or a date-only column from a datetime one.
+        if not self.available: return None
+        path = self._path(key)
+        if not os.path.exists(path): return None
+        try:
+            table = feather.read_table(path, memory_map=True)
+            schema_json = (table.schema.metadata or {}).get(SCHEMA_METADATA_KEY)
+            if schema_json is None: raise ValueError("cache entry without a schema")
+            schema = TableSchema.from_dicts(json.loads(schema_json))
+            df = table.to_pandas()
+        except Exception:
+            os.remove(path)
+            return None
+        os.utime(path) # mark as recently used for LRU eviction
+        return df, schema
+
+    def put(self, key, df, schema):
+        if not self.available: return False
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            table = pa.Table.from_pandas(df)
+            metadata = dict(table.schema.metadata or {})
+            metadata[SCHEMA_METADATA_KEY] = json.dumps(schema.to_dicts()).encode('utf-8')
+            feather.write_feather(table.replace_schema_metadata(metadata), tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Columns pyarrow cannot represent (e.g. mixed object types) are simply not cached.
+            if os.path.exists(tmp_path): os.remove(tmp_path)
+            return False
+        self._evict()
+        return True
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.arrow'): continue
+            path = os.path.join(self.directory, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes: break
+            os.remove(path)
+            total_bytes -= size
+
+    def clear(self):
+        if not os.path.isdir(self.directory): return
+        for name in os.listdir(self.directory):
+            if name.endswith('.arrow'):
+                os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,51 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+import pandas as pd
+from .config import PROFILE_CACHE_CONFIG
+
+def dataframe_fingerprint(df):
+    # Content hash of a DataFrame: one vectorised hashing pass, computed once when the frame changes.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((df.shape, list(df.columns), [str(dtype) for dtype in df.dtypes])).encode('utf-8'))
+    if not df.empty:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _estimate_bytes(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    return sys.getsizeof(value)
+
+class ProfileCache:
+    # LRU cache of profiling results keyed by (data fingerprint, result name, column), bounded by total size.
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes if max_bytes else PROFILE_CACHE_CONFIG['max_bytes']
+        self._entries = OrderedDict() # key -> (value, size)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, fingerprint, name, compute, column=None):
+        key = (fingerprint, name, column)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+        value = compute()
+        size = _estimate_bytes(value)
+        with self._lock:
+            if key in self._entries: # computed concurrently by another session
+                return self._entries[key][0]
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
@@ -0,0 +1,192 @@
+import math
+import re
+import pandas as pd
+from .config import SCHEMA_CONFIG
+from .type_inference import ColumnType
+
+# (type, bytes, min, max)
+INTEGER_TYPES = [
+    ('TINYINT', 1, -2 ** 7, 2 ** 7 - 1),
+    ('SMALLINT', 2, -2 ** 15, 2 ** 15 - 1),
+    ('MEDIUMINT', 3, -2 ** 23, 2 ** 23 - 1),
+    ('INT', 4, -2 ** 31, 2 ** 31 - 1),
+    ('BIGINT', 8, -2 ** 63, 2 ** 63 - 1),
+]
+# strftime directives that carry a time of day; a datetime format without any of them is date-only.
+TIME_DIRECTIVES = ('%H', '%I', '%M', '%S', '%f', '%p', '%X', '%c', '%T', '%R', '%z')
+# (type, maximum bytes per value)
+TEXT_TYPES = [('TEXT', 2 ** 16 - 1), ('MEDIUMTEXT', 2 ** 24 - 1), ('LONGTEXT', 2 ** 32 - 1)]
+MAX_BYTES_PER_CHAR = 4 # utf8mb4 worst case, used for row-size limits
+MYSQL_ROW_LIMIT = 65535
+
+class ColumnPlan:
+    # Planned storage for one column. `before_*` describe the old one-size-fits-all mapping for the report.
+    def __init__(self, name, safe_name, sql_type, width, before_type, before_width):
+        self.name = name
+        self.safe_name = safe_name
+        self.sql_type = sql_type
+        self.width = width
+        self.before_type = before_type
+        self.before_width = before_width
+
+class SchemaPlan:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def width_report(self):
+        rows = [[plan.safe_name, plan.before_type, plan.before_width, plan.sql_type, plan.width] for plan in self.columns]
+        report = pd.DataFrame(rows, columns=['컬럼', '기존 타입', '기존 폭(B)', '계획 타입', '계획 폭(B)'])
+        before_total = int(report['기존 폭(B)'].sum())
+        after_total = int(report['계획 폭(B)'].sum())
+        return (f"--- 스키마 계획 (예상 최대 행 폭) ---\n{report.to_string(index=False)}\n"
+                f"행 폭 합계: {before_total:,}B -> {after_total:,}B")
+
+class SchemaPlanner:
+    # Picks right-sized MySQL types from vectorised column statistics.
+    # With exact=False (schema planned from the first streamed chunk) widths get headroom, since later chunks are unseen.
+    def __init__(self, exact=True):
+        self.exact = exact
+
+    def _legacy(self, column_type):
+        kind = column_type.kind
+        if kind == 'int': return 'BIGINT', 8
+        if kind in ('float', 'decimal'): return 'DOUBLE', 8
+        if kind == 'datetime': return 'DATETIME', 5
+        if kind == 'bool': return 'BOOLEAN', 1
+        return 'VARCHAR(255)', 255 * MAX_BYTES_PER_CHAR + 2
+
+    def _int_type(self, low, high):
+        # Smallest signed type holding [low, high]. Always signed, so appended negative values need no ALTER.
+        for sql_type, width, type_min, type_max in INTEGER_TYPES:
+            if type_min <= low and high <= type_max:
+                return sql_type, width
+        return 'BIGINT', 8
+
+    def _plan_int(self, values):
+        if values.empty or not self.exact: return 'BIGINT', 8
+        return self._int_type(int(values.min()), int(values.max()))
+
+    def _plan_decimal(self, values, column_type):
+        scale = min(column_type.scale or 0, 30)
+        if values.empty or not self.exact:
+            precision = min(65, 20 + scale)
+        else:
+            largest = float(values.abs().max())
+            integer_digits = max(1, int(math.floor(math.log10(largest))) + 1) if largest >= 1 else 1
+            precision = min(65, integer_digits + scale)
+        # MySQL packs 9 digits into 4 bytes on each side of the decimal point.
+        width = sum(4 * (digits // 9) + math.ceil((digits % 9) / 2) for digits in (precision - scale, scale))
+        return f"DECIMAL({precision}, {scale})", width
+
+    def _plan_datetime(self, column_type):
+        # DATE only when the source format has no time of day at all; midnight-only values in a format with a time
+        # part stay DATETIME, since later appends may carry times.
+        datetime_format = column_type.datetime_format
+        if datetime_format and not any(directive in datetime_format for directive in TIME_DIRECTIVES):
+            return 'DATE', 3
+        return 'DATETIME', 5
+
+    def _text_extent(self, values):
+        # (longest value in characters, longest value in UTF-8 bytes)
+        text = values.astype(str)
+        return int(text.str.len().max()), int(text.str.encode('utf-8').str.len().max())
+
+    def _plan_string(self, values):
+        if values.empty:
+            return 'VARCHAR(255)', 255 * MAX_BYTES_PER_CHAR + 2
+        max_chars, max_bytes = self._text_extent(values)
+
+        if self.exact:
+            max_chars = math.ceil(max_chars * SCHEMA_CONFIG['varchar_headroom'])
+        else:
+            max_chars = max(255, max_chars * 2)
+            max_bytes = max_chars * MAX_BYTES_PER_CHAR
+        return self._text_type(max_chars, max_bytes)
+
+    def _text_type(self, max_chars, max_bytes):
+        if max_bytes > SCHEMA_CONFIG['varchar_max_bytes']:
+            for sql_type, limit in TEXT_TYPES:
+                if max_bytes <= limit:
+                    # TEXT is stored off-page; only the pointer counts toward the row size.
+                    return sql_type, 12
+        length = max(1, max_chars)
+        return f"VARCHAR({length})", length * MAX_BYTES_PER_CHAR + (1 if length * MAX_BYTES_PER_CHAR < 256 else 2)
+
+    def plan_column(self, series, column_type, safe_name):
+        values = series.dropna()
+        kind = column_type.kind
+        if kind == 'int': sql_type, width = self._plan_int(values)
+        elif kind == 'float': sql_type, width = 'DOUBLE', 8
+        elif kind == 'decimal': sql_type, width = self._plan_decimal(values, column_type)
+        elif kind == 'bool': sql_type, width = 'BOOLEAN', 1
+        elif kind == 'datetime': sql_type, width = self._plan_datetime(column_type)
+        else: sql_type, width = self._plan_string(values)
+        before_type, before_width = self._legacy(column_type)
+        return ColumnPlan(series.name, safe_name, sql_type, width, before_type, before_width)
+
+    def widen(self, current_type, series):
+        # Column type that holds `series` as well as everything `current_type` (a MySQL COLUMN_TYPE of a planned
+        # column) already holds, or None when the values fit. Values of another kind (e.g. text in an INT column)
+        # and types the planner never emits are left to the insert.
+        values = series.dropna()
+        if values.empty:
+            return None
+        current = current_type.lower()
+        base = re.match(r'[a-z]+', current).group(0)
+        sizes = [int(size) for size in re.findall(r'\d+', current.split(')')[0])] if '(' in current else []
+
+        integer_types = {sql_type.lower(): (type_min, type_max) for sql_type, _, type_min, type_max in INTEGER_TYPES}
+        if base in integer_types:
+            if not pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+                return None
+            if pd.api.types.is_float_dtype(values.dtype) and not (values % 1 == 0).all():
+                return None
+            current_low, current_high = integer_types[base]
+            low, high = int(values.min()), int(values.max())
+            if current_low <= low and high <= current_high:
+                return None
+            return self._int_type(min(low, current_low), max(high, current_high))[0]
+
+        if base == 'decimal' and len(sizes) == 2:
+            if not pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+                return None
+            precision, scale = sizes
+            largest = float(values.abs().max())
+            integer_digits = max(1, int(math.floor(math.log10(largest))) + 1) if largest >= 1 else 1
+            if integer_digits <= precision - scale or precision >= 65:
+                return None
+            return f"DECIMAL({min(65, integer_digits + scale)}, {scale})"
+
+        if base == 'date':
+            if pd.api.types.is_datetime64_any_dtype(values.dtype) and not (values == values.dt.normalize()).all():
+                return 'DATETIME'
+            return None
+
+        if base in ('varchar', 'text', 'mediumtext'):
+            max_chars, max_bytes = self._text_extent(values)
+            text_limits = {'text': 2 ** 16 - 1, 'mediumtext': 2 ** 24 - 1}
+            if base in text_limits:
+                if max_bytes <= text_limits[base]:
+                    return None
+                return self._text_type(max_chars, max(max_bytes, SCHEMA_CONFIG['varchar_max_bytes'] + 1))[0]
+            current_chars = sizes[0] if sizes else 1
+            if max_chars <= current_chars:
+                return None
+            return self._text_type(max(current_chars, math.ceil(max_chars * SCHEMA_CONFIG['varchar_headroom'])), max_bytes)[0]
+        return None
+
+    def plan(self, df, column_mapping, schema=None):
+        # `column_mapping` is DatabaseManager's (original, sanitized) column pairs.
+        columns = []
+        for col_name, safe_name in column_mapping:
+            column_type = schema.get(col_name) if schema else None
+            if column_type is None:
+                column_type = ColumnType.from_dtype(col_name, df[col_name].dtype)
+            columns.append(self.plan_column(df[col_name], column_type, safe_name))
+
+        # Keep the declared row size under MySQL's 65,535-byte limit by moving the widest VARCHARs to TEXT.
+        while sum(plan.width for plan in columns) > MYSQL_ROW_LIMIT:
+            widest = max((plan for plan in columns if plan.sql_type.startswith('VARCHAR')), key=lambda plan: plan.width, default=None)
+            if widest is None: break
+            widest.sql_type, widest.width = 'TEXT', 12
+        return SchemaPlan(columns)
@@ -0,0 +1,290 @@
+import math
+import numpy as np
+import pandas as pd
+from .config import STREAM_PROFILE_CONFIG
+from .metrics import NULL_METRICS
+
+# Row order of StreamProfiler.describe (the union of the numeric and non-numeric summaries).
+DESCRIBE_ROWS = ('count', 'null', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max')
+
+def _bit_length(values):
+    # Bit length of each uint64 value, by binary search over shifts (exact, unlike log2 on floats).
+    values = values.copy()
+    length = np.zeros(len(values), dtype='int64')
+    for shift in (32, 16, 8, 4, 2, 1):
+        wide = values >= np.uint64(1 << shift)
+        length[wide] += shift
+        values[wide] >>= np.uint64(shift)
+    return length + (values > 0)
+
+def _normalize_values(values):
+    # Integral floats as ints, so that 3 and 3.0 (a chunk with a NaN turns an int column into float) are one value.
+    if not pd.api.types.is_float_dtype(values.dtype):
+        return values
+    values = values.astype('float64')
+    integral = (values % 1 == 0) & (values.abs() < 2 ** 53)
+    if integral.all():
+        return values.astype('int64')
+    if integral.any():
+        mixed = values.to_numpy(dtype=object)
+        mixed[integral.to_numpy()] = values[integral].astype('int64').tolist()
+        values = pd.Series(mixed, index=values.index, name=values.name)
+    return values
+
+def _hash_values(values):
+    # 64-bit hash per (non-null, normalized) value over its text, like fingerprint._normalize_column, so equal values
+    # hash equally across chunks whatever dtype each chunk was read with.
+    return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy(dtype=np.uint64)
+
+class ReservoirSample:
+    # Uniform random sample of at most `size` rows: every row draws a random priority and the `size` smallest
+    # survive (bottom-k sampling). The survivors are kept in file order so the preview reads naturally.
+    def __init__(self, size, rng):
+        self.size = size
+        self.rng = rng
+        self.rows = None
+        self._priorities = None
+
+    def update(self, chunk):
+        priorities = self.rng.random(len(chunk))
+        if self.rows is None:
+            rows = chunk
+        else:
+            rows = pd.concat([self.rows, chunk])
+            priorities = np.concatenate([self._priorities, priorities])
+        if len(rows) > self.size:
+            keep = np.sort(np.argpartition(priorities, self.size)[:self.size])
+            rows, priorities = rows.iloc[keep], priorities[keep]
+        self.rows, self._priorities = rows, priorities
+
+class HyperLogLog:
+    # Distinct-count estimate from 2**precision one-byte registers; standard error is about 1.04 / sqrt(2**precision).
+    def __init__(self, precision):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype='uint8')
+
+    def update(self, hashes):
+        if not len(hashes): return
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - _bit_length(remainder) + 1
+        np.maximum.at(self.registers, index, rank.astype('uint8'))
+
+    def estimate(self):
+        m = len(self.registers)
+        raw = 0.7213 / (1 + 1.079 / m) * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype('int64'))))
+        empty = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and empty:
+            return m * math.log(m / empty) # linear counting is more accurate for small cardinalities
+        return raw
+
+class QuantileSketch:
+    # KLL-style compactor stack: items on level h stand for 2**h values. A level holding more than `capacity`
+    # items is sorted and every other item (random offset) moves up a level, so memory grows with log(n)
+    # while the rank error stays around n / capacity.
+    def __init__(self, capacity, rng):
+        self.capacity = capacity
+        self.rng = rng
+        self.levels = [np.empty(0)]
+
+    def update(self, values):
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.capacity:
+                items = np.sort(items)
+                remainder, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+                self.levels[level] = remainder
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[self.rng.integers(2)::2]])
+            level += 1
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(values), float(1 << level)) for level, values in enumerate(self.levels)])
+        return items, weights
+
+    def quantiles(self, fractions):
+        items, weights = self._weighted_items()
+        if not len(items): return [None for _ in fractions]
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(fractions, dtype=float) * cumulative[-1])
+        return [float(items[min(position, len(items) - 1)]) for position in positions]
+
+    def histogram(self, edges):
+        items, weights = self._weighted_items()
+        counts, _ = np.histogram(items, bins=edges, weights=weights)
+        return np.rint(counts).astype('int64')
+
+class HeavyHitters:
+    # Misra-Gries summary in its mergeable form: counts are exact until more than `capacity` distinct values
+    # have been seen; from then on every kept count is low by at most `error`.
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.error = 0
+
+    def update(self, values):
+        counts = values.value_counts(sort=False)
+        merged = self.counts.add(counts, fill_value=0) if len(self.counts) else counts
+        if len(merged) > self.capacity:
+            threshold = merged.nlargest(self.capacity + 1).iloc[-1]
+            merged = merged[merged > threshold] - threshold
+            self.error += int(threshold)
+        self.counts = merged.astype('int64')
+
+    def top(self, limit):
+        return self.counts.nlargest(limit)
+
+class _ColumnProfile:
+    def __init__(self, dtype, config, rng):
+        self.dtype = dtype
+        self.numeric = pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        self.nulls = 0
+        self.count = 0
+        self.distinct = HyperLogLog(config['hll_precision'])
+        self.frequent = HeavyHitters(config['heavy_hitters'])
+        if self.numeric:
+            self.quantiles = QuantileSketch(config['quantile_capacity'], rng)
+            self.numeric_count = 0
+            self.mean = self.m2 = 0.0
+            self.low = self.high = None
+
+    def update(self, series):
+        values = series.dropna()
+        self.nulls += len(series) - len(values)
+        self.count += len(values)
+        if not len(values): return
+        normalized = _normalize_values(values)
+        self.distinct.update(_hash_values(normalized))
+        self.frequent.update(normalized)
+        if self.numeric:
+            # A later chunk may hold text where the first chunk was numeric (see DataImporter._convert_types).
+            numbers = pd.to_numeric(values, errors='coerce').dropna().to_numpy(dtype='float64')
+            if not len(numbers): return
+            self.quantiles.update(numbers)
+            # Chan et al. pairwise update of mean and sum of squared deviations: exact, and stable on big streams.
+            count, mean = len(numbers), float(numbers.mean())
+            m2 = float(((numbers - mean) ** 2).sum())
+            total = self.numeric_count + count
+            delta = mean - self.mean
+            self.m2 += m2 + delta * delta * self.numeric_count * count / total
+            self.mean += delta * count / total
+            self.numeric_count = total
+            low, high = float(numbers.min()), float(numbers.max())
+            self.low = low if self.low is None else min(self.low, low)
+            self.high = high if self.high is None else max(self.high, high)
+
+class StreamProfiler:
+    # One-pass profile of a chunk stream (e.g. DataImporter.iter_chunks) in bounded memory, whatever the file size.
+    # Null counts, row counts, min/max, mean and std are exact; distinct counts (HyperLogLog), quantiles
+    # (compactor sketch), value frequencies (Misra-Gries) and the preview (reservoir sample) are approximate.
+    # The query methods mirror TableAnalyzer without the table argument, so the analysis views can use either.
+    def __init__(self, config=None, metrics=None, seed=None):
+        self.config = dict(STREAM_PROFILE_CONFIG, **(config or {}))
+        self.metrics = metrics if metrics else NULL_METRICS
+        self.rng = np.random.default_rng(seed)
+        self.sample_rows = ReservoirSample(self.config['sample_rows'], self.rng)
+        self.profiles = {}
+        self.rows = 0
+        self.chunks = 0
+
+    def update(self, chunk):
+        with self.metrics.span('stream_profile', rows=len(chunk)):
+            for column in chunk.columns:
+                if column not in self.profiles:
+                    self.profiles[column] = _ColumnProfile(chunk[column].dtype, self.config, self.rng)
+                    self.profiles[column].nulls = self.rows # rows of earlier chunks that lacked the column
+                self.profiles[column].update(chunk[column])
+            self.sample_rows.update(chunk)
+            self.rows += len(chunk)
+            self.chunks += 1
+
+    def consume(self, chunks, check_cancel=None):
+        # Feeds every chunk of the stream; `check_cancel` is called between chunks (raise from it to stop).
+        for chunk in chunks:
+            if check_cancel: check_cancel()
+            self.update(chunk)
+        return self
+
+    # --- Queries ---
+    @property
+    def sample(self):
+        return self.sample_rows.rows if self.sample_rows.rows is not None else pd.DataFrame()
+
+    @property
+    def columns(self):
+        return list(self.profiles)
+
+    def is_numeric(self, column):
+        return self.profiles[column].numeric
+
+    def distinct_count(self, column):
+        return int(round(self.profiles[column].distinct.estimate()))
+
+    def overview(self):
+        # Same shape as TableAnalyzer.overview, plus an approximate distinct count per column.
+        columns = self.columns
+        return {'rows': self.rows, 'info': pd.DataFrame({
+            "Column": columns,
+            "Non-Null Count": [self.profiles[column].count for column in columns],
+            "Null Count": [self.profiles[column].nulls for column in columns],
+            "Dtype": [str(self.profiles[column].dtype) for column in columns],
+            "Unique (approx)": [self.distinct_count(column) for column in columns],
+        })}
+
+    def histogram(self, column, bins=None):
+        bins = bins if bins else self.config['histogram_bins']
+        profile = self.profiles[column]
+        if not profile.numeric or not profile.numeric_count:
+            return np.array([]), np.array([], dtype='int64')
+        if profile.low == profile.high:
+            return np.array([profile.low, profile.high]), np.array([profile.numeric_count], dtype='int64')
+        edges = np.linspace(profile.low, profile.high, bins + 1)
+        return edges, profile.quantiles.histogram(edges)
+
+    def box_stats(self, column):
+        # Sketch quartiles in the form matplotlib's Axes.bxp takes; whiskers are the 1.5 IQR fences clipped to min/max.
+        profile = self.profiles[column]
+        if not profile.numeric or not profile.numeric_count:
+            return None
+        q1, median, q3 = profile.quantiles.quantiles((0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        return {
+            'label': column, 'med': median, 'q1': q1, 'q3': q3,
+            'whislo': max(profile.low, q1 - 1.5 * iqr), 'whishi': min(profile.high, q3 + 1.5 * iqr),
+            'fliers': [],
+        }
+
+    def column_summary(self, column):
+        # describe()-style statistics; quartiles and `unique` are sketch estimates.
+        profile = self.profiles[column]
+        if profile.numeric:
+            std = math.sqrt(profile.m2 / (profile.numeric_count - 1)) if profile.numeric_count > 1 else None
+            q1, median, q3 = profile.quantiles.quantiles((0.25, 0.5, 0.75))
+            return pd.Series({'count': profile.count, 'null': profile.nulls,
+                              'mean': profile.mean if profile.numeric_count else None, 'std': std,
+                              'min': profile.low, '25%': q1, '50%': median, '75%': q3, 'max': profile.high}, dtype=object)
+        top = profile.frequent.top(1)
+        return pd.Series({'count': profile.count, 'null': profile.nulls, 'unique': self.distinct_count(column),
+                          'top': top.index[0] if len(top) else None, 'freq': int(top.iloc[0]) if len(top) else None}, dtype=object)
+
+    def describe(self):
+        # Every column's summary side by side, like df.describe(include='all').
+        summary = pd.DataFrame({column: self.column_summary(column) for column in self.columns})
+        return summary.reindex([row for row in DESCRIBE_ROWS if row in summary.index])
+
+    def top_values(self, column, limit, dropna=True):
+        # Most frequent values with their (lower-bound) counts; NULL is its own entry unless `dropna`.
+        profile = self.profiles[column]
+        counts = profile.frequent.top(limit)
+        if not dropna and profile.nulls:
+            counts = pd.concat([counts, pd.Series([profile.nulls], index=[None])]).sort_values(ascending=False).head(limit)
+        return counts.rename('count').astype('int64')
+
+    def frequency_error(self, column):
+        # Upper bound on how far any top_values count can be below the true count (0 means exact).
+        return self.profiles[column].frequent.error
@@ -0,0 +1,183 @@
+import math
+import re
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from .config import LOAD_MANIFEST_CONFIG, TABLE_ANALYSIS_CONFIG, TAIL_APPEND_CONFIG
+from .profile_cache import ProfileCache
+
+# Declared SQL types analysed as numbers (MySQL, SQLite and DuckDB spellings; UNSIGNED/width suffixes allowed).
+NUMERIC_TYPE_PATTERN = re.compile(r'\s*(U?(TINY|SMALL|MEDIUM|BIG|HUGE)?INT(EGER)?|DOUBLE|FLOAT|REAL|DECIMAL|NUMERIC)\b', re.IGNORECASE)
+
+def is_numeric_sql_type(sql_type):
+    return bool(NUMERIC_TYPE_PATTERN.match(sql_type or ''))
+
+def _number(value):
+    return float(value) if value is not None else None
+
+class TableAnalyzer:
+    # Column profiling for tables already in the database. Counts, min/max/avg, GROUP BY value counts and
+    # histogram buckets run as SQL aggregates, so only small result sets leave the server and table size does
+    # not matter. Results are cached by (table version, query): a new load or edit changes the version stamp.
+    def __init__(self, db_manager, cache=None):
+        self.db_manager = db_manager
+        self.cache = cache if cache is not None else ProfileCache()
+
+    @property
+    def backend(self):
+        return self.db_manager.backend
+
+    @contextmanager
+    def _cursor(self):
+        conn = self.backend.acquire(create_db=False)
+        try:
+            with self.backend.cursor(conn) as cursor:
+                yield cursor
+        finally:
+            # Ends the read transaction so a pooled connection does not keep an old snapshot.
+            try:
+                self.backend.rollback(conn)
+            except self.backend.errors:
+                pass
+            self.backend.release(conn)
+
+    def _cached(self, table_name, name, compute, column=None):
+        # The version stamp is read on every call (cheap); the aggregate itself only runs on a cache miss.
+        with self._cursor() as cursor:
+            version = self.backend.table_version(cursor, table_name)
+            key = f"{self.backend.name}:{self.backend.describe()}:{table_name}:{version!r}"
+
+            def run():
+                with self.db_manager.metrics.span('table_analysis'):
+                    return compute(cursor)
+            return self.cache.get_or_compute(key, name, run, column)
+
+    def list_tables(self):
+        with self._cursor() as cursor:
+            return [name for name in self.backend.list_tables(cursor) if name not in (LOAD_MANIFEST_CONFIG['table'], TAIL_APPEND_CONFIG['table'])]
+
+    def columns(self, table_name):
+        # [(column, declared SQL type, numeric?)] without DatabaseManager's bookkeeping columns.
+        def compute(cursor):
+            columns = [(name, sql_type, is_numeric_sql_type(sql_type))
+                       for name, sql_type in self.backend.column_types(cursor, table_name)
+                       if name not in TABLE_ANALYSIS_CONFIG['skip_columns']]
+            if not columns: raise ValueError(f"테이블 '{table_name}'을(를) 찾을 수 없거나 분석할 컬럼이 없습니다.")
+            return columns
+        return self._cached(table_name, 'columns', compute)
+
+    def is_numeric(self, table_name, column):
+        return any(name == column and numeric for name, _, numeric in self.columns(table_name))
+
+    def overview(self, table_name):
+        # Row count and per-column non-null counts from a single aggregate query.
+        columns = self.columns(table_name)
+
+        def compute(cursor):
+            q = self.backend.quote
+            counts = ", ".join(f"COUNT({q(name)})" for name, _, _ in columns)
+            cursor.execute(f"SELECT COUNT(*), {counts} FROM {q(table_name)}")
+            row = cursor.fetchone()
+            total_rows = int(row[0])
+            non_null = [int(value) for value in row[1:]]
+            info = pd.DataFrame({
+                "Column": [name for name, _, _ in columns],
+                "Non-Null Count": non_null,
+                "Null Count": [total_rows - count for count in non_null],
+                "Dtype": [sql_type for _, sql_type, _ in columns],
+            })
+            return {'rows': total_rows, 'info': info}
+        return self._cached(table_name, 'overview', compute)
+
+    def _range(self, table_name, column):
+        def compute(cursor):
+            q = self.backend.quote
+            cursor.execute(f"SELECT COUNT({q(column)}), MIN({q(column)}), MAX({q(column)}) FROM {q(table_name)}")
+            count, low, high = cursor.fetchone()
+            return int(count), _number(low), _number(high)
+        return self._cached(table_name, 'range', compute, column)
+
+    def histogram(self, table_name, column, bins=None):
+        # (bin edges, counts) for a numeric column; bucket numbers are computed and grouped in SQL.
+        bins = bins if bins else TABLE_ANALYSIS_CONFIG['histogram_bins']
+        count, low, high = self._range(table_name, column)
+        if not count:
+            return np.array([]), np.array([], dtype='int64')
+        if low == high:
+            return np.array([low, high]), np.array([count], dtype='int64')
+
+        def compute(cursor):
+            q = self.backend.quote
+            # Literals rather than bind parameters: the same expression must appear in SELECT and GROUP BY.
+            bucket = self.backend.floor_sql(f"({q(column)} - ({float(low)!r})) * {float(bins / (high - low))!r}")
+            cursor.execute(f"SELECT {bucket} AS bucket, COUNT(*) FROM {q(table_name)} WHERE {q(column)} IS NOT NULL GROUP BY {bucket}")
+            counts = np.zeros(bins, dtype='int64')
+            for bucket_number, bucket_count in cursor.fetchall():
+                # The maximum lands exactly on the upper edge; it belongs to the last bucket.
+                counts[min(max(int(bucket_number), 0), bins - 1)] += int(bucket_count)
+            return np.linspace(low, high, bins + 1), counts
+        return self._cached(table_name, f"histogram:{bins}", compute, column)
+
+    def box_stats(self, table_name, column):
+        # Quartiles interpolated from a fine SQL histogram (error below one bucket width), in the form
+        # matplotlib's Axes.bxp takes. Whiskers are the 1.5 IQR fences clipped to the observed range.
+        edges, counts = self.histogram(table_name, column, TABLE_ANALYSIS_CONFIG['quantile_buckets'])
+        if not len(counts):
+            return None
+        cumulative = np.cumsum(counts)
+        total = cumulative[-1]
+
+        def quantile(fraction):
+            rank = fraction * total
+            index = min(int(np.searchsorted(cumulative, rank)), len(counts) - 1)
+            before = cumulative[index - 1] if index else 0
+            within = (rank - before) / counts[index] if counts[index] else 0.0
+            return float(edges[index] + within * (edges[index + 1] - edges[index]))
+
+        q1, median, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+        iqr = q3 - q1
+        return {
+            'label': column, 'med': median, 'q1': q1, 'q3': q3,
+            'whislo': max(float(edges[0]), q1 - 1.5 * iqr), 'whishi': min(float(edges[-1]), q3 + 1.5 * iqr),
+            'fliers': [],
+        }
+
+    def column_summary(self, table_name, column):
+        # describe()-style statistics. Quartiles of numeric columns are the box plot approximations.
+        numeric = self.is_numeric(table_name, column)
+
+        def compute(cursor):
+            q = self.backend.quote
+            col = q(column)
+            if numeric:
+                value = f"{col} * 1.0" # avoids integer overflow in SUM/AVG of large integers
+                stddev = self.backend.stddev_sql(value) or f"AVG({value} * {value})"
+                cursor.execute(f"SELECT COUNT(*), COUNT({col}), AVG({value}), {stddev}, MIN({col}), MAX({col}) FROM {q(table_name)}")
+                rows, count, mean, spread, low, high = cursor.fetchone()
+                mean, spread = _number(mean), _number(spread)
+                if spread is not None and not self.backend.stddev_sql(value):
+                    # Sample standard deviation from E[x^2] - E[x]^2 where the engine has no STDDEV aggregate.
+                    spread = math.sqrt(max(spread - mean * mean, 0.0) * count / (count - 1)) if count > 1 else None
+                return pd.Series({'count': count, 'null': rows - count, 'mean': mean, 'std': spread,
+                                  'min': _number(low), 'max': _number(high)}, dtype=object)
+            cursor.execute(f"SELECT COUNT(*), COUNT({col}), COUNT(DISTINCT {col}), MIN({col}), MAX({col}) FROM {q(table_name)}")
+            rows, count, distinct, low, high = cursor.fetchone()
+            return pd.Series({'count': count, 'null': rows - count, 'unique': distinct, 'min': low, 'max': high}, dtype=object)
+
+        summary = self._cached(table_name, 'summary', compute, column)
+        if numeric:
+            stats = self.box_stats(table_name, column)
+            if stats:
+                summary = pd.concat([summary, pd.Series({'25%': stats['q1'], '50%': stats['med'], '75%': stats['q3']}, dtype=object)])
+        return summary
+
+    def top_values(self, table_name, column, limit, dropna=True):
+        # Most frequent values by a GROUP BY inside the database; NULL is its own group unless `dropna`.
+        def compute(cursor):
+            q = self.backend.quote
+            where = f" WHERE {q(column)} IS NOT NULL" if dropna else ""
+            cursor.execute(f"SELECT {q(column)}, COUNT(*) AS value_count FROM {q(table_name)}{where} "
+                           f"GROUP BY {q(column)} ORDER BY value_count DESC LIMIT {int(limit)}")
+            rows = cursor.fetchall()
+            return pd.Series([int(row[1]) for row in rows], index=[row[0] for row in rows], name='count', dtype='int64')
+        return self._cached(table_name, f"top_values:{int(limit)}:{dropna}", compute, column)
@@ -0,0 +1,141 @@
+import datetime
+import hashlib
+import io
+import json
+import os
+from .config import TAIL_APPEND_CONFIG
+from .type_inference import TableSchema
+
+# Columns of the tail state table (TAIL_APPEND_CONFIG['table']), in the order of TailState.to_row.
+TAIL_STATE_COLUMNS = (
+    ('source_key', 'VARCHAR(64) NOT NULL'),
+    ('file_path', 'TEXT'),
+    ('target_table', 'VARCHAR(64)'),
+    ('options', 'TEXT'),
+    ('header_signature', 'VARCHAR(64)'),
+    ('prefix_bytes', 'BIGINT'),
+    ('prefix_checksum', 'VARCHAR(64)'),
+    ('tail_checksum', 'VARCHAR(64)'),
+    ('byte_offset', 'BIGINT'),
+    ('rows_ingested', 'BIGINT'),
+    ('table_schema', 'TEXT'),
+    ('updated_at', 'VARCHAR(32)'),
+)
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class ByteRangeReader(io.RawIOBase):
+    # Read-only view of bytes [start, end) of a file, so pandas parses exactly that region.
+    def __init__(self, path, start, end):
+        super().__init__()
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = max(end - start, 0)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        data = self._file.read(size)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+class CsvFileScan:
+    # What tail-append needs to know about a CSV file, read from its first and last blocks only:
+    # the header line, and `end`, the byte just past the last complete line (a line still being written is left
+    # for the next run).
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            head = f.read(TAIL_APPEND_CONFIG['prefix_bytes'])
+            header_end = head.find(b'\n')
+            if header_end < 0 and len(head) < self.size:
+                raise ValueError(f"헤더 줄이 너무 깁니다 ({TAIL_APPEND_CONFIG['prefix_bytes']:,}바이트 초과).")
+            self.header = head[:header_end + 1] if header_end >= 0 else head
+            self.end = self._last_line_end(f)
+
+    def _last_line_end(self, f):
+        position = self.size
+        block_size = 64 * 1024
+        while position > 0:
+            start = max(position - block_size, 0)
+            f.seek(start)
+            index = f.read(position - start).rfind(b'\n')
+            if index >= 0:
+                return start + index + 1
+            position = start
+        return 0
+
+    @property
+    def header_signature(self):
+        # Line endings and a UTF-8 BOM are ignored so that re-saving the same header does not count as a rewrite.
+        return _digest(self.header.rstrip(b'\r\n').lstrip(b'\xef\xbb\xbf'))
+
+    def checksum(self, start, end):
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            return _digest(f.read(max(end - start, 0)))
+
+class TailState:
+    # Per (source file, target table, read options): how many bytes of the file are already in the table and
+    # checksums of the start of the file and of the bytes just before the offset. If those still match, the file
+    # has only grown and the next run can parse from the offset on.
+    def __init__(self, file_path, target_table, options, header_signature=None, prefix_bytes=0, prefix_checksum=None,
+                 tail_checksum=None, byte_offset=0, rows_ingested=0, schema=None, updated_at=None):
+        self.file_path = os.path.abspath(file_path)
+        self.target_table = target_table
+        self.options = dict(options)
+        self.header_signature = header_signature
+        self.prefix_bytes = int(prefix_bytes or 0)
+        self.prefix_checksum = prefix_checksum
+        self.tail_checksum = tail_checksum
+        self.byte_offset = int(byte_offset or 0)
+        self.rows_ingested = int(rows_ingested or 0)
+        self.schema = schema
+        self.updated_at = updated_at
+        identity = json.dumps([self.file_path, target_table, self.options], sort_keys=True, default=str)
+        self.source_key = hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_row(cls, row):
+        values = dict(zip((name for name, _ in TAIL_STATE_COLUMNS), row))
+        schema = TableSchema.from_dicts(json.loads(values['table_schema'])) if values['table_schema'] else None
+        return cls(values['file_path'], values['target_table'], json.loads(values['options'] or '{}'),
+                   values['header_signature'], values['prefix_bytes'], values['prefix_checksum'], values['tail_checksum'],
+                   values['byte_offset'], values['rows_ingested'], schema, values['updated_at'])
+
+    def to_row(self):
+        return (self.source_key, self.file_path, self.target_table, json.dumps(self.options, sort_keys=True, default=str),
+                self.header_signature, self.prefix_bytes, self.prefix_checksum, self.tail_checksum, self.byte_offset,
+                self.rows_ingested, json.dumps(self.schema.to_dicts()) if self.schema is not None else None,
+                datetime.datetime.now().isoformat(sep=' ', timespec='seconds'))
+
+    def continues(self, scan):
+        # True when `scan` is the same file grown at the end: header, prefix and the bytes before the offset unchanged.
+        if not self.byte_offset or scan.end < self.byte_offset:
+            return False
+        tail_start = max(self.byte_offset - TAIL_APPEND_CONFIG['tail_bytes'], 0)
+        return (scan.header_signature == self.header_signature
+                and scan.checksum(0, self.prefix_bytes) == self.prefix_checksum
+                and scan.checksum(tail_start, self.byte_offset) == self.tail_checksum)
+
+    def advance(self, scan, rows, schema):
+        # Marks everything up to scan.end as ingested.
+        self.header_signature = scan.header_signature
+        self.prefix_bytes = min(TAIL_APPEND_CONFIG['prefix_bytes'], scan.end)
+        self.prefix_checksum = scan.checksum(0, self.prefix_bytes)
+        self.tail_checksum = scan.checksum(max(scan.end - TAIL_APPEND_CONFIG['tail_bytes'], 0), scan.end)
+        self.byte_offset = scan.end
+        self.rows_ingested += rows
+        if schema is not None:
+            self.schema = schema
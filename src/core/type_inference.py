@@ -0,0 +1,165 @@
+import pandas as pd
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError: # pandas < 2.1
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+from .config import INFERENCE_CONFIG
+
+TRUE_VALUES = {'true', 't', 'yes', 'y'}
+FALSE_VALUES = {'false', 'f', 'no', 'n'}
+# Numbers with ',' thousands separators (plain numbers are allowed alongside them).
+# dtypes for chunks in which a typed column has no values at all.
+NULL_DTYPES = {'int': 'Int64', 'float': 'float64', 'decimal': 'float64', 'bool': 'boolean', 'datetime': 'datetime64[ns]'}
+DECIMAL_PATTERN = r'[+-]?\d{1,3}(,\d{3})*(\.\d+)?|[+-]?\d+(\.\d+)?'
+
+class ColumnType:
+    # Inferred type of one column. `kind` is one of: int, float, decimal, bool, datetime, string.
+    def __init__(self, name, kind, nullable=True, datetime_format=None, thousands=False, scale=None):
+        self.name = name
+        self.kind = kind
+        self.nullable = nullable
+        self.datetime_format = datetime_format
+        self.thousands = thousands # values use ',' as thousands separator
+        self.scale = scale # digits after the decimal point for decimal columns
+
+    @classmethod
+    def from_dtype(cls, name, dtype):
+        # For frames that are already typed (edited in the UI, read from the parse cache, ...).
+        if pd.api.types.is_bool_dtype(dtype): kind = 'bool'
+        elif pd.api.types.is_integer_dtype(dtype): kind = 'int'
+        elif pd.api.types.is_float_dtype(dtype): kind = 'float'
+        elif pd.api.types.is_datetime64_any_dtype(dtype): kind = 'datetime'
+        else: kind = 'string'
+        return cls(name, kind)
+
+    def to_dict(self):
+        return {'name': self.name, 'kind': self.kind, 'nullable': self.nullable, 'datetime_format': self.datetime_format,
+                'thousands': self.thousands, 'scale': self.scale}
+
+    def __repr__(self):
+        return f"ColumnType({self.name!r}, {self.kind!r})"
+
+class TableSchema:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._by_name = {column.name: column for column in self.columns}
+
+    @classmethod
+    def from_dataframe(cls, df):
+        return cls(ColumnType.from_dtype(name, dtype) for name, dtype in df.dtypes.items())
+
+    @classmethod
+    def from_dicts(cls, columns):
+        # Inverse of to_dicts, e.g. for a schema stored in the load manifest.
+        return cls(ColumnType(**column) for column in columns)
+
+    def to_dicts(self):
+        return [column.to_dict() for column in self.columns]
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __repr__(self):
+        return f"TableSchema({self.columns!r})"
+
+class TypeInferencer:
+    # Rules types out on a small sample, then confirms the survivor over the full column in one vectorised pass.
+    def __init__(self, sample_size=None):
+        self.sample_size = sample_size if sample_size else INFERENCE_CONFIG['sample_size']
+
+    def _sample(self, series):
+        # Head plus an evenly strided slice, so sorted files and late outliers are both represented.
+        half = max(1, self.sample_size // 2)
+        step = max(1, len(series) // half)
+        return pd.concat([series.iloc[:half], series.iloc[::step]]).dropna()
+
+    def _candidates(self, sample):
+        values = sample.astype(str).str.strip()
+        candidates = []
+        lowered = values.str.lower()
+        if lowered.isin(TRUE_VALUES | FALSE_VALUES).all():
+            candidates.append('bool')
+        numeric = pd.to_numeric(values, errors='coerce')
+        if numeric.notna().all():
+            candidates.append('int' if pd.api.types.is_integer_dtype(numeric.dtype) else 'float')
+        elif values.str.contains(',', regex=False).any() and \
+                values.str.fullmatch(DECIMAL_PATTERN).all():
+            candidates.append('decimal')
+        if 'int' not in candidates and 'float' not in candidates and values.str.contains(r'[-/.:]', regex=True).all():
+            datetime_format = guess_datetime_format(values.iloc[0])
+            if datetime_format and pd.to_datetime(values, format=datetime_format, errors='coerce').notna().all():
+                candidates.append(('datetime', datetime_format))
+        return candidates
+
+    def _confirm(self, name, series, candidate):
+        # Returns (ColumnType, converted series) or None when the full column contradicts the sample.
+        values = series.dropna()
+        nullable = len(values) < len(series)
+        try:
+            if candidate == 'bool':
+                lowered = values.astype(str).str.strip().str.lower()
+                if not lowered.isin(TRUE_VALUES | FALSE_VALUES).all(): return None
+                converted = series.astype(str).str.strip().str.lower().isin(TRUE_VALUES).astype('boolean')
+                return ColumnType(name, 'bool', nullable), converted.where(series.notna(), pd.NA)
+            if candidate in ('int', 'float'):
+                numeric = pd.to_numeric(values)
+                if candidate == 'int' and pd.api.types.is_integer_dtype(numeric.dtype):
+                    converted = numeric.astype('Int64').reindex(series.index) if nullable else numeric
+                    return ColumnType(name, 'int', nullable), converted
+                return ColumnType(name, 'float', nullable), pd.to_numeric(series)
+            if candidate == 'decimal':
+                stripped = values.astype(str).str.strip()
+                if not stripped.str.fullmatch(DECIMAL_PATTERN).all(): return None
+                fraction = stripped.str.extract(r'\.(\d+)$', expand=False).str.len()
+                scale = int(fraction.max()) if fraction.notna().any() else 0
+                numeric = pd.to_numeric(stripped.str.replace(',', '', regex=False))
+                return ColumnType(name, 'decimal', nullable, thousands=True, scale=scale), numeric.astype('float64').reindex(series.index)
+            kind, datetime_format = candidate
+            converted = pd.to_datetime(series, format=datetime_format, errors='coerce')
+            if converted.notna().sum() != len(values): return None
+            return ColumnType(name, 'datetime', nullable, datetime_format=datetime_format), converted
+        except (ValueError, TypeError):
+            return None
+
+    def infer(self, df):
+        # Returns (TableSchema, typed DataFrame) for a frame read with dtype=str.
+        columns = []
+        typed = {}
+        for name in df.columns:
+            series = df[name]
+            column_type, converted = ColumnType(name, 'string'), series
+            sample = self._sample(series)
+            if not sample.empty:
+                for candidate in self._candidates(sample):
+                    confirmed = self._confirm(name, series, candidate)
+                    if confirmed:
+                        column_type, converted = confirmed
+                        break
+            columns.append(column_type)
+            typed[name] = converted
+        return TableSchema(columns), pd.DataFrame(typed, index=df.index)
+
+    def apply(self, df, schema, strict=False):
+        # Converts another frame (e.g. a later chunk) to an existing schema. Columns that do not fit stay
+        # strings unless `strict`, in which case the conversion error is raised. Returns (typed df, mismatched columns).
+        typed = {}
+        mismatched = []
+        for name in df.columns:
+            series = df[name]
+            column_type = schema.get(name)
+            converted = series
+            if column_type and column_type.kind != 'string' and not series.notna().any():
+                converted = pd.Series(None, index=series.index, dtype=NULL_DTYPES[column_type.kind])
+            elif column_type and column_type.kind != 'string':
+                candidate = ('datetime', column_type.datetime_format) if column_type.kind == 'datetime' else column_type.kind
+                confirmed = self._confirm(name, series, candidate)
+                if confirmed and confirmed[0].kind == column_type.kind:
+                    converted = confirmed[1]
+                else:
+                    if strict: raise ValueError(f"컬럼 '{name}'의 값이 추론된 타입({column_type.kind})과 맞지 않습니다.")
+                    mismatched.append(name)
+            typed[name] = converted
+        return pd.DataFrame(typed, index=df.index), mismatched
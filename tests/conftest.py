@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Tests import the `core` and `benchmarks` packages the same way the run_*.py entry points do.
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(repo_dir, 'src'), repo_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
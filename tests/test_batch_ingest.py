@@ -0,0 +1,40 @@
+import pandas as pd
+from core.batch_ingest import BatchIngestor
+
+
+def test_more_files_than_workers_does_not_deadlock(tmp_path):
+    # Regression: submitting every parse up front blocked once files > parse_workers + db_workers.
+    files = []
+    for i in range(6):
+        path = tmp_path / f"part{i}.csv"
+        pd.DataFrame({'a': range(i, i + 5), 'b': ['x'] * 5}).to_csv(path, index=False)
+        files.append(str(path))
+    ingestor = BatchIngestor(db_config={'backend': 'sqlite', 'path': str(tmp_path / 'batch.sqlite3')},
+                             status_callback=lambda message: None, parse_workers=1, db_workers=1)
+    results = ingestor.run(files)
+    assert [result['success'] for result in results] == [True] * 6
+    assert [result['rows'] for result in results] == [5] * 6
+
+
+def test_tail_mode_reports_appended_rows(tmp_path):
+    path = tmp_path / 'log.csv'
+    pd.DataFrame({'a': range(4), 'b': ['x'] * 4}).to_csv(path, index=False)
+    ingestor = BatchIngestor(db_config={'backend': 'sqlite', 'path': str(tmp_path / 'tail.sqlite3')},
+                             status_callback=lambda message: None, parse_workers=1, db_workers=1)
+    first = ingestor.run([str(path)], default_mode='tail')
+    with open(path, 'a') as f:
+        f.write("4,y\n5,y\n")
+    second = ingestor.run([str(path)], default_mode='tail')
+    assert first[0]['success'] and first[0]['rows'] == 4
+    assert second[0]['success'] and second[0]['rows'] == 2
+
+
+def test_sheets_mode_reports_rows_across_sheets(tmp_path):
+    path = tmp_path / 'book.xlsx'
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'a': range(3)}).to_excel(writer, sheet_name='one', index=False)
+        pd.DataFrame({'a': range(4)}).to_excel(writer, sheet_name='two', index=False)
+    ingestor = BatchIngestor(db_config={'backend': 'sqlite', 'path': str(tmp_path / 'sheets.sqlite3')},
+                             status_callback=lambda message: None, parse_workers=1, db_workers=1)
+    results = ingestor.run([str(path)], default_mode='sheets')
+    assert results[0]['success'] and results[0]['rows'] == 7
@@ -0,0 +1,10 @@
+from benchmarks.runner import BenchmarkRunner
+from core.config import CACHE_CONFIG
+
+
+def test_runner_leaves_the_parse_cache_setting_alone(tmp_path):
+    # Regression: constructing the runner turned the parse cache off for the rest of the process.
+    enabled = CACHE_CONFIG['enabled']
+    runner = BenchmarkRunner(str(tmp_path), repeat=1, measure_memory=False, backend='sqlite', status_callback=lambda message: None)
+    runner.run(['narrow_numeric'], [200], ['load'])
+    assert CACHE_CONFIG['enabled'] == enabled
@@ -0,0 +1,30 @@
+import pandas as pd
+from core.database_manager import DatabaseManager
+
+
+def _manager(tmp_path):
+    manager = DatabaseManager({'backend': 'sqlite', 'path': str(tmp_path / 'browse.sqlite3')}, status_callback=lambda message: None)
+    assert manager.overwrite_table(pd.DataFrame({'n': range(25), 'label': [f"row{i}" for i in range(25)]}), 'items')[0]
+    return manager
+
+
+def test_keyset_pages_cover_the_table_in_order(tmp_path):
+    manager = _manager(tmp_path)
+    pages = [manager.fetch_page('items', page_size=10)]
+    while pages[-1].has_next:
+        pages.append(manager.fetch_page('items', key=pages[-1].last_key, page_size=10))
+    assert [len(page.rows) for page in pages] == [10, 10, 5]
+    assert pd.concat([page.rows for page in pages])['n'].tolist() == list(range(25))
+    assert not pages[0].has_previous and pages[1].has_previous
+
+    previous = manager.fetch_page('items', key=pages[2].first_key, backward=True, page_size=10)
+    assert previous.rows['n'].tolist() == pages[1].rows['n'].tolist()
+    assert previous.has_previous and previous.has_next
+
+
+def test_keyset_pages_descending_with_filter(tmp_path):
+    manager = _manager(tmp_path)
+    first = manager.fetch_page('items', page_size=4, filters=[('id', '<=', 10)], sort_column='id', descending=True)
+    second = manager.fetch_page('items', key=first.last_key, page_size=4, filters=[('id', '<=', 10)], sort_column='id', descending=True)
+    assert first.rows['id'].tolist() == [10, 9, 8, 7]
+    assert second.rows['id'].tolist() == [6, 5, 4, 3]
@@ -0,0 +1,20 @@
+import openpyxl
+import pandas as pd
+from core.excel_reader import ExcelWorkbook
+
+
+def test_interior_blank_rows_match_read_excel(tmp_path):
+    path = tmp_path / 'blank_rows.xlsx'
+    book = openpyxl.Workbook()
+    sheet = book.active
+    for row in [('a', 'b'), (1, 'x'), (), (3, 'z'), (None, 'NA'), (), ()]:
+        sheet.append(row)
+    book.save(path)
+
+    expected = pd.read_excel(path, dtype=str)
+    with open(path, 'rb') as file_object, ExcelWorkbook(file_object, '.xlsx') as workbook:
+        frames = list(workbook.iter_frames(chunksize=2))
+    actual = pd.concat(frames)
+    assert len(actual) == len(expected) == 4
+    assert list(actual.index) == list(expected.index)
+    pd.testing.assert_frame_equal(actual.fillna('<missing>'), expected.astype(object).fillna('<missing>'), check_dtype=False)
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+from core.frame_compaction import compact_frame, make_room
+
+
+def _frame():
+    return pd.DataFrame({
+        'small_int': np.arange(1000, dtype='int64'),
+        'nullable_int': pd.array([1, None, 300] * 333 + [None], dtype='Int64'),
+        'exact_float': np.tile([0.5, 1.25, np.nan, 3.0], 250),
+        'precise_float': np.linspace(0, 1, 1000),
+        'category_text': ['red', 'green', 'blue', None] * 250,
+        'free_text': [f"value {i}" for i in range(1000)],
+        'flag': [True, False] * 500,
+        'when': pd.date_range('2024-01-01', periods=1000, freq='h'),
+    })
+
+
+def test_compact_frame_preserves_values_and_saves_memory():
+    df = _frame()
+    compacted, report = compact_frame(df)
+    assert compacted['small_int'].dtype == np.int16
+    assert compacted['nullable_int'].dtype == 'Int16'
+    assert compacted['exact_float'].dtype == np.float32
+    assert compacted['precise_float'].dtype == np.float64 # float32 would change its values
+    assert isinstance(compacted['category_text'].dtype, pd.CategoricalDtype)
+    assert compacted['flag'].dtype == bool and compacted['when'].dtype == df['when'].dtype
+    for column in df.columns:
+        pd.testing.assert_series_equal(compacted[column].astype(object), df[column].astype(object), check_names=False)
+    assert report.after_bytes < report.before_bytes
+
+
+def test_make_room_widens_for_new_values():
+    compacted, _ = compact_frame(_frame())
+    categories = make_room(compacted['category_text'], ['purple'])
+    assert 'purple' in categories.cat.categories
+    assert categories.astype(object).tolist() == compacted['category_text'].astype(object).tolist()
+
+    ints = make_room(compacted['small_int'], [100000])
+    assert ints.dtype == np.int64 and ints.tolist() == list(range(1000))
+    floats = make_room(compacted['exact_float'], [0.1])
+    assert floats.dtype == np.float64
+    assert make_room(compacted['small_int'], [None]).dtype == np.int16 # nothing to hold
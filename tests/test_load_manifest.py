@@ -0,0 +1,22 @@
+import pandas as pd
+from core import config
+from core.data_importer import DataImporter
+from core.database_manager import DatabaseManager
+
+
+def test_first_resumable_load_creates_table_from_inferred_schema(tmp_path, monkeypatch):
+    # Regression: the first run passed checkpoint.schema while it was still None, so DECIMAL columns became DOUBLE.
+    monkeypatch.setitem(config.CACHE_CONFIG, 'enabled', False)
+    path = tmp_path / 'money.csv'
+    pd.DataFrame({'amount': ['1,234.50', '2,000.25', '3.10'], 'name': ['a', 'b', 'c']}).to_csv(path, index=False)
+    manager = DatabaseManager({'backend': 'duckdb', 'path': str(tmp_path / 'load.duckdb')}, status_callback=lambda message: None)
+    success, _ = manager.load_file_resumable(DataImporter(status_callback=lambda message: None), str(path), 'money')
+    assert success
+
+    conn = manager._connect_to_db()
+    try:
+        with manager.backend.cursor(conn) as cursor:
+            types = dict(manager.backend.column_types(cursor, 'money'))
+    finally:
+        manager._release_connection(conn)
+    assert types['amount'].startswith('DECIMAL')
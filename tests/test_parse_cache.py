@@ -0,0 +1,20 @@
+import pandas as pd
+from core.data_importer import DataImporter
+from core.parse_cache import ParsedFileCache
+
+
+def test_cached_reload_keeps_inferred_schema(tmp_path):
+    # Regression: a cache hit re-derived the schema from dtypes, so DECIMAL became float and DATE lost its format.
+    path = tmp_path / 'orders.csv'
+    pd.DataFrame({'amount': ['1,234.50', '2.25'], 'day': ['2024-01-01', '2024-01-02'], 'qty': ['1', '2']}).to_csv(path, index=False)
+    cache = ParsedFileCache(directory=str(tmp_path / 'cache'))
+    fresh = DataImporter(status_callback=lambda message: None, cache=cache)
+    first = fresh.load_data(str(path))
+    cached = DataImporter(status_callback=lambda message: None, cache=cache)
+    second = cached.load_data(str(path))
+
+    assert cache.get(cache.make_key(str(path), extension='.csv', csv_delimiter=',', csv_encoding='utf-8', excel_sheet_name=None)) is not None
+    pd.testing.assert_frame_equal(first, second)
+    assert cached.last_schema.to_dicts() == fresh.last_schema.to_dicts()
+    assert cached.last_schema.get('amount').kind == 'decimal'
+    assert cached.last_schema.get('day').datetime_format == '%Y-%m-%d'
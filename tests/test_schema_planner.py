@@ -0,0 +1,32 @@
+import pandas as pd
+from core.schema_planner import SchemaPlanner
+from core.type_inference import ColumnType
+
+
+def _plan(series, column_type):
+    return SchemaPlanner().plan_column(series, column_type, series.name).sql_type
+
+
+def test_planned_types_are_appendable():
+    # No UNSIGNED (negative appends) and no ENUM (new members) for tables that can be appended to.
+    assert _plan(pd.Series([1, 2, 200], name='n'), ColumnType('n', 'int')) == 'SMALLINT'
+    codes = pd.Series(['A', 'B'] * 1000, name='c')
+    assert not _plan(codes, ColumnType('c', 'string')).startswith('ENUM')
+
+
+def test_midnight_values_stay_datetime_unless_format_is_date_only():
+    values = pd.Series(pd.to_datetime(['2024-01-01', '2024-01-02']), name='d')
+    assert _plan(values, ColumnType('d', 'datetime', datetime_format='%Y-%m-%d %H:%M:%S')) == 'DATETIME'
+    assert _plan(values, ColumnType('d', 'datetime')) == 'DATETIME'
+    assert _plan(values, ColumnType('d', 'datetime', datetime_format='%Y-%m-%d')) == 'DATE'
+
+
+def test_widen_for_appended_values():
+    planner = SchemaPlanner()
+    assert planner.widen('smallint', pd.Series([5, 40000])) == 'MEDIUMINT'
+    assert planner.widen('smallint', pd.Series([5, -3])) is None
+    assert planner.widen('decimal(5,2)', pd.Series([12345.5])) == 'DECIMAL(7, 2)'
+    assert planner.widen('date', pd.Series(pd.to_datetime(['2024-01-01 10:30']))) == 'DATETIME'
+    assert planner.widen('varchar(4)', pd.Series(['abc'])) is None
+    assert planner.widen('varchar(4)', pd.Series(['abcdef'])) == 'VARCHAR(9)'
+    assert planner.widen('text', pd.Series(['x' * 70000])) == 'MEDIUMTEXT'
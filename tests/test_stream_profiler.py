@@ -0,0 +1,13 @@
+import numpy as np
+import pandas as pd
+from core.stream_profiler import StreamProfiler
+
+
+def test_distinct_count_ignores_chunk_dtype():
+    # Regression: a chunk with a NaN reads an int column as float64, and 1.0 hashed differently from 1.
+    profiler = StreamProfiler(seed=0)
+    profiler.update(pd.DataFrame({'n': pd.Series([1, 2, 3], dtype='int64')}))
+    profiler.update(pd.DataFrame({'n': pd.Series([1.0, np.nan, 2.0], dtype='float64')}))
+    profile = profiler.profiles['n']
+    assert round(profile.distinct.estimate()) == 3
+    assert profile.frequent.top(1).iloc[0] == 2
@@ -0,0 +1,38 @@
+import sqlite3
+import pandas as pd
+from core.database_manager import DatabaseManager
+from core.edit_tracker import EditLog
+
+
+def _manager(tmp_path):
+    return DatabaseManager({'backend': 'sqlite', 'path': str(tmp_path / 'edits.sqlite3')}, status_callback=lambda message: None)
+
+
+def _rows(tmp_path, table_name):
+    with sqlite3.connect(tmp_path / 'edits.sqlite3') as conn:
+        return sorted(conn.execute(f'SELECT "name", "val" FROM "{table_name}"').fetchall())
+
+
+def test_sync_updates_inserts_and_deletes_by_fingerprint(tmp_path):
+    df = pd.DataFrame({'name': ['a', 'b', 'c'], 'val': [1, 2, 3]})
+    manager = _manager(tmp_path)
+    assert manager.overwrite_table(df, 'items')[0]
+    log = EditLog()
+    df = log.apply_editor_delta(df, {'edited_rows': {0: {'val': 10}}, 'deleted_rows': [1],
+                                     'added_rows': [{'name': 'd', 'val': 4}]})
+    success, message = manager.sync_changes('items', *log.sync_payload(df))
+    assert success, message
+    assert _rows(tmp_path, 'items') == [('a', 10), ('c', 3), ('d', 4)]
+
+
+def test_sync_with_column_the_table_does_not_store(tmp_path):
+    # Regression: '#' sanitizes to an empty name and is not stored, but was part of the edit log's fingerprints.
+    df = pd.DataFrame({'#': [1, 2, 3], 'name': ['a', 'b', 'c'], 'val': [1, 2, 3]})
+    manager = _manager(tmp_path)
+    assert manager.overwrite_table(df, 'items')[0]
+    log = EditLog()
+    df = log.apply_editor_delta(df, {'edited_rows': {0: {'val': 10}}, 'deleted_rows': [1]})
+    success, message = manager.sync_changes('items', *log.sync_payload(df))
+    assert success, message
+    assert '수정 1건' in message and '삭제 1건' in message
+    assert _rows(tmp_path, 'items') == [('a', 10), ('c', 3)]
@@ -0,0 +1,49 @@
+import sqlite3
+from core import config
+from core.data_importer import DataImporter
+from core.database_manager import DatabaseManager
+from core.tail_append import CsvFileScan, TailState
+
+
+def _state_after(path):
+    state = TailState(str(path), 'log', {})
+    state.advance(CsvFileScan(str(path)), 0, None)
+    return state
+
+
+def test_continues_only_when_the_file_grew_at_the_end(tmp_path):
+    path = tmp_path / 'log.csv'
+    path.write_text("a,b\n1,x\n2,y\n")
+    state = _state_after(path)
+
+    path.write_text("a,b\n1,x\n2,y\n3,z\n")
+    assert state.continues(CsvFileScan(str(path)))
+    path.write_text("a,b\n1,x\n9,y\n3,z\n") # same length, earlier bytes changed
+    assert not state.continues(CsvFileScan(str(path)))
+    path.write_text("a,c\n1,x\n2,y\n3,z\n") # header changed
+    assert not state.continues(CsvFileScan(str(path)))
+    path.write_text("a,b\n1,x\n") # truncated
+    assert not state.continues(CsvFileScan(str(path)))
+
+
+def test_append_file_tail_reads_new_rows_and_rereads_rewritten_files(tmp_path, monkeypatch):
+    monkeypatch.setitem(config.CACHE_CONFIG, 'enabled', False)
+    path = tmp_path / 'log.csv'
+    manager = DatabaseManager({'backend': 'sqlite', 'path': str(tmp_path / 'tail.sqlite3')}, status_callback=lambda message: None)
+    importer = DataImporter(status_callback=lambda message: None)
+
+    def table_rows():
+        with sqlite3.connect(tmp_path / 'tail.sqlite3') as conn:
+            return sorted(conn.execute('SELECT "a", "b" FROM "log"').fetchall())
+
+    path.write_text("a,b\n1,x\n2,y\n")
+    assert manager.append_file_tail(importer, str(path), 'log')[0]
+    path.write_text("a,b\n1,x\n2,y\n3,z\n4,w") # the unterminated last line is left for the next run
+    assert manager.append_file_tail(importer, str(path), 'log')[0]
+    assert manager.last_load_rows == 1
+    assert table_rows() == [(1, 'x'), (2, 'y'), (3, 'z')]
+
+    path.write_text("a,b\n1,x\n5,v\n3,z\n4,w\n") # rewritten: read in full, known rows deduplicated
+    assert manager.append_file_tail(importer, str(path), 'log')[0]
+    assert manager.last_load_rows == 4
+    assert table_rows() == [(1, 'x'), (2, 'y'), (3, 'z'), (4, 'w'), (5, 'v')]